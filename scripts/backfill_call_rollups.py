@@ -0,0 +1,84 @@
+"""Fill call_daily_rollups from existing call records.
+
+The API maintains the rollups as calls end, but calls that ended before that code was
+deployed — or whose rollup update failed — are missing from them until this runs.
+
+Usage:
+    uv run python scripts/backfill_call_rollups.py              # add calls not yet rolled up
+    uv run python scripts/backfill_call_rollups.py --rebuild    # drop the rollups and recount everything
+
+The default pass is safe while the API is live: it applies the same idempotent per-call
+update the API does, so a call being finalized concurrently is counted once either way.
+Re-run it any time; calls already counted are skipped by the query.
+
+--rebuild first deletes every rollup row and every call's rollup marker, then recounts.
+Dashboards under-report until it finishes, and calls ending mid-rebuild can be counted
+twice, so run it in a quiet window.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient  # noqa: E402
+
+from src.core.billing import TERMINAL_CALL_STATUSES  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.db.db_schemas import CallDailyRollup, CallRecord  # noqa: E402
+from src.services.analytics.rollup import ROLLUP_FIELD, apply_rollup  # noqa: E402
+
+CONCURRENCY = 20
+
+
+async def backfill(records, rollups, rebuild: bool = False) -> None:
+    # Normally created by the API's init_beanie(); the upserts rely on the unique key.
+    await rollups.create_indexes(CallDailyRollup.Settings.indexes)
+
+    if rebuild:
+        deleted = await rollups.delete_many({})
+        await records.update_many({ROLLUP_FIELD: {"$exists": True}}, {"$unset": {ROLLUP_FIELD: ""}})
+        print(f"Cleared {deleted.deleted_count} rollup row(s) and every call's rollup marker.")
+
+    pending = records.find(
+        {"call_status": {"$in": list(TERMINAL_CALL_STATUSES)}, ROLLUP_FIELD: {"$exists": False}},
+        {"room_name": 1},
+    )
+    seen = applied = 0
+    batch = []
+
+    async def flush():
+        nonlocal applied
+        results = await asyncio.gather(*(apply_rollup(records, rollups, room) for room in batch))
+        applied += sum(results)
+        batch.clear()
+
+    async for doc in pending:
+        batch.append(doc["room_name"])
+        seen += 1
+        if len(batch) == CONCURRENCY:
+            await flush()
+        if seen % 10000 == 0:
+            print(f"  {seen} call(s) so far...")
+    if batch:
+        await flush()
+
+    print(f"Rolled up {applied} of {seen} call(s) not yet counted.")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rebuild", action="store_true", help="drop all rollups and recount from scratch")
+    args = parser.parse_args()
+
+    print(f"Connecting to MongoDB at {settings.MONGODB_URL}...")
+    client = AsyncMongoClient(settings.MONGODB_URL, tz_aware=True)
+    db = client[settings.DATABASE_NAME]
+    await backfill(db[CallRecord.Settings.name], db[CallDailyRollup.Settings.name], rebuild=args.rebuild)
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,209 @@
+"""Benchmark for /analytics/dashboard: the old two-pass call_records scan vs the single pass.
+
+Seeds a scratch database with --records synthetic call records spread over the last
+--days days across --users users, builds call_daily_rollups from them, then times, for
+one user's default 30-day dashboard:
+
+  • old — what the endpoint ran before rollups: a summary $group over the range, then a
+      period $facet over every call the user ever made, both on call_records
+  • new — _dashboard_pipeline: one aggregation on the rollups, with only the partial
+      days at the range edges (and today) read from call_records
+
+Both run uncached, with the same indexes the API creates, and their numbers are checked
+against each other before timing.
+
+The scratch database is <DATABASE_NAME>_bench unless --db says otherwise; it is dropped
+and reseeded when it holds a different number of records (or with --reseed). Seeding 5M
+records takes a few minutes and about 2 GB of disk.
+
+Usage:
+    uv run python -m scripts.bench_analytics_dashboard [--records 5000000] [--users 10] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from pymongo import AsyncMongoClient
+
+from src.api.routes.analytics import _dashboard_pipeline
+from src.core.config import settings
+from src.core.db.db_schemas import CallDailyRollup, CallRecord
+from src.services.analytics.rollup import KEY_FIELDS
+
+SEED_BATCH = 10_000
+STATUSES = ["completed"] * 80 + ["no_answer"] * 8 + ["failed"] * 6 + ["busy"] * 6
+
+
+def _user(i: int) -> str:
+    return f"bench-user-{i}@example.com"
+
+
+def _records(start: int, count: int, users: int, days: int, now: datetime, rng: random.Random) -> list:
+    span = days * 86400
+    docs = []
+    for i in range(start, start + count):
+        status = rng.choice(STATUSES)
+        web = rng.random() < 0.2
+        docs.append({
+            "room_name": f"bench-{i}",
+            "created_by_email": _user(i % users),
+            "assistant_id": f"assistant-{rng.randrange(5)}",
+            "assistant_name": "Bench Assistant",
+            "call_type": "web" if web else "outbound",
+            "call_service": "web" if web else "twilio",
+            "platform_number": None if web else f"+1555000{rng.randrange(10):04d}",
+            "call_status": status,
+            "started_at": now - timedelta(seconds=rng.uniform(0, span)),
+            "call_duration_minutes": round(rng.uniform(0.2, 12), 2) if status == "completed" else 0.0,
+        })
+    return docs
+
+
+async def seed(db, records: int, users: int, days: int, now: datetime) -> None:
+    calls = db[CallRecord.Settings.name]
+    await db.drop_collection(calls.name)
+    await db.drop_collection(CallDailyRollup.Settings.name)
+    await calls.create_indexes(CallRecord.Settings.indexes)
+
+    rng = random.Random(0)
+    started = time.perf_counter()
+    for offset in range(0, records, SEED_BATCH):
+        await calls.insert_many(_records(offset, min(SEED_BATCH, records - offset), users, days, now, rng), ordered=False)
+        if (offset // SEED_BATCH) % 50 == 49:
+            print(f"  {offset + SEED_BATCH} record(s) seeded...")
+    print(f"Seeded {records} record(s) in {time.perf_counter() - started:.0f}s.")
+
+    # The same rows apply_call_rollup() maintains, built in one pass.
+    rollups = db[CallDailyRollup.Settings.name]
+    await rollups.create_indexes(CallDailyRollup.Settings.indexes)
+    key = {field: f"${source}" for field, source in KEY_FIELDS.items()}
+    key["day"] = {
+        "$dateFromParts": {
+            "year": {"$year": "$started_at"},
+            "month": {"$month": "$started_at"},
+            "day": {"$dayOfMonth": "$started_at"},
+        }
+    }
+    cursor = await calls.aggregate([
+        {"$group": {
+            "_id": key,
+            "assistant_name": {"$last": "$assistant_name"},
+            "total_calls": {"$sum": 1},
+            "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+        }},
+        {"$replaceWith": {"$mergeObjects": [
+            "$_id",
+            {
+                "assistant_name": "$assistant_name",
+                "total_calls": "$total_calls",
+                "total_duration_minutes": "$total_duration_minutes",
+            },
+        ]}},
+        {"$merge": {"into": rollups.name, "whenMatched": "replace", "whenNotMatched": "insert"}},
+    ], allowDiskUse=True)
+    await cursor.to_list()
+    print(f"Built {await rollups.count_documents({})} rollup row(s).")
+
+
+def _old_pipelines(user_email: str, start: datetime, end: datetime, now: datetime) -> tuple[list, list]:
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = today_start - timedelta(days=today_start.weekday())
+    month_start = today_start.replace(day=1)
+    summary = [
+        {"$match": {"created_by_email": user_email, "started_at": {"$gte": start, "$lte": end}}},
+        {"$group": {
+            "_id": None,
+            "total_calls": {"$sum": 1},
+            "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+        }},
+    ]
+    periods = [
+        {"$match": {"created_by_email": user_email}},
+        {"$facet": {
+            "today": [{"$match": {"started_at": {"$gte": today_start}}}, {"$count": "count"}],
+            "this_week": [{"$match": {"started_at": {"$gte": week_start}}}, {"$count": "count"}],
+            "this_month": [{"$match": {"started_at": {"$gte": month_start}}}, {"$count": "count"}],
+        }},
+    ]
+    return summary, periods
+
+
+async def _run(collection, pipeline: list) -> list:
+    return await (await collection.aggregate(pipeline)).to_list()
+
+
+def _count(rows: list, field: str = "count"):
+    return rows[0].get(field, 0) if rows else 0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", default=f"{settings.DATABASE_NAME}_bench")
+    parser.add_argument("--reseed", action="store_true", help="drop and reseed even if the record count matches")
+    args = parser.parse_args()
+    if args.db == settings.DATABASE_NAME:
+        parser.error("refusing to seed the application database; pick a scratch --db")
+
+    client = AsyncMongoClient(settings.MONGODB_URL, tz_aware=True)
+    db = client[args.db]
+    calls, rollups = db[CallRecord.Settings.name], db[CallDailyRollup.Settings.name]
+    # Seeded times end "now"; the dashboard is evaluated against that instant from then on.
+    now = datetime.now(timezone.utc)
+    if args.reseed or await calls.estimated_document_count() != args.records:
+        print(f"Seeding {args.records} call record(s) into {args.db}...")
+        await seed(db, args.records, args.users, args.days, now)
+    else:
+        latest = await calls.find_one({}, {"started_at": 1}, sort=[("started_at", -1)])
+        now = max(now, latest["started_at"]) if latest else now
+
+    user_email = _user(0)
+    start, end = now - timedelta(days=30), now
+    summary, periods = _old_pipelines(user_email, start, end, now)
+    new = _dashboard_pipeline(user_email, start, end, now)
+
+    async def old_pass():
+        return await _run(calls, summary), await _run(calls, periods)
+
+    async def new_pass():
+        return await _run(rollups, new)
+
+    (old_summary, old_periods), new_rows = await old_pass(), await new_pass()
+    facets = new_rows[0] if new_rows else {}
+    old_numbers = (
+        _count(old_summary, "total_calls"),
+        round(_count(old_summary, "total_duration_minutes"), 2),
+        *(_count(old_periods[0][p]) for p in ("today", "this_week", "this_month")),
+    )
+    new_numbers = (
+        _count(facets["summary"], "total_calls"),
+        round(_count(facets["summary"], "total_duration_minutes"), 2),
+        *(_count(facets[p]) for p in ("today", "this_week", "this_month")),
+    )
+    print(f"\n{user_email}: calls, minutes, today, this week, this month")
+    print(f"  old {old_numbers}\n  new {new_numbers}  {'match' if old_numbers == new_numbers else 'MISMATCH'}")
+
+    print(f"\n{'path':<6}{'median ms':>12}{'min ms':>10}")
+    medians = {}
+    for name, fn in (("old", old_pass), ("new", new_pass)):
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            await fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        medians[name] = statistics.median(samples)
+        print(f"{name:<6}{medians[name]:>12.1f}{min(samples):>10.1f}")
+    print(f"\nspeedup: {medians['old'] / medians['new']:.1f}x")
+
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
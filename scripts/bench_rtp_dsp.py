@@ -0,0 +1,120 @@
+"""Microbenchmark for the Exotel bridge DSP: packets per second per core, old path vs new.
+
+Offline and single-threaded. Feeds a second of synthetic speech-band audio through:
+
+  • inbound  — one 20 ms G.711 packet → 48 kHz PCM
+      old: _decode_rtp_payload (audioop + astype + sosfilt + concatenate + resample_poly + tanh)
+      new: _InboundDSP.process (lookup table + high-pass and polyphase matmuls, reused buffers)
+  • outbound — one 10 ms 48 kHz frame → 8 kHz PCM → G.711
+      old: the resample_poly path _send_frame used to run, then audioop.lin2alaw
+      new: _OutboundDSP.process + _OutboundDSP.encode
+  • batched — the same two paths through DSPBatch with --bridges rows per flush, as a
+      bridge host running that many calls on one loop would see them (outbound excludes
+      the G.711 encode, which stays per bridge)
+
+One bridge handles 50 inbound packets and 100 outbound frames a second, so divide the
+rates by that to get concurrent legs per core for the DSP alone.
+
+Usage:
+    uv run python -m scripts.bench_rtp_dsp [--seconds 2.0] [--bridges 100]
+"""
+
+import argparse
+import asyncio
+import audioop
+import time
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from src.services.exotel.custom_sip_reach.config import PCMA_PAYLOAD_TYPE
+from src.services.exotel.custom_sip_reach.dsp_batch import DSPBatch
+from src.services.exotel.custom_sip_reach.rtp_bridge import (
+    _RESAMPLE_FILTER,
+    _InboundDSP,
+    _OutboundDSP,
+    _decode_rtp_payload,
+)
+
+
+def _speech_like(n: int, rate: int) -> np.ndarray:
+    t = np.arange(n) / rate
+    rng = np.random.default_rng(0)
+    x = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.1 * np.sin(2 * np.pi * 1800 * t)
+    return (x + 0.02 * rng.standard_normal(n)).clip(-1, 1)
+
+
+def _rate(fn, items: list, seconds: float) -> float:
+    """Calls per second of fn over `items`, cycled, for about `seconds`."""
+    done = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for item in items:
+            fn(item)
+        done += len(items)
+    return done / (time.perf_counter() - start)
+
+
+def _old_outbound(state: dict):
+    def run(raw: bytes) -> bytes:
+        samples_48k = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        samples_48k = np.tanh(samples_48k * 0.7)
+        full_input = np.concatenate([state["history"], samples_48k])
+        state["history"] = full_input[-120:]
+        resampled = resample_poly(full_input, 1, 6, window=_RESAMPLE_FILTER)[10:10 + len(samples_48k) // 6]
+        return audioop.lin2alaw((resampled * 32767.0).astype(np.int16).tobytes(), 2)
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per measurement")
+    parser.add_argument("--bridges", type=int, default=100, help="rows per batched flush")
+    args = parser.parse_args()
+
+    pcm8 = (_speech_like(8000, 8000) * 32767).astype(np.int16).tobytes()
+    packets = [audioop.lin2alaw(pcm8[i:i + 320], 2) for i in range(0, len(pcm8), 320)]
+    pcm48 = (_speech_like(48000, 48000) * 32767).astype(np.int16).tobytes()
+    frames = [pcm48[i:i + 960] for i in range(0, len(pcm48), 960)]
+
+    state = {"rx": (None, None)}
+
+    def old_inbound(payload: bytes) -> bytes:
+        out, state["rx"] = _decode_rtp_payload(payload, PCMA_PAYLOAD_TYPE, state["rx"])
+        return out
+
+    rx = _InboundDSP()
+    tx = _OutboundDSP()
+    results = [
+        ("inbound  packets/s", _rate(old_inbound, packets, args.seconds),
+         _rate(lambda p: rx.process(p, PCMA_PAYLOAD_TYPE), packets, args.seconds), 50),
+        ("outbound frames/s ", _rate(_old_outbound({"history": np.zeros(120, np.float32)}), frames, args.seconds),
+         _rate(lambda f: _OutboundDSP.encode(tx.process(f), PCMA_PAYLOAD_TYPE), frames, args.seconds), 100),
+    ]
+
+    # Batched: one flush = one packet (or frame) for each of --bridges calls.
+    batch = DSPBatch(asyncio.new_event_loop(), capacity=args.bridges)
+    rows = [batch.register() for _ in range(args.bridges)]
+    rx_groups = [
+        [(row, packet, PCMA_PAYLOAD_TYPE, None) for row in rows] for packet in packets
+    ]
+    tx_groups = [
+        [(row, np.frombuffer(frame, dtype=np.int16), None) for row in rows] for frame in frames
+    ]
+    batched = [
+        ("inbound  packets/s", _rate(batch._flush_inbound, rx_groups, args.seconds) * args.bridges, 50),
+        ("outbound frames/s ", _rate(batch._flush_outbound, tx_groups, args.seconds) * args.bridges, 100),
+    ]
+
+    print(f"{'':20}{'old':>12}{'new':>12}{'batched':>12}{'speedup':>10}{'legs/core':>12}")
+    for (name, old, new, per_leg), (_, batch_rate, _) in zip(results, batched):
+        best = max(new, batch_rate)
+        print(
+            f"{name:20}{old:12,.0f}{new:12,.0f}{batch_rate:12,.0f}"
+            f"{best / old:9.1f}x{best / per_leg:12,.0f}"
+        )
+    print(f"(batched = {args.bridges} bridges per flush)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Move embedded CallRecord.transcripts arrays into the call_transcripts collection.
+
+Legacy shape:
+    call_records.transcripts  ([{speaker, text, timestamp}, ...], grown by $push + $sort)
+
+New shape:
+    call_transcripts          (one document per line: room_name, seq, speaker, text, timestamp)
+    call_records.transcript_count / transcript_last_at
+
+Run once right after deploying the code that writes call_transcripts — until then the
+API returns no transcript for unmigrated calls:
+
+    uv run python scripts/migrate_transcripts.py
+
+Idempotent and safe to re-run or interrupt. Each record's lines are inserted first
+(duplicates from an earlier partial run are skipped by the unique index), and only
+then is its array removed and its count bumped, in one update. Legacy lines take seq
+-n..-1, so they never collide with the seq numbers live calls reserve from 0 upwards.
+Uses the raw collections: the legacy field no longer exists on CallRecord.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+from pymongo import ASCENDING  # noqa: E402
+from pymongo.errors import BulkWriteError  # noqa: E402
+
+from src.core.config import settings  # noqa: E402
+
+DUPLICATE_KEY = 11000
+
+
+def legacy_lines(room_name: str, transcripts: list[dict]) -> list[dict]:
+    """call_transcripts documents for one record's embedded array, in speaking order."""
+    ordered = sorted(
+        (t for t in transcripts if t.get("timestamp") is not None),
+        key=lambda t: t["timestamp"],
+    )
+    n = len(ordered)
+    return [
+        {
+            "room_name": room_name,
+            "seq": i - n,
+            "speaker": t.get("speaker"),
+            "text": t.get("text", ""),
+            "timestamp": t["timestamp"],
+        }
+        for i, t in enumerate(ordered)
+    ]
+
+
+async def migrate(records, lines) -> None:
+    await lines.create_index(
+        [("room_name", ASCENDING), ("timestamp", ASCENDING), ("seq", ASCENDING)], unique=True
+    )
+
+    migrated = moved = 0
+    async for doc in records.find(
+        {"transcripts": {"$exists": True}}, {"room_name": 1, "transcripts": 1}
+    ):
+        docs = legacy_lines(doc["room_name"], doc.get("transcripts") or [])
+        if docs:
+            try:
+                await lines.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+                    raise
+
+        update = {"$unset": {"transcripts": ""}, "$inc": {"transcript_count": len(docs)}}
+        if docs:
+            update["$max"] = {"transcript_last_at": docs[-1]["timestamp"]}
+        await records.update_one({"_id": doc["_id"], "transcripts": {"$exists": True}}, update)
+        migrated += 1
+        moved += len(docs)
+        if migrated % 1000 == 0:
+            print(f"  {migrated} call(s), {moved} line(s) so far...")
+
+    print(f"Moved {moved} transcript line(s) out of {migrated} call record(s).")
+
+
+async def main() -> None:
+    print(f"Connecting to MongoDB at {settings.MONGODB_URL}...")
+    client = AsyncIOMotorClient(settings.MONGODB_URL, tz_aware=True)
+    db = client[settings.DATABASE_NAME]
+    await migrate(db["call_records"], db["call_transcripts"])
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,10 +1,11 @@
 """
-Dedicated process for two singleton services:
+Dedicated process for two services:
   - Inbound SIP listener  (Exotel BYE / OPTIONS on port 5070)
   - Outbound call dispatcher (MongoDB Change Streams + 30s fallback poll)
 
 Runs as a separate container so the api container can safely scale to
-multiple workers without port-binding conflicts or duplicate dispatchers.
+multiple workers without port-binding conflicts. One per host (port 5070);
+replicas on several hosts share the outbound queue through claim leases.
 """
 
 import asyncio
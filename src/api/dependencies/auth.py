@@ -1,10 +1,19 @@
 from fastapi import Security, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
 from src.core.db.db_schemas import APIKey
+from src.api.dependencies.key_cache import api_key_cache
 
 security = HTTPBearer()
 
 
+async def _load_api_key(api_key: str) -> Optional[APIKey]:
+    return await APIKey.find_one(
+        APIKey.api_key == api_key,
+        APIKey.is_active == True
+    )
+
+
 async def get_current_user(auth: HTTPAuthorizationCredentials = Security(security)) -> APIKey:
     """
     Verify the API key provided in the Authorization header.
@@ -12,11 +21,8 @@ async def get_current_user(auth: HTTPAuthorizationCredentials = Security(securit
     """
     api_key_str = auth.credentials
 
-    # Find the API key in the database
-    api_key_doc = await APIKey.find_one(
-        APIKey.api_key == api_key_str,
-        APIKey.is_active == True
-    )
+    # Cached per process; revocations are pushed by the api_keys change stream
+    api_key_doc = await api_key_cache.get(api_key_str, _load_api_key)
 
     if not api_key_doc:
         raise HTTPException(
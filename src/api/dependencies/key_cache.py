@@ -0,0 +1,125 @@
+"""In-process cache of API-key lookups for get_current_user.
+
+Every authenticated request used to cost an api_keys find_one. Active keys are now cached
+for AUTH_CACHE_TTL seconds, and unknown or inactive keys for AUTH_CACHE_NEGATIVE_TTL, so a
+client retrying a bad key costs one lookup every few seconds rather than one per request.
+The two are kept in separate LRUs: a flood of made-up keys can't evict the real ones.
+
+Revocation is driven by watch_api_keys(), a change stream on api_keys. Any change to a key's
+document — deactivated, rotated, deleted — evicts it, so it stops working within the
+stream's latency rather than the TTL. Each (re)start of the stream clears the cache, since
+changes made while it was down were missed. Without change streams (a standalone mongod)
+the TTL is the bound.
+
+Per process, like the analytics cache.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from src.core.config import settings
+from src.core.db.database import Database
+from src.core.db.db_schemas import APIKey
+from src.core.logger import logger
+
+
+class APIKeyCache:
+    """TTL + LRU cache of api_key string -> active APIKey document (or None)."""
+
+    def __init__(self, max_entries: int, ttl: float, negative_ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._valid: OrderedDict[str, tuple[float, APIKey]] = OrderedDict()
+        self._invalid: OrderedDict[str, float] = OrderedDict()
+        self._ids: dict[Any, str] = {}  # document _id -> cached key; delete events carry only the _id
+        # Bumped on every invalidation. A lookup that was in flight across one may have
+        # read the old document, so it returns its result without caching it.
+        self._generation = 0
+
+    async def get(self, api_key: str, load: Callable[[str], Awaitable[Optional[APIKey]]]) -> Optional[APIKey]:
+        """The active APIKey for `api_key`, or None — cached, else `load(api_key)`.
+
+        The document is shared with every later hit; callers must not modify it.
+        """
+        now = time.monotonic()
+        entry = self._valid.get(api_key)
+        if entry and entry[0] > now:
+            self._valid.move_to_end(api_key)
+            return entry[1]
+        expires = self._invalid.get(api_key)
+        if expires and expires > now:
+            return None
+
+        generation = self._generation
+        doc = await load(api_key)
+        if generation == self._generation:
+            self._store(api_key, doc)
+        return doc
+
+    def _store(self, api_key: str, doc: Optional[APIKey]) -> None:
+        self._drop(api_key)
+        if doc is None:
+            if self.negative_ttl > 0:
+                self._invalid[api_key] = time.monotonic() + self.negative_ttl
+                while len(self._invalid) > self.max_entries:
+                    self._invalid.popitem(last=False)
+            return
+        if self.ttl > 0:
+            self._valid[api_key] = (time.monotonic() + self.ttl, doc)
+            self._ids[doc.id] = api_key
+            while len(self._valid) > self.max_entries:
+                _, (_, evicted) = self._valid.popitem(last=False)
+                self._ids.pop(evicted.id, None)
+
+    def _drop(self, api_key: str) -> None:
+        self._invalid.pop(api_key, None)
+        entry = self._valid.pop(api_key, None)
+        if entry:
+            self._ids.pop(entry[1].id, None)
+
+    def invalidate(self, doc_id: Any = None, api_key: Optional[str] = None) -> None:
+        """Forget the key cached for document `doc_id`, and `api_key` if given.
+
+        Pass the document's current api_key too, so a new or re-activated key isn't held
+        back by a negative entry.
+        """
+        self._generation += 1
+        cached = self._ids.get(doc_id)
+        if cached:
+            self._drop(cached)
+        if api_key:
+            self._drop(api_key)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._valid.clear()
+        self._invalid.clear()
+        self._ids.clear()
+
+
+api_key_cache = APIKeyCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_CACHE_TTL,
+    negative_ttl=settings.AUTH_CACHE_NEGATIVE_TTL,
+)
+
+
+async def watch_api_keys() -> None:
+    """Change Stream: evict cached keys whose api_keys document changed. Runs until cancelled."""
+    # updateLookup so updates carry the key string as well; nothing else is needed.
+    pipeline = [{"$project": {"operationType": 1, "documentKey": 1, "fullDocument.api_key": 1}}]
+    while True:
+        try:
+            col = Database.client[settings.DATABASE_NAME][APIKey.Settings.name]
+            async with await col.watch(pipeline, full_document="updateLookup") as stream:
+                api_key_cache.clear()  # whatever changed while we weren't watching
+                async for change in stream:
+                    api_key_cache.invalidate(
+                        change["documentKey"]["_id"], (change.get("fullDocument") or {}).get("api_key")
+                    )
+        except Exception as e:
+            logger.warning(f"ChangeStream (api keys) error, restarting in 5s: {e}")
+            await asyncio.sleep(5)
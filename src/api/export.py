@@ -0,0 +1,32 @@
+"""Streaming encoders for bulk export endpoints.
+
+Each takes an async iterator of row batches (lists of JSON-ready dicts) and yields one
+encoded chunk per batch. Fed to a StreamingResponse, the API holds at most one batch in
+memory and starts sending as soon as the first batch is read, whatever the export size.
+"""
+
+import csv
+import io
+import json
+from typing import AsyncIterator, Dict, List, Sequence
+
+Batch = List[Dict]
+
+
+async def ndjson_chunks(batches: AsyncIterator[Batch]) -> AsyncIterator[str]:
+    """One JSON object per line."""
+    async for batch in batches:
+        yield "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in batch)
+
+
+async def csv_chunks(batches: AsyncIterator[Batch], columns: Sequence[str]) -> AsyncIterator[str]:
+    """Header row first, then each batch's rows. Keys outside `columns` are dropped."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    yield buf.getvalue()
+    async for batch in batches:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(batch)
+        yield buf.getvalue()
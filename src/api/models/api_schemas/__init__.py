@@ -41,7 +41,14 @@ from .config.tts_config import (
     TTSConfig,
 )
 from .keys import CreateApiKey
-from .telephony.calls import TriggerOutboundCall, TriggerPassthroughCall, TriggerWebCall
+from .telephony.calls import (
+    BULK_OUTBOUND_MAX_ROWS,
+    BulkOutboundCallRow,
+    TriggerBulkOutboundCall,
+    TriggerOutboundCall,
+    TriggerPassthroughCall,
+    TriggerWebCall,
+)
 from .telephony.inbound import (
     AssignInboundNumber,
     InboundConfig,
@@ -101,6 +108,9 @@ __all__ = [
     "TrunkConfig",
     "CreateOutboundTrunk",
     "TriggerOutboundCall",
+    "BULK_OUTBOUND_MAX_ROWS",
+    "BulkOutboundCallRow",
+    "TriggerBulkOutboundCall",
     "TriggerPassthroughCall",
     "TriggerWebCall",
     "InboundTwilioConfig",
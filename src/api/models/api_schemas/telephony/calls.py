@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,45 @@ class TriggerOutboundCall(BaseModel):
         }
 
 
+# Rows per bulk enqueue request — a campaign's worth. Split bigger lists across batch keys.
+BULK_OUTBOUND_MAX_ROWS = 50_000
+
+
+class BulkOutboundCallRow(BaseModel):
+    to_number: str = Field(..., min_length=1, max_length=100, description="To Number (cannot be empty)")
+    metadata: Optional[dict] = Field(None, description="Metadata for this call (optional)")
+
+    class Config:
+        str_strip_whitespace = True
+
+
+# Trigger many outbound calls with one assistant and trunk
+class TriggerBulkOutboundCall(BaseModel):
+    assistant_id: str = Field(..., min_length=1, max_length=100, description="Assistant ID (cannot be empty)")
+    trunk_id: str = Field(..., min_length=1, max_length=100, description="Trunk ID (cannot be empty)")
+    call_service: Literal["twilio", "exotel"] = Field(..., description="Call service (cannot be empty)")
+    batch_key: Optional[str] = Field(
+        None, min_length=1, max_length=100,
+        description="Idempotency key: resending a batch with the same key queues none of its rows twice",
+    )
+    calls: List[BulkOutboundCallRow] = Field(..., min_length=1, max_length=BULK_OUTBOUND_MAX_ROWS)
+
+    class Config:
+        str_strip_whitespace = True
+        json_schema_extra = {
+            "example": {
+                "assistant_id": "Test Assistant ID",
+                "trunk_id": "Test Trunk ID",
+                "call_service": "exotel",
+                "batch_key": "march-renewals-part-1",
+                "calls": [
+                    {"to_number": "+919876543210", "metadata": {"name": "Asha"}},
+                    {"to_number": "+919876543211", "metadata": {"name": "Ravi"}},
+                ],
+            }
+        }
+
+
 class TriggerPassthroughCall(BaseModel):
     """Initiates a passthrough call: web user ↔ SIP with no AI agent."""
 
@@ -0,0 +1,77 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+skip/limit makes Mongo walk and discard every skipped entry, so page N costs N pages. A
+cursor instead names the last row the client saw — its sort value and _id — and the next
+page is a range query from there: one index seek however deep the client has paged.
+
+Cursors are opaque to clients (base64url JSON) and bound to the field and direction that
+produced them, so one minted under sort_order=desc can't be replayed under asc.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+
+def encode_cursor(field: str, descending: bool, value: datetime, doc_id) -> str:
+    raw = json.dumps({"f": field, "d": descending, "v": value.isoformat(), "id": str(doc_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def cursor_filter(cursor: str, field: str, descending: bool) -> dict:
+    """Mongo filter for the rows after `cursor` in (field, _id) order. 400 on a bad token."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        if data["f"] != field or data["d"] != descending:
+            raise ValueError("cursor was issued for a different sort")
+        value = datetime.fromisoformat(data["v"])
+        doc_id = PydanticObjectId(data["id"])
+    except (ValueError, KeyError, TypeError, InvalidId, binascii.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+    op = "$lt" if descending else "$gt"
+    return {"$or": [{field: {op: value}}, {field: value, "_id": {op: doc_id}}]}
+
+
+def keyset_sort(field: str, descending: bool) -> list[tuple[str, int]]:
+    """Sort spec with _id as tiebreaker, so rows sharing a timestamp page deterministically."""
+    direction = -1 if descending else 1
+    return [(field, direction), ("_id", direction)]
+
+
+def next_cursor(items: list, field: str, descending: bool, limit: int) -> str | None:
+    """Cursor for the page after `items`, or None when this page was the last."""
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(field, descending, getattr(last, field), last.id)
+
+
+def page_meta(
+    items: list,
+    limit: int,
+    total: int | None,
+    page: int,
+    keyset_field: str | None,
+    descending: bool,
+) -> dict:
+    """Pagination block for a list response.
+
+    Offset requests keep total/page/total_pages for existing clients and also get a
+    next_cursor to switch over with. Cursor requests skip the count — it is as expensive
+    as the skip they replace — so they report next_cursor only. next_cursor is None
+    when there is no next page or the sort isn't keyset-capable.
+    """
+    meta = {
+        "limit": limit,
+        "next_cursor": next_cursor(items, keyset_field, descending, limit) if keyset_field else None,
+    }
+    if total is not None:
+        meta.update(total=total, page=page, total_pages=(total + limit - 1) // limit)
+    return meta
@@ -3,8 +3,9 @@ from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, Depends, Query
 from src.api.dependencies import get_super_admin
 from src.api.models.response_models import apiResponse
-from src.core.db.db_schemas import APIKey, CallRecord, UsageRecord
+from src.core.db.db_schemas import APIKey, CallDailyRollup, UsageRecord
 from src.core.logger import logger
+from src.services.analytics import analytics_cache, rollup_source
 
 router = APIRouter()
 
@@ -36,23 +37,23 @@ async def admin_dashboard(
     if not start_date:
         start_date = now - timedelta(days=30)
 
-    match_filter = {"started_at": {"$gte": start_date, "$lte": end_date}}
+    match_filter = {}
     if user_email:
-        match_filter["created_by_email"] = user_email
+        match_filter["user_email"] = user_email
 
     try:
         pipeline = [
-            {"$match": match_filter},
+            *rollup_source(start_date, end_date, match_filter),
             {
                 "$group": {
                     "_id": None,
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
-                    "unique_users": {"$addToSet": "$created_by_email"},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
+                    "unique_users": {"$addToSet": "$user_email"},
                 }
             },
         ]
-        result = await CallRecord.aggregate(pipeline).to_list()
+        result = await CallDailyRollup.aggregate(pipeline).to_list()
     except Exception as e:
         logger.error(f"[admin/analytics/dashboard] failed for {current_user.user_email}: {e}")
         raise
@@ -94,12 +95,12 @@ async def admin_calls_by_user(
 
     try:
         pipeline = [
-            {"$match": {"started_at": {"$gte": start_date, "$lte": end_date}}},
+            *rollup_source(start_date, end_date),
             {
                 "$group": {
-                    "_id": "$created_by_email",
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "_id": "$user_email",
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -115,7 +116,7 @@ async def admin_calls_by_user(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await CallDailyRollup.aggregate(pipeline).to_list()
     except Exception as e:
         logger.error(f"[admin/analytics/calls/by-user] failed for {current_user.user_email}: {e}")
         raise
@@ -142,9 +143,9 @@ async def admin_calls_by_phone_number(
     if not start_date:
         start_date = now - timedelta(days=30)
 
-    match_filter = {"started_at": {"$gte": start_date, "$lte": end_date}}
+    match_filter = {}
     if user_email:
-        match_filter["created_by_email"] = user_email
+        match_filter["user_email"] = user_email
 
     try:
         platform_bucket_expr = {
@@ -155,12 +156,12 @@ async def admin_calls_by_phone_number(
             ]
         }
         pipeline = [
-            {"$match": match_filter},
+            *rollup_source(start_date, end_date, match_filter),
             {
                 "$group": {
                     "_id": platform_bucket_expr,
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -175,7 +176,7 @@ async def admin_calls_by_phone_number(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await CallDailyRollup.aggregate(pipeline).to_list()
     except Exception as e:
         logger.error(f"[admin/analytics/calls/by-phone-number] failed for {current_user.user_email}: {e}")
         raise
@@ -203,12 +204,12 @@ async def admin_calls_by_service(
 
     try:
         pipeline = [
-            {"$match": {"started_at": {"$gte": start_date, "$lte": end_date}}},
+            *rollup_source(start_date, end_date),
             {
                 "$group": {
                     "_id": "$call_service",
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -223,7 +224,7 @@ async def admin_calls_by_service(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await CallDailyRollup.aggregate(pipeline).to_list()
     except Exception as e:
         logger.error(f"[admin/analytics/calls/by-service] failed for {current_user.user_email}: {e}")
         raise
@@ -235,6 +236,16 @@ async def admin_calls_by_service(
     )
 
 
+@router.get("/analytics/cache")
+async def admin_analytics_cache_stats(current_user: APIKey = Depends(get_super_admin)):
+    """This API process's /analytics response cache: size, hit/miss counts, compute latency."""
+    return apiResponse(
+        success=True,
+        message="Analytics cache stats fetched successfully",
+        data=analytics_cache.stats(),
+    )
+
+
 # --- Token Usage Analytics (super-admin only) ---
 
 
@@ -278,6 +289,8 @@ async def admin_tokens_summary(
                     "total_tts_audio_duration": {"$sum": "$tts_audio_duration"},
                     # Cascade mode only; zero for pipeline/realtime rows.
                     "total_stt_audio_duration": {"$sum": "$stt_audio_duration"},
+                    # The Sarvam tap's gated silence that was never streamed (pipeline/realtime).
+                    "total_stt_silence_skipped_seconds": {"$sum": "$stt_silence_skipped_seconds"},
                     "total_call_duration_minutes": {"$sum": "$call_duration_minutes"},
                 }
             },
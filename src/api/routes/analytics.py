@@ -1,14 +1,24 @@
-from typing import Optional, Literal
+from typing import Hashable, Optional, Literal
 from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, Depends, Query
 from src.api.dependencies import get_current_user
 from src.api.models.response_models import apiResponse
-from src.core.db.db_schemas import APIKey, CallRecord
+from src.core.db.db_schemas import APIKey, CallDailyRollup
 from src.core.logger import logger
+from src.core.config import settings
+from src.services.analytics import analytics_cache, cache_window, rollup_source
 
 router = APIRouter()
 
 
+async def _aggregate(key: Hashable, ttl: float, pipeline: list) -> list:
+    """Run `pipeline` on the rollups through the analytics cache.
+
+    `key` must name the endpoint and every parameter the pipeline depends on.
+    """
+    return await analytics_cache.get_or_compute(key, ttl, lambda: CallDailyRollup.aggregate(pipeline).to_list())
+
+
 def _date_format_for_granularity(granularity: str) -> str:
     """Return MongoDB $dateToString format for the given granularity."""
     formats = {
@@ -19,6 +29,45 @@ def _date_format_for_granularity(granularity: str) -> str:
     return formats.get(granularity, "%Y-%m-%d")
 
 
+def _dashboard_pipeline(user_email: str, start: datetime, end: datetime, now: datetime) -> list:
+    """One aggregation for the whole dashboard: summary and status breakdown over
+    [start, end], plus the today / this week / this month counts.
+
+    The source spans both the requested range and the current month. start and end are
+    cut exactly (their days are read live); the period boundaries are midnights, which
+    whole-day rollup rows already respect.
+    """
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = today_start - timedelta(days=today_start.weekday())
+    month_start = today_start.replace(day=1)
+
+    in_range = {"$match": {"day": {"$gte": start, "$lte": end}}}
+    count = {"$group": {"_id": None, "count": {"$sum": "$total_calls"}}}
+    return [
+        *rollup_source(
+            min(start, week_start, month_start), max(end, now), {"user_email": user_email}, exact=(start, end)
+        ),
+        {
+            "$facet": {
+                "summary": [
+                    in_range,
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total_calls": {"$sum": "$total_calls"},
+                            "total_duration_minutes": {"$sum": "$total_duration_minutes"},
+                        }
+                    },
+                ],
+                "by_status": [in_range, {"$group": {"_id": "$call_status", "count": {"$sum": "$total_calls"}}}],
+                "today": [{"$match": {"day": {"$gte": today_start}}}, count],
+                "this_week": [{"$match": {"day": {"$gte": week_start}}}, count],
+                "this_month": [{"$match": {"day": {"$gte": month_start}}}, count],
+            }
+        },
+    ]
+
+
 @router.get("/dashboard")
 async def get_dashboard(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
@@ -27,64 +76,33 @@ async def get_dashboard(
 ):
     """At-a-glance analytics dashboard for the authenticated user."""
     logger.info(f"[analytics/dashboard] requested by {current_user.user_email}, date_range={start_date} to {end_date}")
+    start_date, end_date, ttl = cache_window(start_date, end_date)
     now = datetime.now(timezone.utc)
-    if not end_date:
-        end_date = now
-    if not start_date:
-        start_date = now - timedelta(days=30)
-
-    match_filter = {
-        "created_by_email": current_user.user_email,
-        "started_at": {"$gte": start_date, "$lte": end_date},
-    }
 
     try:
-        # Summary aggregation
-        pipeline = [
-            {"$match": match_filter},
-            {
-                "$group": {
-                    "_id": None,
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
-                }
-            },
-        ]
-        result = await CallRecord.aggregate(pipeline).to_list()
-        summary = result[0] if result else {}
-
-        # Period-based counts
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=today_start.weekday())
-        month_start = today_start.replace(day=1)
-
-        period_pipeline = [
-            {"$match": {"created_by_email": current_user.user_email}},
-            {
-                "$facet": {
-                    "today": [
-                        {"$match": {"started_at": {"$gte": today_start}}},
-                        {"$count": "count"},
-                    ],
-                    "this_week": [
-                        {"$match": {"started_at": {"$gte": week_start}}},
-                        {"$count": "count"},
-                    ],
-                    "this_month": [
-                        {"$match": {"started_at": {"$gte": month_start}}},
-                        {"$count": "count"},
-                    ],
-                }
-            },
-        ]
-        period_result = await CallRecord.aggregate(period_pipeline).to_list()
+        # The period counts are always about now, whatever the requested range — short TTL.
+        pipeline = _dashboard_pipeline(current_user.user_email, start_date, end_date, now)
+        result = await _aggregate(
+            ("dashboard", current_user.user_email, start_date, end_date),
+            min(ttl, settings.ANALYTICS_CACHE_TTL),
+            pipeline,
+        )
     except Exception as e:
         logger.error(f"[analytics/dashboard] failed for {current_user.user_email}: {e}")
         raise
-    periods = period_result[0] if period_result else {}
-
-    total_minutes = summary.get("total_duration_minutes", 0) or 0
-    total_calls = summary.get("total_calls", 0) or 0
+    facets = result[0] if result else {}
+
+    def first(name: str, field: str):
+        rows = facets.get(name) or [{}]
+        return rows[0].get(field, 0) or 0
+
+    total_minutes = first("summary", "total_duration_minutes")
+    total_calls = first("summary", "total_calls")
+    status_breakdown = {
+        row["_id"] or "unknown": row["count"]
+        for row in sorted(facets.get("by_status", []), key=lambda row: -row["count"])
+        if row["count"]
+    }
 
     return apiResponse(
         success=True,
@@ -94,9 +112,10 @@ async def get_dashboard(
             "total_duration_minutes": round(total_minutes, 2),
             "total_duration_hours": round(total_minutes / 60, 2),
             "avg_duration_minutes": round(total_minutes / total_calls, 2) if total_calls else 0,
-            "calls_today": periods.get("today", [{}])[0].get("count", 0) if periods.get("today") else 0,
-            "calls_this_week": periods.get("this_week", [{}])[0].get("count", 0) if periods.get("this_week") else 0,
-            "calls_this_month": periods.get("this_month", [{}])[0].get("count", 0) if periods.get("this_month") else 0,
+            "calls_today": first("today", "count"),
+            "calls_this_week": first("this_week", "count"),
+            "calls_this_month": first("this_month", "count"),
+            "status_breakdown": status_breakdown,
             "date_range": {
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
@@ -113,25 +132,16 @@ async def get_calls_by_assistant(
 ):
     """Per-assistant call count and duration breakdown."""
     logger.info(f"[analytics/calls/by-assistant] requested by {current_user.user_email}, date_range={start_date} to {end_date}")
-    now = datetime.now(timezone.utc)
-    if not end_date:
-        end_date = now
-    if not start_date:
-        start_date = now - timedelta(days=30)
+    start_date, end_date, ttl = cache_window(start_date, end_date)
 
     try:
         pipeline = [
-            {
-                "$match": {
-                    "created_by_email": current_user.user_email,
-                    "started_at": {"$gte": start_date, "$lte": end_date},
-                }
-            },
+            *rollup_source(start_date, end_date, {"user_email": current_user.user_email}),
             {
                 "$group": {
                     "_id": {"assistant_id": "$assistant_id", "assistant_name": "$assistant_name"},
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -148,7 +158,7 @@ async def get_calls_by_assistant(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await _aggregate(("calls/by-assistant", current_user.user_email, start_date, end_date), ttl, pipeline)
     except Exception as e:
         logger.error(f"[analytics/calls/by-assistant] failed for {current_user.user_email}: {e}")
         raise
@@ -169,16 +179,9 @@ async def get_calls_by_phone_number(
 ):
     """Per phone number call count and duration breakdown — key for bill verification."""
     logger.info(f"[analytics/calls/by-phone-number] requested by {current_user.user_email}, assistant_id={assistant_id}, date_range={start_date} to {end_date}")
-    now = datetime.now(timezone.utc)
-    if not end_date:
-        end_date = now
-    if not start_date:
-        start_date = now - timedelta(days=30)
-
-    match_filter = {
-        "created_by_email": current_user.user_email,
-        "started_at": {"$gte": start_date, "$lte": end_date},
-    }
+    start_date, end_date, ttl = cache_window(start_date, end_date)
+
+    match_filter = {"user_email": current_user.user_email}
     if assistant_id:
         match_filter["assistant_id"] = assistant_id
 
@@ -191,12 +194,12 @@ async def get_calls_by_phone_number(
             ]
         }
         pipeline = [
-            {"$match": match_filter},
+            *rollup_source(start_date, end_date, match_filter),
             {
                 "$group": {
                     "_id": platform_bucket_expr,
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -212,7 +215,9 @@ async def get_calls_by_phone_number(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await _aggregate(
+            ("calls/by-phone-number", current_user.user_email, start_date, end_date, assistant_id), ttl, pipeline
+        )
     except Exception as e:
         logger.error(f"[analytics/calls/by-phone-number] failed for {current_user.user_email}: {e}")
         raise
@@ -234,16 +239,9 @@ async def get_calls_by_time(
 ):
     """Time-series call count and duration data."""
     logger.info(f"[analytics/calls/by-time] requested by {current_user.user_email}, granularity={granularity}, assistant_id={assistant_id}, date_range={start_date} to {end_date}")
-    now = datetime.now(timezone.utc)
-    if not end_date:
-        end_date = now
-    if not start_date:
-        start_date = now - timedelta(days=30)
-
-    match_filter = {
-        "created_by_email": current_user.user_email,
-        "started_at": {"$gte": start_date, "$lte": end_date},
-    }
+    start_date, end_date, ttl = cache_window(start_date, end_date)
+
+    match_filter = {"user_email": current_user.user_email}
     if assistant_id:
         match_filter["assistant_id"] = assistant_id
 
@@ -251,12 +249,12 @@ async def get_calls_by_time(
 
     try:
         pipeline = [
-            {"$match": match_filter},
+            *rollup_source(start_date, end_date, match_filter),
             {
                 "$group": {
-                    "_id": {"$dateToString": {"format": date_format, "date": "$started_at"}},
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "_id": {"$dateToString": {"format": date_format, "date": "$day"}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"_id": 1}},
@@ -271,7 +269,9 @@ async def get_calls_by_time(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await _aggregate(
+            ("calls/by-time", current_user.user_email, start_date, end_date, granularity, assistant_id), ttl, pipeline
+        )
     except Exception as e:
         logger.error(f"[analytics/calls/by-time] failed for {current_user.user_email}: {e}")
         raise
@@ -291,25 +291,16 @@ async def get_calls_by_service(
 ):
     """Per service (exotel/twilio/web) call count and duration breakdown."""
     logger.info(f"[analytics/calls/by-service] requested by {current_user.user_email}, date_range={start_date} to {end_date}")
-    now = datetime.now(timezone.utc)
-    if not end_date:
-        end_date = now
-    if not start_date:
-        start_date = now - timedelta(days=30)
+    start_date, end_date, ttl = cache_window(start_date, end_date)
 
     try:
         pipeline = [
-            {
-                "$match": {
-                    "created_by_email": current_user.user_email,
-                    "started_at": {"$gte": start_date, "$lte": end_date},
-                }
-            },
+            *rollup_source(start_date, end_date, {"user_email": current_user.user_email}),
             {
                 "$group": {
                     "_id": "$call_service",
-                    "total_calls": {"$sum": 1},
-                    "total_duration_minutes": {"$sum": {"$ifNull": ["$call_duration_minutes", 0]}},
+                    "total_calls": {"$sum": "$total_calls"},
+                    "total_duration_minutes": {"$sum": "$total_duration_minutes"},
                 }
             },
             {"$sort": {"total_duration_minutes": -1}},
@@ -324,7 +315,7 @@ async def get_calls_by_service(
             },
         ]
 
-        results = await CallRecord.aggregate(pipeline).to_list()
+        results = await _aggregate(("calls/by-service", current_user.user_email, start_date, end_date), ttl, pipeline)
     except Exception as e:
         logger.error(f"[analytics/calls/by-service] failed for {current_user.user_email}: {e}")
         raise
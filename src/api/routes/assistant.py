@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 from src.api.models.api_schemas import (
     CreateAssistant,
@@ -15,14 +15,17 @@ from src.api.validation import (
 )
 from src.core.providers.keys import mask_assistant_keys, redact_text
 from src.api.models.response_models import apiResponse
-from src.core.db.db_schemas import Assistant, APIKey, CallRecord, AudioAsset
+from src.api.pagination import cursor_filter, keyset_sort, page_meta
+from src.core.db.db_schemas import Assistant, APIKey, CallRecord, CallRecordSummary, AudioAsset
 from src.api.dependencies import get_current_user
 from src.core.logger import logger
+from src.services.livekit.livekit_svc import LiveKitService
 import uuid
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
 router = APIRouter()
+_livekit_services = LiveKitService()
 
 
 def merge_interaction_config(base, overrides: dict) -> dict:
@@ -389,6 +392,8 @@ async def get_call_logs(
     end_date: Optional[datetime] = Query(None, description="End date for filtering (ISO 8601)"),
     sort_by: str = Query("started_at", description="Field to sort by (e.g., started_at, ended_at, call_duration_minutes, billable_duration_minutes)"),
     sort_order: str = Query("desc", description="Sort order: 'asc' or 'desc'"),
+    include: Optional[Literal["transcripts"]] = Query(None, description="Embed each call's transcript lines (omitted by default; see /call/records/{room_name}/transcript)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page. Pages by index seek instead of skip; ignores page. Requires sort_by=started_at"),
     current_user: APIKey = Depends(get_current_user)
 ):
     logger.info(f"Received request to get call logs for assistant: {assistant_id}")
@@ -410,33 +415,38 @@ async def get_call_logs(
     if end_date:
         query_conditions.append(CallRecord.started_at <= end_date)
 
-    # Calculate skip
-    skip = (page - 1) * limit
-    
-    # Sorting
-    sort_prefix = "-" if sort_order == "desc" else "+"
-    sort_field = f"{sort_prefix}{sort_by}"
+    # Sorting. started_at pages by (started_at, _id) so the response can hand out a cursor.
+    descending = sort_order == "desc"
+    keyset = sort_by == "started_at"
+    if cursor and not keyset:
+        raise HTTPException(status_code=400, detail="cursor pagination requires sort_by=started_at")
+    sort_field = keyset_sort("started_at", descending) if keyset else f"{'-' if descending else '+'}{sort_by}"
 
-    call_log_query = CallRecord.find(*query_conditions)
-    
-    # Get total count before pagination
-    total_logs = await call_log_query.count()
-    
-    # Apply sorting and pagination
-    call_logs = await call_log_query.sort(sort_field).skip(skip).limit(limit).to_list()
+    if cursor:
+        call_log_query = CallRecord.find(*query_conditions, cursor_filter(cursor, "started_at", descending))
+        total_logs = None
+    else:
+        call_log_query = CallRecord.find(*query_conditions)
+        # Get total count before pagination
+        total_logs = await call_log_query.count()
+        call_log_query = call_log_query.skip((page - 1) * limit)
+
+    call_logs = await call_log_query.sort(sort_field).limit(limit).project(CallRecordSummary).to_list()
 
     call_log_data = [call_log.model_dump(exclude={"id"}) for call_log in call_logs]
+    if include == "transcripts":
+        transcripts = await _livekit_services.get_transcripts([call_log.room_name for call_log in call_logs])
+        for call_log in call_log_data:
+            call_log["transcripts"] = transcripts.get(call_log["room_name"], [])
 
     return apiResponse(
         success=True,
         message="Call logs retrieved successfully",
         data={
             "logs": call_log_data,
-            "pagination": {
-                "total": total_logs,
-                "page": page,
-                "limit": limit,
-                "total_pages": (total_logs + limit - 1) // limit if total_logs > 0 else 0
-            }
+            "pagination": page_meta(
+                call_logs, limit, total=total_logs, page=page,
+                keyset_field="started_at" if keyset else None, descending=descending,
+            ),
         },
     )
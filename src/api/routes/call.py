@@ -1,10 +1,30 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, Body, Query
-from fastapi.responses import JSONResponse
-from typing import Optional
+import csv
+import io
+import uuid
+from fastapi import APIRouter, HTTPException, Depends, Request, Body, Query, File, Form, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, List, Literal, Optional
 from datetime import datetime
-from src.api.models.api_schemas import TriggerOutboundCall, TriggerPassthroughCall
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+from pymongo.errors import BulkWriteError
+from src.api.models.api_schemas import (
+    BULK_OUTBOUND_MAX_ROWS,
+    TriggerBulkOutboundCall,
+    TriggerOutboundCall,
+    TriggerPassthroughCall,
+)
+from src.api.export import csv_chunks, ndjson_chunks
 from src.api.models.response_models import apiResponse
-from src.core.db.db_schemas import OutboundSIP, APIKey, Assistant, OutboundCallQueue, CallRecord
+from src.api.pagination import cursor_filter, keyset_sort, page_meta
+from src.core.db.db_schemas import (
+    OutboundSIP,
+    APIKey,
+    Assistant,
+    OutboundCallQueue,
+    CallRecord,
+    CallRecordSummary,
+)
 from src.api.dependencies import get_current_user
 from src.core.logger import logger
 from src.core.providers.keys import redact_text
@@ -13,36 +33,62 @@ from src.services.livekit.livekit_svc import LiveKitService
 router = APIRouter()
 _livekit_services = LiveKitService()
 
+# Queue rows per insert_many round-trip in the bulk enqueue endpoints.
+BULK_INSERT_CHUNK = 1000
+# Upload cap for the CSV endpoint, checked before any parsing: over 1 KiB per row at
+# BULK_OUTBOUND_MAX_ROWS.
+BULK_CSV_MAX_BYTES = 50 * 1024 * 1024
+# Records per export chunk: the cursor batch size, and the unit transcripts are fetched in.
+EXPORT_BATCH_SIZE = 500
+_EXPORT_COLUMNS = [f for f in CallRecordSummary.model_fields if f != "id"]
+_TRANSCRIPT_COLUMNS = ["transcript_speaker", "transcript_text", "transcript_timestamp"]
 
-@router.post("/outbound", status_code=202)
-async def trigger_outbound_call(
-    request: TriggerOutboundCall, current_user: APIKey = Depends(get_current_user)
-):
-    logger.info(
-        f"Received outbound call request | user={current_user.user_email} "
-        f"service={request.call_service} to={request.to_number}"
-    )
 
+class _CallRecordRoom(BaseModel):
+    """Projection for ownership checks — the room name is all they read."""
+
+    room_name: str
+
+
+async def _outbound_target(
+    assistant_id: str, trunk_id: str, call_service: str, current_user: APIKey
+) -> tuple[Assistant, OutboundSIP]:
+    """The caller's assistant and active trunk for an outbound call, or 404/400."""
     assistant = await Assistant.find_one(
-        Assistant.assistant_id == request.assistant_id,
+        Assistant.assistant_id == assistant_id,
         Assistant.assistant_created_by_email == current_user.user_email,
     )
     if not assistant:
         raise HTTPException(status_code=404, detail="Assistant not found in DB")
 
     trunk = await OutboundSIP.find_one(
-        OutboundSIP.trunk_id == request.trunk_id,
+        OutboundSIP.trunk_id == trunk_id,
         OutboundSIP.trunk_created_by_email == current_user.user_email,
         OutboundSIP.trunk_is_active == True,
     )
     if not trunk:
         raise HTTPException(status_code=404, detail="Trunk not found in DB")
 
-    if trunk.trunk_type != request.call_service:
+    if trunk.trunk_type != call_service:
         raise HTTPException(
             status_code=400,
-            detail=f"Trunk type '{trunk.trunk_type}' does not match call service '{request.call_service}'",
+            detail=f"Trunk type '{trunk.trunk_type}' does not match call service '{call_service}'",
         )
+    return assistant, trunk
+
+
+@router.post("/outbound", status_code=202)
+async def trigger_outbound_call(
+    request: TriggerOutboundCall, current_user: APIKey = Depends(get_current_user)
+):
+    logger.info(
+        f"Received outbound call request | user={current_user.user_email} "
+        f"service={request.call_service} to={request.to_number}"
+    )
+
+    assistant, trunk = await _outbound_target(
+        request.assistant_id, request.trunk_id, request.call_service, current_user
+    )
 
     queue_item = OutboundCallQueue(
         user_email=current_user.user_email,
@@ -70,6 +116,147 @@ async def trigger_outbound_call(
     )
 
 
+def _bulk_queue_id(user_email: str, batch_key: str, index: int) -> str:
+    """queue_id for row `index` of a keyed batch. Deterministic, so a resent batch collides
+    with the rows it already queued (queue_id is unique) instead of queueing them again."""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{user_email}/{batch_key}/{index}").hex
+
+
+async def _enqueue_bulk(
+    current_user: APIKey,
+    assistant_id: str,
+    trunk_id: str,
+    call_service: str,
+    rows: List[tuple[str, dict]],
+    batch_key: Optional[str],
+) -> JSONResponse:
+    """Validate the assistant and trunk once, then queue `rows` ((to_number, metadata) each)
+    with one insert_many per BULK_INSERT_CHUNK rows."""
+    logger.info(
+        f"Received bulk outbound request | user={current_user.user_email} "
+        f"service={call_service} rows={len(rows)} batch_key={batch_key}"
+    )
+    assistant, trunk = await _outbound_target(assistant_id, trunk_id, call_service, current_user)
+
+    items = [
+        OutboundCallQueue(
+            user_email=current_user.user_email,
+            assistant_id=assistant.assistant_id,
+            assistant_name=assistant.assistant_name,
+            trunk_id=trunk.trunk_id,
+            to_number=to_number,
+            call_service=call_service,
+            job_metadata=metadata,
+            batch_key=batch_key,
+            **({"queue_id": _bulk_queue_id(current_user.user_email, batch_key, index)} if batch_key else {}),
+        )
+        for index, (to_number, metadata) in enumerate(rows)
+    ]
+
+    queued = 0
+    for start in range(0, len(items), BULK_INSERT_CHUNK):
+        chunk = items[start:start + BULK_INSERT_CHUNK]
+        try:
+            result = await OutboundCallQueue.insert_many(chunk, ordered=False)
+            queued += len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Only rows a previous attempt of this batch already queued may collide.
+            if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+                raise
+            queued += e.details.get("nInserted", 0)
+
+    logger.info(
+        f"Enqueued {queued} of {len(items)} bulk outbound call(s) | "
+        f"user={current_user.user_email} batch_key={batch_key}"
+    )
+    return JSONResponse(
+        status_code=202,
+        content=apiResponse(
+            success=True,
+            message="Outbound calls queued successfully",
+            data={
+                "batch_key": batch_key,
+                "queued": queued,
+                "already_queued": len(items) - queued,
+                "queue_ids": [item.queue_id for item in items],
+            },
+        ).model_dump(),
+    )
+
+
+def _parse_bulk_csv(raw: bytes) -> List[tuple[str, dict]]:
+    """(to_number, metadata) rows from an uploaded CSV, or 400.
+
+    The file needs a to_number column; every other non-empty cell becomes a metadata
+    key of the same name.
+    """
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV must be UTF-8 encoded")
+
+    reader = csv.DictReader(io.StringIO(text))
+    if "to_number" not in (reader.fieldnames or []):
+        raise HTTPException(status_code=400, detail="CSV must have a 'to_number' header column")
+
+    rows, missing = [], []
+    for record in reader:
+        to_number = (record.get("to_number") or "").strip()
+        if not to_number or len(to_number) > 100:
+            missing.append(reader.line_num)
+            continue
+        metadata = {
+            key.strip(): value.strip()
+            for key, value in record.items()
+            if key and key != "to_number" and isinstance(value, str) and value.strip()
+        }
+        rows.append((to_number, metadata))
+        if len(rows) > BULK_OUTBOUND_MAX_ROWS:
+            raise HTTPException(status_code=400, detail=f"CSV has more than {BULK_OUTBOUND_MAX_ROWS} rows")
+
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing or invalid to_number on line(s) {', '.join(map(str, missing[:20]))}"
+            + (f" and {len(missing) - 20} more" if len(missing) > 20 else ""),
+        )
+    if not rows:
+        raise HTTPException(status_code=400, detail="CSV has no rows")
+    return rows
+
+
+@router.post("/outbound/bulk", status_code=202)
+async def trigger_bulk_outbound_call(
+    request: TriggerBulkOutboundCall, current_user: APIKey = Depends(get_current_user)
+):
+    return await _enqueue_bulk(
+        current_user,
+        request.assistant_id,
+        request.trunk_id,
+        request.call_service,
+        [(row.to_number, row.metadata or {}) for row in request.calls],
+        request.batch_key,
+    )
+
+
+@router.post("/outbound/bulk/csv", status_code=202)
+async def trigger_bulk_outbound_call_csv(
+    file: UploadFile = File(..., description="CSV with a to_number column; other columns become metadata"),
+    assistant_id: str = Form(..., min_length=1, max_length=100),
+    trunk_id: str = Form(..., min_length=1, max_length=100),
+    call_service: Literal["twilio", "exotel"] = Form(...),
+    batch_key: Optional[str] = Form(None, min_length=1, max_length=100),
+    current_user: APIKey = Depends(get_current_user),
+):
+    raw = await file.read(BULK_CSV_MAX_BYTES + 1)
+    if len(raw) > BULK_CSV_MAX_BYTES:
+        raise HTTPException(
+            status_code=413, detail=f"CSV is larger than {BULK_CSV_MAX_BYTES // (1024 * 1024)} MB"
+        )
+    rows = _parse_bulk_csv(raw)
+    return await _enqueue_bulk(current_user, assistant_id, trunk_id, call_service, rows, batch_key)
+
+
 @router.get("/queue/{queue_id}")
 async def get_queue_status(
     queue_id: str, current_user: APIKey = Depends(get_current_user)
@@ -175,54 +362,192 @@ async def trigger_passthrough_call(
     )
 
 
-@router.get("/records")
-async def list_call_records(
-    passthrough_only: bool = Query(False, description="Return only passthrough calls (no AI agent)"),
-    to_number: Optional[str] = Query(None, description="Filter by destination phone number"),
-    call_status: Optional[str] = Query(None, description="Filter by status (completed, failed, busy, no_answer, ...)"),
-    start_date: Optional[datetime] = Query(None, description="Start date for filtering (ISO 8601)"),
-    end_date: Optional[datetime] = Query(None, description="End date for filtering (ISO 8601)"),
-    sort_by: str = Query("started_at", description="Field to sort by (e.g., started_at, ended_at, call_duration_minutes)"),
-    sort_order: str = Query("desc", description="Sort order: 'asc' or 'desc'"),
-    page: int = Query(1, ge=1, description="Page number"),
-    limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    current_user: APIKey = Depends(get_current_user),
-):
+def _record_filters(
+    current_user: APIKey,
+    passthrough_only: bool = False,
+    to_number: Optional[str] = None,
+    assistant_id: Optional[str] = None,
+    call_status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> list:
     query_conditions = [CallRecord.created_by_email == current_user.user_email]
 
     if passthrough_only:
         query_conditions.append(CallRecord.is_passthrough == True)
     if to_number:
         query_conditions.append(CallRecord.to_number == to_number)
+    if assistant_id:
+        query_conditions.append(CallRecord.assistant_id == assistant_id)
     if call_status:
         query_conditions.append(CallRecord.call_status == call_status)
     if start_date:
         query_conditions.append(CallRecord.started_at >= start_date)
     if end_date:
         query_conditions.append(CallRecord.started_at <= end_date)
+    return query_conditions
 
-    sort_field = f"{'-' if sort_order == 'desc' else '+'}{sort_by}"
-    skip = (page - 1) * limit
 
-    records_query = CallRecord.find(*query_conditions)
-    total = await records_query.count()
-    records = await records_query.sort(sort_field).skip(skip).limit(limit).to_list()
+@router.get("/records")
+async def list_call_records(
+    passthrough_only: bool = Query(False, description="Return only passthrough calls (no AI agent)"),
+    to_number: Optional[str] = Query(None, description="Filter by destination phone number"),
+    call_status: Optional[str] = Query(None, description="Filter by status (completed, failed, busy, no_answer, ...)"),
+    start_date: Optional[datetime] = Query(None, description="Start date for filtering (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date for filtering (ISO 8601)"),
+    sort_by: str = Query("started_at", description="Field to sort by (e.g., started_at, ended_at, call_duration_minutes)"),
+    sort_order: str = Query("desc", description="Sort order: 'asc' or 'desc'"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    include: Optional[Literal["transcripts"]] = Query(None, description="Embed each call's transcript lines (omitted by default; see /call/records/{room_name}/transcript)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page. Pages by index seek instead of skip; ignores page. Requires sort_by=started_at"),
+    current_user: APIKey = Depends(get_current_user),
+):
+    descending = sort_order == "desc"
+    keyset = sort_by == "started_at"
+    if cursor and not keyset:
+        raise HTTPException(status_code=400, detail="cursor pagination requires sort_by=started_at")
+
+    query_conditions = _record_filters(
+        current_user,
+        passthrough_only=passthrough_only,
+        to_number=to_number,
+        call_status=call_status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    sort_field = keyset_sort("started_at", descending) if keyset else f"{'-' if descending else '+'}{sort_by}"
+
+    if cursor:
+        records_query = CallRecord.find(*query_conditions, cursor_filter(cursor, "started_at", descending))
+        total = None
+    else:
+        records_query = CallRecord.find(*query_conditions)
+        total = await records_query.count()
+        records_query = records_query.skip((page - 1) * limit)
+    records = await records_query.sort(sort_field).limit(limit).project(CallRecordSummary).to_list()
+    record_data = [r.model_dump(exclude={"id"}) for r in records]
+    if include == "transcripts":
+        transcripts = await _livekit_services.get_transcripts([r.room_name for r in records])
+        for record in record_data:
+            record["transcripts"] = transcripts.get(record["room_name"], [])
 
     return apiResponse(
         success=True,
         message="Call records fetched successfully",
         data={
-            "records": [r.model_dump(exclude={"id"}) for r in records],
-            "pagination": {
-                "total": total,
-                "page": page,
-                "limit": limit,
-                "total_pages": (total + limit - 1) // limit,
-            },
+            "records": record_data,
+            "pagination": page_meta(
+                records, limit, total=total, page=page,
+                keyset_field="started_at" if keyset else None, descending=descending,
+            ),
         },
     )
 
 
+async def _export_batches(records, with_transcripts: bool, flatten: bool) -> AsyncIterator[List[dict]]:
+    """Group the record cursor into EXPORT_BATCH_SIZE rows of JSON-ready dicts.
+
+    Transcripts are fetched one query per batch. flatten (CSV) turns each transcript line
+    into its own row with the call's columns repeated; a call with no lines keeps one row.
+    """
+
+    async def encode(batch):
+        rows = [r.model_dump(mode="json", exclude={"id"}) for r in batch]
+        if not with_transcripts:
+            return rows
+        transcripts = to_jsonable_python(await _livekit_services.get_transcripts([r["room_name"] for r in rows]))
+        if not flatten:
+            for row in rows:
+                row["transcripts"] = transcripts.get(row["room_name"], [])
+            return rows
+        flat = []
+        for row in rows:
+            for line in transcripts.get(row["room_name"]) or [{}]:
+                flat.append({
+                    **row,
+                    "transcript_speaker": line.get("speaker"),
+                    "transcript_text": line.get("text"),
+                    "transcript_timestamp": line.get("timestamp"),
+                })
+        return flat
+
+    batch = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) == EXPORT_BATCH_SIZE:
+            yield await encode(batch)
+            batch = []
+    if batch:
+        yield await encode(batch)
+
+
+@router.get("/records/export")
+async def export_call_records(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson (one call per line) or csv"),
+    assistant_id: Optional[str] = Query(None, description="Filter by assistant"),
+    call_status: Optional[str] = Query(None, description="Filter by status (completed, failed, busy, no_answer, ...)"),
+    start_date: Optional[datetime] = Query(None, description="Start date for filtering (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date for filtering (ISO 8601)"),
+    passthrough_only: bool = Query(False, description="Export only passthrough calls (no AI agent)"),
+    include: Optional[Literal["transcripts"]] = Query(None, description="Add transcript lines: nested per call in ndjson, one row per line in csv"),
+    current_user: APIKey = Depends(get_current_user),
+):
+    """Stream every matching call record, oldest first, without paging.
+
+    Reads from a Mongo cursor in EXPORT_BATCH_SIZE batches and writes each batch out
+    before reading the next, so memory stays flat however large the export.
+    """
+    query_conditions = _record_filters(
+        current_user,
+        passthrough_only=passthrough_only,
+        assistant_id=assistant_id,
+        call_status=call_status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    records = (
+        CallRecord.find(*query_conditions, batch_size=EXPORT_BATCH_SIZE)
+        .sort(keyset_sort("started_at", descending=False))
+        .project(CallRecordSummary)
+    )
+    with_transcripts = include == "transcripts"
+    batches = _export_batches(records, with_transcripts, flatten=format == "csv")
+
+    logger.info(
+        f"Exporting call records | user={current_user.user_email} format={format} "
+        f"assistant={assistant_id} transcripts={with_transcripts}"
+    )
+    if format == "csv":
+        columns = _EXPORT_COLUMNS + (_TRANSCRIPT_COLUMNS if with_transcripts else [])
+        body, media_type = csv_chunks(batches, columns), "text/csv"
+    else:
+        body, media_type = ndjson_chunks(batches), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="call-records.{format}"'},
+    )
+
+
+@router.get("/records/{room_name}/transcript")
+async def get_call_transcript(room_name: str, current_user: APIKey = Depends(get_current_user)):
+    # Ownership check only needs to know the record exists — don't load it.
+    owned = await CallRecord.find_one(
+        CallRecord.room_name == room_name,
+        CallRecord.created_by_email == current_user.user_email,
+    ).project(_CallRecordRoom)
+    if not owned:
+        raise HTTPException(status_code=404, detail="Call record not found")
+
+    transcripts = [line async for line in _livekit_services.iter_transcript(room_name)]
+    return apiResponse(
+        success=True,
+        message="Call transcript fetched successfully",
+        data={"room_name": room_name, "transcripts": transcripts},
+    )
+
+
 @router.post("/end_call")
 async def end_call(request: Request, _: dict = Body(...)):
     from src.core.providers.keys import mask_secret_values
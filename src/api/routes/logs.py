@@ -2,6 +2,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends
 from src.api.dependencies import get_current_user
 from src.api.models.response_models import apiResponse
+from src.api.pagination import cursor_filter, keyset_sort, next_cursor
 from src.core.db.db_schemas import APIKey, ActivityLog
 
 router = APIRouter()
@@ -14,11 +15,14 @@ async def get_activity_logs(
     room_name: Optional[str] = None,     # filter to a specific call
     page: int = 1,
     limit: int = 50,
+    cursor: Optional[str] = None,        # next_cursor from the previous page; ignores page
     current_user: APIKey = Depends(get_current_user),
 ):
-    """Return paginated activity logs scoped to the authenticated user."""
+    """Return paginated activity logs scoped to the authenticated user, newest first.
+
+    Pages by offset (page) or, given a cursor, by (timestamp, _id) keyset.
+    """
     limit = min(limit, 100)  # cap at 100 per page
-    skip = (page - 1) * limit
 
     # Base filter — always scope to requesting user
     filters = {"user_email": current_user.user_email}
@@ -29,9 +33,14 @@ async def get_activity_logs(
     if room_name:
         filters["room_name"] = room_name
 
-    query = ActivityLog.find(filters)
-    total = await query.count()
-    logs = await query.sort(-ActivityLog.timestamp).skip(skip).limit(limit).to_list()
+    if cursor:
+        query = ActivityLog.find(filters, cursor_filter(cursor, "timestamp", descending=True))
+        total = None
+    else:
+        query = ActivityLog.find(filters)
+        total = await query.count()
+        query = query.skip((page - 1) * limit)
+    logs = await query.sort(keyset_sort("timestamp", descending=True)).limit(limit).to_list()
 
     # Serialize — exclude internal Beanie _id
     log_list = []
@@ -45,7 +54,8 @@ async def get_activity_logs(
         data={
             "logs": log_list,
             "total": total,
-            "page": page,
+            "page": None if cursor else page,
             "limit": limit,
+            "next_cursor": next_cursor(logs, "timestamp", descending=True, limit=limit),
         },
     )
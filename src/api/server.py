@@ -26,6 +26,7 @@ from starlette.routing import Route
 from src.api.mcp_docs import asgi_app as docs_mcp_asgi, mcp as docs_mcp
 from src.core.logger import setup_logging, logger
 from src.core.db.database import init_db, close_db
+from src.api.dependencies.key_cache import watch_api_keys
 from src.api.models.response_models import apiResponse
 
 # Setup logging
@@ -38,6 +39,7 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
 
+    api_key_watch_task = asyncio.create_task(watch_api_keys())
     dispatcher_task = None
 
     # ENABLE_SIP_LISTENER / ENABLE_DISPATCHER default to "true" so existing single-container
@@ -62,6 +64,7 @@ async def lifespan(app: FastAPI):
         yield
 
     # Shutdown
+    api_key_watch_task.cancel()
     if dispatcher_task is not None:
         dispatcher_task.cancel()
     await close_db()
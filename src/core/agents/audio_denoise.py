@@ -23,6 +23,10 @@ Two stages:
 2. Silero VAD v5 (ONNX, CPU) — non-speech audio is zeroed, so noise cannot register as
    speech-start no matter how sensitive the model's VAD is.
 
+Other consumers of the caller's audio (the Sarvam transcription tap) subscribe() to the
+gate that already runs on the session input rather than building their own: one APM pass,
+one resample and one VAD per caller track, fanned out.
+
 AGC and AEC are deliberately off. AGC re-amplified the agent's own echo into false
 barge-ins the last time it was enabled (see docs/architecture/audio-pipeline.md), and AEC
 needs a reverse stream that RoomIO never feeds a FrameProcessor.
@@ -30,7 +34,9 @@ needs a reverse stream that RoomIO never feeds a FrameProcessor.
 
 from __future__ import annotations
 
+import contextlib
 import os
+from typing import Callable
 
 import numpy as np
 import onnxruntime as ort
@@ -72,31 +78,58 @@ the line sounding dead between sentences."""
 _VAD_RATE = 16000
 _VAD_WINDOW = 512
 _VAD_CONTEXT = 64
+_VAD_SR = np.array(_VAD_RATE, dtype=np.int64)
+
+_session: ort.InferenceSession | None = None
+
+
+def _vad_session() -> ort.InferenceSession:
+    """The process's Silero session, shared by every SpeechGate in it.
+
+    The model's recurrent state is an input, not part of the session, so each gate keeps
+    its own and one session serves them all — loaded and planned once per process rather
+    than once per gate. ORT sessions are safe to run concurrently.
+    """
+    global _session
+    if _session is None:
+        # One core, not all of them: a worker host runs many calls at once and ORT grabs
+        # every core by default.
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = 1
+        opts.inter_op_num_threads = 1
+        _session = ort.InferenceSession(
+            _MODEL_PATH, sess_options=opts, providers=["CPUExecutionProvider"]
+        )
+    return _session
 
 
 class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
     """Suppresses noise and mutes non-speech audio before it reaches the LLM.
 
     Stateful — the APM and the VAD both carry state across frames, so use one instance per
-    audio stream, never share.
+    audio stream, never share. Other consumers of the same track subscribe() instead.
     """
 
     def __init__(self) -> None:
         self._enabled = True
         self._apm = rtc.AudioProcessingModule(noise_suppression=True, high_pass_filter=True)
 
-        # One core per stream, not all of them: a worker runs many sessions concurrently
-        # and ORT grabs every core by default.
-        opts = ort.SessionOptions()
-        opts.intra_op_num_threads = 1
-        opts.inter_op_num_threads = 1
-        self._vad = ort.InferenceSession(
-            _MODEL_PATH, sess_options=opts, providers=["CPUExecutionProvider"]
-        )
-
+        # A 512-sample window is so small that building the feed dict and the output arrays
+        # was a fifth of each run. The buffers are allocated and bound once instead, and
+        # _speech_prob only writes into them — never rebinds, so the binding stays valid.
+        self._vad = _vad_session()
+        self._pcm = np.zeros((1, _VAD_CONTEXT + _VAD_WINDOW), dtype=np.float32)
         self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._state_out = np.zeros_like(self._state)
+        self._prob = np.zeros((1, 1), dtype=np.float32)
+        self._binding = self._vad.io_binding()
+        self._binding.bind_cpu_input("input", self._pcm)
+        self._binding.bind_cpu_input("state", self._state)
+        self._binding.bind_cpu_input("sr", _VAD_SR)
+        for name, out in (("output", self._prob), ("stateN", self._state_out)):
+            self._binding.bind_output(name, "cpu", 0, np.float32, list(out.shape), out.ctypes.data)
+
         self._carry = np.empty(0, dtype=np.int16)
-        self._context = np.zeros(_VAD_CONTEXT, dtype=np.float32)
         self._resampler: rtc.AudioResampler | None = None
         self._input_rate = 0
         self._hangover_ms = 0.0
@@ -105,6 +138,47 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
         # ponytail: a strong reference, not id(), so a freed frame's address cannot be
         # reused and alias the next one. See _process for why this exists at all.
         self._last_frame: rtc.AudioFrame | None = None
+        self._subscribers: list[Callable[[rtc.AudioFrame, bool], None]] = []
+
+    def warm_up(self) -> None:
+        """Run one silent window through the VAD, then reset its state.
+
+        ORT allocates and plans on a session's first run; doing that here (in the worker's
+        prewarm) keeps it off the call's first frames.
+        """
+        self._speech_prob(np.zeros(_VAD_WINDOW, dtype=np.int16))
+        self._state[...] = 0.0
+        self._pcm[...] = 0.0
+
+    def subscribe(self, consumer: Callable[[rtc.AudioFrame, bool], None]) -> None:
+        """Also hand every gated frame to `consumer(frame, open)`, as 16 kHz mono.
+
+        The frames are the VAD's denoised 16 kHz copy with the gate's decision applied, so
+        a subscriber costs one frame copy, not another APM, resample and VAD. `open` is
+        that decision — False means the frame was gated to silence. `muted` is not
+        applied: the guard keeps the caller from the model, not from a transcript.
+        Multi-channel input, which the VAD skips, is downmixed and handed over ungated
+        with `open` True, just as the model gets it ungated.
+        Called synchronously from `_process`, on the event loop; it must not block.
+        """
+        self._subscribers.append(consumer)
+
+    def unsubscribe(self, consumer: Callable[[rtc.AudioFrame, bool], None]) -> None:
+        with contextlib.suppress(ValueError):
+            self._subscribers.remove(consumer)
+
+    def _publish(self, pcm: np.ndarray, open_: bool) -> None:
+        if not open_:
+            pcm = (pcm * _ATTENUATION).astype(np.int16)
+        out = rtc.AudioFrame(
+            data=pcm.tobytes(), sample_rate=_VAD_RATE, num_channels=1, samples_per_channel=len(pcm)
+        )
+        for consumer in list(self._subscribers):
+            try:
+                consumer(out, open_)
+            except Exception as e:
+                # A broken transcript tap must not take the model's audio down with it.
+                logger.error(f"SpeechGate: subscriber failed | {e}")
 
     @property
     def enabled(self) -> bool:
@@ -132,14 +206,12 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
 
     def _speech_prob(self, chunk: np.ndarray) -> float:
         """Speech probability for one VAD window of int16 samples."""
-        window = chunk.astype(np.float32) / 32768.0
-        pcm = np.concatenate((self._context, window))[np.newaxis, :]
-        out, self._state = self._vad.run(
-            None,
-            {"input": pcm, "state": self._state, "sr": np.array(_VAD_RATE, dtype=np.int64)},
-        )
-        self._context = window[-_VAD_CONTEXT:]
-        return float(out[0][0])
+        # _pcm is [context | window]; the context is the previous window's tail.
+        np.multiply(chunk, 1.0 / 32768.0, out=self._pcm[0, _VAD_CONTEXT:], casting="unsafe")
+        self._vad.run_with_iobinding(self._binding)
+        self._state[...] = self._state_out
+        self._pcm[0, :_VAD_CONTEXT] = self._pcm[0, -_VAD_CONTEXT:]
+        return float(self._prob[0, 0])
 
     def _vad_samples(self, frame: rtc.AudioFrame) -> np.ndarray:
         """The frame's audio at Silero's rate. Only a copy is resampled — the frame the LLM
@@ -163,7 +235,6 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
         # zeroes non-speech samples, then the second pass runs the VAD over those zeros,
         # scores them as silence, and decrements `_hangover_ms` a second time. The 600 ms
         # hangover below would behave like 300 ms, cutting the gate mid-sentence.
-        # The tap in stt/sarvam_parallel.py builds its own AudioStream and is applied once.
         # ponytail: harmless no-op if the SDK ever stops double-wiring.
         if frame is self._last_frame:
             return frame
@@ -180,6 +251,16 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
                 logger.warning(
                     f"SpeechGate: VAD skipped, expected mono | channels={frame.num_channels}"
                 )
+            if self._subscribers:
+                mono = np.asarray(frame.data).reshape(-1, frame.num_channels).mean(axis=1)
+                vad_pcm = self._vad_samples(rtc.AudioFrame(
+                    data=mono.astype(np.int16).tobytes(),
+                    sample_rate=frame.sample_rate,
+                    num_channels=1,
+                    samples_per_channel=frame.samples_per_channel,
+                ))
+                if len(vad_pcm):
+                    self._publish(vad_pcm, True)
             return frame
 
         samples = np.asarray(frame.data)
@@ -190,7 +271,8 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
         # attenuated if speech begins in the trailing sub-window bytes. If callers report
         # clipped first words, return a 3-frame-delayed frame (~150 ms constant latency)
         # rather than dropping _THRESHOLD into the noise floor.
-        self._carry = np.concatenate((self._carry, self._vad_samples(frame)))
+        vad_pcm = self._vad_samples(frame)
+        self._carry = np.concatenate((self._carry, vad_pcm))
         speech = False
         while len(self._carry) >= _VAD_WINDOW:
             if self._speech_prob(self._carry[:_VAD_WINDOW]) >= _THRESHOLD:
@@ -203,6 +285,10 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
         else:
             self._hangover_ms = max(0.0, self._hangover_ms - frame_ms)
 
+        # Before the samples below are touched: at 16 kHz vad_pcm is a view of them.
+        if self._subscribers and len(vad_pcm):
+            self._publish(vad_pcm, speech or self._hangover_ms > 0.0)
+
         # The guard outranks the gate, and it blanks hard — _ATTENUATION is a gate knob, not
         # a guard one. Applied after the VAD ran on real audio so hangover state stays
         # honest across the muted stretch.
@@ -216,4 +302,5 @@ class SpeechGate(rtc.FrameProcessor[rtc.AudioFrame]):
         return frame
 
     def _close(self) -> None:
-        self._vad = None
+        # The session is the process's; only this gate's binding goes.
+        self._binding = None
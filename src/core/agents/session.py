@@ -4,6 +4,7 @@ from livekit import rtc
 from livekit.agents import (
     AgentSession,
     JobContext,
+    JobProcess,
     WorkerOptions,
     cli,
     inference,
@@ -34,7 +35,7 @@ from src.core.logger import logger, setup_logging, set_room_context
 from src.core.agents.audio_denoise import SpeechGate
 from src.core.agents.dynamic_assistant import DynamicAssistant
 from src.core.agents.inbound_context import log_missing_strategy, resolve_inbound_context
-from src.core.agents.session_lifecycle import CallReadinessGate, RecordingManager
+from src.core.agents.session_lifecycle import CallReadinessGate, RecordingManager, StartupTimer, TranscriptWriter
 from src.core.agents.llm import DEFAULT_MODEL as DEFAULT_CASCADE_LLM_MODEL, create_llm
 from src.core.model_support.capabilities import (
     DEFAULT_GEMINI_LIVE_MODEL,
@@ -46,6 +47,7 @@ from src.core.model_support.capabilities import (
 from src.core.agents.tts import create_tts, maintain_sarvam_connection
 from src.core.agents.stt import (
     FinalCoalescer,
+    SilenceSuppressor,
     create_stt,
     build_native_stt_prompt,
     noise_reduction_for,
@@ -169,13 +171,30 @@ async def play_prerecorded_greeting(
             os.remove(tmp_path)
 
 
+def prewarm(proc: JobProcess) -> None:
+    """Runs in each idle worker process before it is handed a job.
+
+    Builds what entrypoint() would otherwise build on the way to first audio and that
+    needs no event loop: the SpeechGate (APM + Silero ONNX session), warmed with one
+    inference. Provider plugins are already imported along with this module. Mongo and
+    HTTP clients are not created here — they bind to the job's event loop, which only
+    exists once the job starts.
+    """
+    gate = SpeechGate()
+    gate.warm_up()
+    proc.userdata["speech_gate"] = gate
+
+
 async def entrypoint(ctx: JobContext):
-    # Ensure database connection
+    startup = StartupTimer(prewarmed="speech_gate" in ctx.proc.userdata)
+
+    # Ensure database connection. Indexes are the API's job; see connect_db().
     try:
-        await Database.connect_db()
+        await Database.connect_db(skip_indexes=True)
     except Exception as e:
         logger.error(f"Failed to connect to database in worker: {e}")
         return
+    startup.mark("db")
 
     # Retrieve agent ID from room name
     room_name = ctx.room.name
@@ -188,6 +207,7 @@ async def entrypoint(ctx: JobContext):
     if not assistant:
         logger.error(f"No assistant found for identifier: {assistant_id}")
         return
+    startup.mark("assistant")
 
     # Kick off the prerecorded-greeting lookup + S3 download now, in parallel with the rest
     # of session setup below, instead of starting it cold once we're actually about to speak
@@ -216,6 +236,25 @@ async def entrypoint(ctx: JobContext):
             "Valid values are 'pipeline', 'realtime' and 'cascade'."
         )
 
+    # Tool definitions depend only on the assistant, so fetch them now, alongside the
+    # greeting prefetch and the inbound-context lookup below, rather than after them.
+    # Every job runs in a fresh worker process, so there is no warm cache to hit: the
+    # saving is in not doing the config round-trips one after another.
+    _tools_task = None
+    if assistant.tool_ids:
+        _tools_task = asyncio.create_task(
+            build_tools_from_db(
+                assistant.tool_ids,
+                user_email=assistant.assistant_created_by_email,
+                room_name=room_name,
+                assistant_id=assistant_id,
+                # Only cascade talks to the Responses API, which is where `strict` on a
+                # function tool means anything. The Realtime API has no such field and
+                # errors on the unknown key.
+                strict_schemas=is_cascade,
+            )
+        )
+
     # Extract metadata from job metadata
     to_number = "Web Call"
     job_metadata = {}
@@ -316,21 +355,11 @@ async def entrypoint(ctx: JobContext):
     gate = CallReadinessGate(is_exotel_outbound)
     recorder = RecordingManager(livekit_services, room_name, assistant_id)
 
-    # Bounded queue serializes transcript DB writes off the audio hot path.
-    # put_nowait on the event handler never blocks; single consumer drains async.
-    _transcript_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-
-    async def _transcript_worker():
-        while True:
-            fn = await _transcript_queue.get()
-            try:
-                await fn()
-            except Exception as e:
-                logger.error(f"Transcript write failed | room={room_name}: {e}")
-            finally:
-                _transcript_queue.task_done()
-
-    transcript_worker = asyncio.create_task(_transcript_worker())
+    # Transcript lines are buffered and written in batches off the audio hot path:
+    # add() on the event handler never blocks; one background task does the DB writes.
+    # The write closure is bound below, once the assistant and job metadata are known.
+    transcript_writer = TranscriptWriter(lambda entries: _write_transcripts(entries))
+    transcript_writer.start()
 
     # Start recording immediately for non-Exotel calls. Text-only web chats have no audio.
     if not is_exotel_outbound and not is_text_only:
@@ -338,18 +367,9 @@ async def entrypoint(ctx: JobContext):
 
     # --- Load Tools ---
     tools = []
-    if assistant.tool_ids:
+    if _tools_task is not None:
         try:
-            tools = await build_tools_from_db(
-                assistant.tool_ids,
-                user_email=assistant.assistant_created_by_email,
-                room_name=room_name,
-                assistant_id=assistant_id,
-                # Only cascade talks to the Responses API, which is where `strict` on a
-                # function tool means anything. The Realtime API has no such field and
-                # errors on the unknown key.
-                strict_schemas=is_cascade,
-            )
+            tools = await _tools_task
             logger.info(f"Loaded {len(tools)} tool(s) for assistant {assistant.assistant_id}")
         except Exception as e:
             logger.error(f"Failed to load tools: {e}", exc_info=True)
@@ -385,6 +405,8 @@ async def entrypoint(ctx: JobContext):
                 stt_provider=(assistant.assistant_stt_model or "sarvam") if is_cascade else None,
                 call_service=telephony_provider,
                 call_duration_minutes=call_duration,
+                stt_silence_skipped_seconds=_sarvam_suppressor.skipped_seconds if _sarvam_suppressor else 0.0,
+                stt_silence_skipped_bytes=_sarvam_suppressor.skipped_bytes if _sarvam_suppressor else 0,
                 **metered,
             )
             await usage.insert()
@@ -399,6 +421,8 @@ async def entrypoint(ctx: JobContext):
 
     _sarvam_stop = asyncio.Event()
     _sarvam_task: asyncio.Task | None = None
+    # Kept out here so _persist_usage can read what the tap held back.
+    _sarvam_suppressor: SilenceSuppressor | None = None
     # Assigned below, once _enqueue_transcript exists. Declared here because teardown reads it.
     _user_coalescer: FinalCoalescer | None = None
 
@@ -476,15 +500,9 @@ async def entrypoint(ctx: JobContext):
                 await asyncio.sleep(END_OF_CALL_GRACE_S)
         if _user_coalescer is not None:
             _user_coalescer.flush()
-        # No new transcripts past this point, so the queue below can be joined.
+        # No new transcripts past this point, so the writer can make its final flush.
         _transcripts_closed = True
-        # Drain transcript queue before ending (max 3s).
-        try:
-            await asyncio.wait_for(_transcript_queue.join(), timeout=3.0)
-        except asyncio.TimeoutError:
-            logger.warning("Timed out waiting for pending transcripts")
-        transcript_worker.cancel()
-        await asyncio.gather(transcript_worker, return_exceptions=True)
+        await transcript_writer.close(timeout=3.0)
         await _persist_usage()
         try:
             rec = await CallRecord.find_one(CallRecord.room_name == ctx.room.name)
@@ -834,7 +852,9 @@ async def entrypoint(ctx: JobContext):
     user_is_speaking = False
     # Built here rather than inline in RoomOptions because InputGuardController mutes
     # through it. Text-only chats have no audio input, so there is nothing to gate.
-    speech_gate = None if is_text_only else SpeechGate()
+    # The prewarmed gate if this process has one (see prewarm()); each job gets a fresh
+    # process, so it is never handed to a second call.
+    speech_gate = None if is_text_only else (ctx.proc.userdata.pop("speech_gate", None) or SpeechGate())
     silence_watchdog = (
         SilenceWatchdogController(
             session=session,
@@ -898,31 +918,28 @@ async def entrypoint(ctx: JobContext):
         delete_room_on_close=False,
     )
 
+    def _write_transcripts(entries: list[dict]):
+        return livekit_services.add_transcripts(
+            room_name=ctx.room.name,
+            entries=entries,
+            assistant_id=assistant_id,
+            assistant_name=assistant.assistant_name,
+            to_number=to_number,
+            recording_path=recorder.s3_url,
+            created_by_email=assistant.assistant_created_by_email,
+            call_type=job_metadata.get("call_type"),
+            call_service=job_metadata.get("call_service") or job_metadata.get("service"),
+            platform_number=job_metadata.get("inbound_number"),
+        )
+
     def _enqueue_transcript(speaker: str, text: str, timestamp: datetime | None = None) -> None:
         if _transcripts_closed:
             return
-        # Stamped here, not at DB-write time: the queue and the Mongo round-trip both add
+        # Stamped here, not at DB-write time: batching and the Mongo round-trip both add
         # latency, and the Sarvam tap passes the time the caller actually started talking.
         timestamp = timestamp or datetime.now(timezone.utc)
-        try:
-            _transcript_queue.put_nowait(
-                lambda: livekit_services.add_transcript(
-                    room_name=ctx.room.name,
-                    speaker=speaker,
-                    text=text,
-                    timestamp=timestamp,
-                    assistant_id=assistant_id,
-                    assistant_name=assistant.assistant_name,
-                    to_number=to_number,
-                    recording_path=recorder.s3_url,
-                    created_by_email=assistant.assistant_created_by_email,
-                    call_type=job_metadata.get("call_type"),
-                    call_service=job_metadata.get("call_service") or job_metadata.get("service"),
-                    platform_number=job_metadata.get("inbound_number"),
-                )
-            )
-        except asyncio.QueueFull:
-            logger.warning(f"Transcript queue full, dropping | room={room_name}")
+        if not transcript_writer.add(speaker, text, timestamp):
+            logger.warning(f"Transcript buffer full, dropping | room={room_name}")
 
     def _on_user_utterance(text: str, started_at: datetime) -> None:
         _enqueue_transcript("user", text, timestamp=started_at)
@@ -971,6 +988,7 @@ async def entrypoint(ctx: JobContext):
     logger.info("Starting AgentSession...")
     await session.start(agent=agent_instance, room=ctx.room, room_options=room_options)
     logger.info("AgentSession started successfully")
+    startup.mark("session_started")
     # Tell the dispatcher's silent-agent watchdog we actually made it into the room —
     # SIP can mark a call "answered" with no agent behind it (crash, provider outage,
     # worker overload); this timestamp is the thing that tells the difference.
@@ -995,6 +1013,8 @@ async def entrypoint(ctx: JobContext):
 
     @session.on("agent_state_changed")
     def on_agent_state_changed(event):
+        if event.new_state == "speaking":
+            startup.finish()
         if hold_controller.is_on_hold and event.new_state == "speaking":
             session.interrupt()
         # The agent talking means the user's turn is over — emit the buffered utterance now
@@ -1136,6 +1156,7 @@ async def entrypoint(ctx: JobContext):
 
     # Sarvam Saras v3 parallel STT — overrides user transcript when half-cascade + sarvam selected.
     if _use_sarvam_stt:
+        _sarvam_suppressor = SilenceSuppressor()
         # Held, not fire-and-forget: teardown awaits this to get the last utterance, and a
         # crash inside it would otherwise cost every user transcript with only a stray
         # "exception was never retrieved" warning.
@@ -1149,6 +1170,9 @@ async def entrypoint(ctx: JobContext):
             language=_stt_config.get("language"),
             mode=_stt_config.get("mode"),
             assistant_id=assistant.assistant_id,
+            # The tap shares the input gate's APM/VAD pass instead of running its own.
+            speech_gate=speech_gate,
+            suppressor=_sarvam_suppressor,
         ))
 
     # --- Start Instruction ---
@@ -1275,6 +1299,7 @@ if __name__ == "__main__":
             ws_url=settings.LIVEKIT_URL,
             job_memory_warn_mb=1024,
             entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
             agent_name="api-agent",
             num_idle_processes=2,
             load_threshold=0.65,  # stop accepting new jobs at 65% CPU (default dev=inf)
@@ -1,10 +1,38 @@
 """Call readiness gating and recording management for the agent session."""
 
 import asyncio
+import time
 
 from src.core.logger import logger
 
 
+class StartupTimer:
+    """Milestones from job start to the agent's first audio, logged once as one line.
+
+    Shows what a job pays before the caller hears anything, and what the worker's prewarm
+    saves. Times are milliseconds since the timer was created; a milestone keeps its first
+    mark.
+    """
+
+    def __init__(self, prewarmed: bool):
+        self._started = time.perf_counter()
+        self._marks: dict[str, int] = {}
+        self._prewarmed = prewarmed
+        self._logged = False
+
+    def mark(self, name: str) -> None:
+        self._marks.setdefault(name, round((time.perf_counter() - self._started) * 1000))
+
+    def finish(self, name: str = "first_audio") -> None:
+        """Mark the last milestone and log them all. Later calls are no-ops."""
+        if self._logged:
+            return
+        self._logged = True
+        self.mark(name)
+        marks = " ".join(f"{key}={ms}ms" for key, ms in self._marks.items())
+        logger.info(f"Job startup | prewarmed={self._prewarmed} | {marks}")
+
+
 class CallReadinessGate:
     """Single gate that controls all agent activity for Exotel outbound calls.
 
@@ -105,3 +133,76 @@ class RecordingManager:
         if self._start_task and not self._start_task.cancelled():
             self._start_success = bool(self._start_task.result())
         return self._start_success
+
+
+class TranscriptWriter:
+    """Batches transcript lines into one Mongo append per flush instead of one per utterance.
+
+    Lines are buffered in memory and written by a single background task as soon as
+    `max_batch` are waiting or `max_delay` seconds after the first of a batch arrived,
+    whichever comes first. Every write is a round-trip plus an update of the CallRecord,
+    so a call pays that once per batch rather than once per line.
+
+    `write` receives a list of {speaker, text, timestamp} dicts. A failed write is logged
+    and its batch dropped, as a failed single-line write always was.
+    """
+
+    def __init__(self, write, max_batch: int = 20, max_delay: float = 0.5, max_pending: int = 1000):
+        self._write = write
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._max_pending = max_pending
+        self._pending: list[dict] = []
+        self._wake = asyncio.Event()  # at least one line pending
+        self._full = asyncio.Event()  # a whole batch pending, or closing — flush now
+        self._closing = False
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def add(self, speaker: str, text: str, timestamp) -> bool:
+        """Queue one line without blocking. False if it was dropped."""
+        if self._closing:
+            return False
+        if len(self._pending) >= self._max_pending:
+            return False
+        self._pending.append({"speaker": speaker, "text": text, "timestamp": timestamp})
+        self._wake.set()
+        if len(self._pending) >= self._max_batch:
+            self._full.set()
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self._max_delay)
+            except asyncio.TimeoutError:
+                pass
+            if not self._closing:
+                self._full.clear()
+            self._wake.clear()
+            batch, self._pending = self._pending, []
+            if batch:
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    logger.error(f"Transcript write failed, dropped {len(batch)} lines: {e}")
+            if self._closing and not self._pending:
+                return
+
+    async def close(self, timeout: float) -> None:
+        """Flush whatever is pending and stop. Waits at most `timeout` seconds."""
+        self._closing = True
+        self._wake.set()
+        self._full.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out flushing transcripts, dropped {len(self._pending)} lines")
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
@@ -2,11 +2,13 @@ from src.core.agents.stt.factory import create_stt, resolve_stt
 from src.core.agents.stt.native_prompt import build_native_stt_prompt, noise_reduction_for
 from src.core.agents.stt.sarvam_parallel import (
     FinalCoalescer,
+    SilenceSuppressor,
     run_sarvam_parallel_stt,
 )
 
 __all__ = [
     "FinalCoalescer",
+    "SilenceSuppressor",
     "build_native_stt_prompt",
     "create_stt",
     "noise_reduction_for",
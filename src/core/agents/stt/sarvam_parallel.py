@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from collections import deque
 from datetime import datetime, timezone
 from typing import Callable
 
@@ -31,6 +32,22 @@ MERGE_WINDOW_S = 1.0
 # the sub-chunk tail over the plugin's 50 ms boundary. Same trick the SDK uses on its own STT
 # (agents/voice/audio_recognition.py::commit_user_turn).
 DRAIN_SILENCE_S = 2.0
+
+# What the tap streams while SpeechGate is closed. Most of a call is the caller listening,
+# and every gated frame used to go upstream — billed and base64-encoded like speech. Only
+# these pads are sent now; the rest is held back and counted (SilenceSuppressor):
+PRE_ROLL_S = 0.3
+"""Closed-gate audio sent just ahead of a speech onset, so Sarvam's VAD sees a quiet lead-in
+rather than speech starting on the stream's first sample."""
+TRAILING_SILENCE_S = 1.0
+"""Closed-gate audio sent after speech, on top of the gate's own 600 ms hangover. Sarvam's
+server VAD must see the silence to endpoint (see MERGE_WINDOW_S: it does so within a few
+hundred ms), and a pause shorter than this reaches it exactly as before."""
+KEEPALIVE_INTERVAL_S = 1.0
+"""Past the trailing pad, one frame of silence per this much held-back audio. Keeps the
+websocket fed, and carries the plugin's pending flush: it only sends one when the next frame
+arrives (see DRAIN_SILENCE_S)."""
+
 # 20 ms of digital silence at 16 kHz mono int16. Reused — the plugin only reads it.
 _SILENCE_FRAME = rtc.AudioFrame(
     b"\x00" * 640, sample_rate=16000, num_channels=1, samples_per_channel=320
@@ -92,6 +109,88 @@ class FinalCoalescer:
             logger.error(f"[SARVAM-STT] emit callback error: {e}")
 
 
+_EPS = 1e-6  # summed frame durations drift; 10 x 0.05 s is just under 0.5 s
+
+
+class SilenceSuppressor:
+    """Picks which gated frames the tap streams to Sarvam, and counts the rest.
+
+    Fed every frame with SpeechGate's decision. Open frames always go, preceded by up to
+    PRE_ROLL_S of held-back silence; after the gate closes, TRAILING_SILENCE_S more goes,
+    then one frame per KEEPALIVE_INTERVAL_S. Durations are audio time, not wall time.
+    Sarvam stamps nothing by stream offset that we read — transcripts are timed on arrival
+    (FinalCoalescer) — so the shortened stream costs nothing downstream.
+    """
+
+    def __init__(
+        self,
+        pre_roll: float = PRE_ROLL_S,
+        trailing: float = TRAILING_SILENCE_S,
+        keepalive: float = KEEPALIVE_INTERVAL_S,
+    ) -> None:
+        self._pre_roll = pre_roll
+        self._trailing = trailing
+        self._keepalive = keepalive
+        self._held: deque[rtc.AudioFrame] = deque()
+        self._held_s = 0.0
+        self._closed_s = trailing  # nothing to pad at the start of a call
+        self._since_sent_s = 0.0
+        self._skipped_s = 0.0
+        self._skipped_bytes = 0
+
+    @property
+    def skipped_seconds(self) -> float:
+        """Audio held back from Sarvam so far, including the pre-roll not yet released."""
+        return self._skipped_s + self._held_s
+
+    @property
+    def skipped_bytes(self) -> int:
+        return self._skipped_bytes + sum(_pcm_bytes(f) for f in self._held)
+
+    def feed(self, frame: rtc.AudioFrame, open_: bool) -> list[rtc.AudioFrame]:
+        """The frames to push now, oldest first — possibly none."""
+        if open_:
+            out = [*self._held, frame]
+            self._release()
+            self._closed_s = self._since_sent_s = 0.0
+            return out
+
+        if self._closed_s < self._trailing - _EPS:
+            self._closed_s += frame.duration
+            self._since_sent_s = 0.0
+            return [frame]
+
+        self._since_sent_s += frame.duration
+        if self._since_sent_s >= self._keepalive - _EPS:
+            self._drop_held()  # older than the keepalive; never worth sending after it
+            self._since_sent_s = 0.0
+            return [frame]
+
+        self._held.append(frame)
+        self._held_s += frame.duration
+        while self._held and self._held_s - self._held[0].duration >= self._pre_roll - _EPS:
+            self._drop(self._held.popleft())
+        return []
+
+    def _release(self) -> None:
+        self._held.clear()
+        self._held_s = 0.0
+
+    def _drop(self, frame: rtc.AudioFrame) -> None:
+        self._held_s -= frame.duration
+        self._skipped_s += frame.duration
+        self._skipped_bytes += _pcm_bytes(frame)
+
+    def _drop_held(self) -> None:
+        while self._held:
+            self._drop(self._held.popleft())
+        self._held_s = 0.0
+
+
+def _pcm_bytes(frame: rtc.AudioFrame) -> int:
+    return frame.samples_per_channel * frame.num_channels * 2  # int16
+
+
 async def run_sarvam_parallel_stt(
     *,
     room: rtc.Room,
@@ -103,10 +202,16 @@ async def run_sarvam_parallel_stt(
     language: str | None = None,
     mode: str | None = None,
     assistant_id: str = "unknown",
+    speech_gate: SpeechGate | None = None,
+    suppressor: SilenceSuppressor | None = None,
 ) -> None:
     """Stream caller audio into Sarvam Saras v3 and feed finalized utterances to `coalescer`.
 
-    Runs alongside OpenAI Realtime — does not touch the LLM audio pipeline.
+    Runs alongside OpenAI Realtime — does not touch the LLM audio pipeline. With
+    `speech_gate` (the gate on the session's audio input) it subscribes to that gate's
+    16 kHz output; without one it opens its own AudioStream on `target_identity`'s track.
+    Gated silence goes through `suppressor` (a fresh one if not given), which the caller
+    keeps to meter what was not sent.
     On `stop_event` it feeds Sarvam silence so it finalizes its buffered audio rather than
     dropping it, so the caller's last sentence survives a hangup.
     """
@@ -129,19 +234,25 @@ async def run_sarvam_parallel_stt(
     )
     stream = sarvam_stt.stream()
     pump_task: asyncio.Task | None = None
+    suppressor = suppressor or SilenceSuppressor()
+
+    def _on_audio(frame: rtc.AudioFrame, open_: bool) -> None:
+        for out in suppressor.feed(frame, open_):
+            stream.push_frame(out)
 
     async def _pump(track: rtc.Track) -> None:
-        # This tap opens its own AudioStream, so it does not inherit the SpeechGate that
-        # RoomIO applies to the LLM's input — it needs its own instance (the APM and VAD
-        # are both stateful per stream). Gating here also keeps Sarvam from transcribing
-        # noise, which is what produced the hallucinated scripts described in
-        # docs/architecture/audio-pipeline.md.
-        audio = rtc.AudioStream(
-            track, sample_rate=16000, num_channels=1, noise_cancellation=SpeechGate()
-        )
+        # Fallback for a session without an audio-input gate. This tap opens its own
+        # AudioStream, so it needs its own instance (the APM and VAD are both stateful per
+        # stream). Gating here also keeps Sarvam from transcribing noise, which is what
+        # produced the hallucinated scripts described in docs/architecture/audio-pipeline.md.
+        # Frames are taken from the gate's subscription, like the shared path, for its
+        # open/closed decision; iterating the stream is only what drives the gate.
+        gate = SpeechGate()
+        gate.subscribe(_on_audio)
+        audio = rtc.AudioStream(track, sample_rate=16000, num_channels=1, noise_cancellation=gate)
         try:
-            async for ev in audio:
-                stream.push_frame(ev.frame)
+            async for _ in audio:
+                pass
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -158,16 +269,24 @@ async def run_sarvam_parallel_stt(
         logger.info(f"[SARVAM-STT] Attaching to {participant.identity} audio track")
         pump_task = asyncio.create_task(_pump(track))
 
-    # Late-bind if track already exists
-    for p in room.remote_participants.values():
-        for pub in p.track_publications.values():
-            if pub.track:
-                _on_track(pub.track, pub, p)
+    if speech_gate is not None:
+        # Already 16 kHz mono, denoised and gated — straight into the plugin.
+        logger.info("[SARVAM-STT] Subscribed to the session's speech gate")
+        speech_gate.subscribe(_on_audio)
+    else:
+        # Late-bind if track already exists
+        for p in room.remote_participants.values():
+            for pub in p.track_publications.values():
+                if pub.track:
+                    _on_track(pub.track, pub, p)
 
-    room.on("track_subscribed", _on_track)
+        room.on("track_subscribed", _on_track)
 
     async def _stop_watch() -> None:
         await stop_event.wait()
+        if speech_gate is not None:
+            # Synchronous, so no real frame can land after the silence below.
+            speech_gate.unsubscribe(_on_audio)
         if pump_task and not pump_task.done():
             pump_task.cancel()
             # Awaited, so no real frame can land after the silence below.
@@ -200,6 +319,8 @@ async def run_sarvam_parallel_stt(
     finally:
         # Sync first: this must land even if the task is being cancelled out from under us.
         coalescer.flush()
+        if speech_gate is not None:
+            speech_gate.unsubscribe(_on_audio)
         room.off("track_subscribed", _on_track)
         stop_task.cancel()
         if pump_task:
@@ -211,4 +332,6 @@ async def run_sarvam_parallel_stt(
             await stream.aclose()
         except Exception as e:
             logger.debug(f"[SARVAM-STT] aclose error: {e}")
-        logger.info("[SARVAM-STT] Parallel STT stopped")
+        logger.info(
+            f"[SARVAM-STT] Parallel STT stopped | silence_skipped={suppressor.skipped_seconds:.1f}s"
+        )
@@ -12,6 +12,11 @@ NON_BILLABLE_FINAL_STATUSES = {
     "failed",
 }
 
+# A call that reached any of these is finalized: duration written and end-call webhook
+# already sent. Both end_call()'s dedupe guard and the dispatcher's safety net read this,
+# so the two can't drift apart on what "already ended" means.
+TERMINAL_CALL_STATUSES = NON_BILLABLE_FINAL_STATUSES | {"completed"}
+
 
 def calculate_billable_duration_minutes(
     call_status: str,
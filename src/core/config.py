@@ -90,4 +90,18 @@ class Settings:
         # retirement sooner; 0 disables the cache and asks on every write.
         self.OPENAI_MODEL_CACHE_TTL = float(os.getenv("OPENAI_MODEL_CACHE_TTL", "3600"))
 
+        # Per-process cache of /analytics responses (src/services/analytics/cache.py).
+        # Ranges reaching into today are still changing, so they get the short TTL; ranges
+        # that ended before today only move when a late call finalizes. 0 disables either.
+        self.ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "30"))
+        self.ANALYTICS_CACHE_HISTORICAL_TTL = float(os.getenv("ANALYTICS_CACHE_HISTORICAL_TTL", "3600"))
+        self.ANALYTICS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYTICS_CACHE_MAX_ENTRIES", "2048"))
+
+        # Per-process cache of API-key lookups (src/api/dependencies/key_cache.py). A change
+        # stream on api_keys evicts revoked keys straight away; the TTLs bound staleness when
+        # it is down. Unknown/inactive keys get the short one. 0 disables either.
+        self.AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "60"))
+        self.AUTH_CACHE_NEGATIVE_TTL = float(os.getenv("AUTH_CACHE_NEGATIVE_TTL", "5"))
+        self.AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
 settings = Settings()
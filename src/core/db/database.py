@@ -9,7 +9,10 @@ from src.core.db.db_schemas import (
     InboundSIP,
     InboundContextStrategy,
     CallRecord,
+    CallTranscript,
+    CallDailyRollup,
     OutboundCallQueue,
+    DispatcherLease,
     Tool,
     ActivityLog,
     UsageRecord,
@@ -25,12 +28,16 @@ class Database:
     client: AsyncMongoClient = None
 
     @classmethod
-    async def connect_db(cls):
+    async def connect_db(cls, skip_indexes: bool = False):
         """Initialize database connection and Beanie ODM.
 
         No-op if already connected — every LiveKit job calls this at the top of
-        entrypoint(), and re-doing the ping + init_beanie() (11 document models) on an
+        entrypoint(), and re-doing the ping + init_beanie() (14 document models) on an
         already-live client just adds latency for no benefit.
+
+        skip_indexes: leave index creation to the API. The LiveKit worker runs each job in
+        a fresh process, so checking every model's indexes there cost a round-trip per
+        model on every call before the assistant could even be read.
         """
         if cls.client is not None:
             return
@@ -52,11 +59,15 @@ class Database:
                     InboundSIP,
                     InboundContextStrategy,
                     CallRecord,
+                    CallTranscript,
+                    CallDailyRollup,
                     OutboundCallQueue,
+                    DispatcherLease,
                     Tool,
                     ActivityLog,
                     UsageRecord,
                 ],
+                skip_indexes=skip_indexes,
             )
             logger.info(f"Beanie initialized with database: {settings.DATABASE_NAME}")
 
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional, Literal, List, Dict
-from beanie import Document, Indexed
+from beanie import Document, Indexed, PydanticObjectId
 from pydantic import BaseModel, Field, EmailStr
 from pymongo import IndexModel
 from pymongo.collation import Collation
@@ -239,7 +239,10 @@ class CallRecord(Document):
     call_end_reason: Optional[str] = None  # natural | max_duration_exceeded | sip_bye | rtp_silence | no_rtp | livekit_disconnected | error
     recording_path: Optional[str] = None
     recording_egress_id: Optional[str] = None
-    transcripts: List[Dict] = []  # [{speaker, text, timestamp}]
+    # Transcript lines live in CallTranscript (call_transcripts) so this document stays small;
+    # the record keeps only how many there are and when the last one was spoken.
+    transcript_count: int = 0
+    transcript_last_at: Optional[datetime] = None
     started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     ended_at: Optional[datetime] = None
     call_duration_minutes: Optional[float] = None
@@ -253,13 +256,104 @@ class CallRecord(Document):
     class Settings:
         name = "call_records"
         indexes = [
-            IndexModel([("created_by_email", 1), ("started_at", -1)]),
+            # _id last so keyset pages ((started_at, _id) cursors) are a single index seek
+            IndexModel([("created_by_email", 1), ("started_at", -1), ("_id", -1)]),
+            IndexModel([("assistant_id", 1), ("started_at", -1), ("_id", -1)]),
             IndexModel([("created_by_email", 1), ("assistant_id", 1), ("started_at", -1)]),
             IndexModel([("created_by_email", 1), ("to_number", 1), ("started_at", -1)]),
             IndexModel([("started_at", -1)]),
         ]
 
 
+class CallRecordSummary(BaseModel):
+    """Projection of CallRecord for list endpoints.
+
+    Only these fields leave Mongo, so a page of calls never carries internal ids or the
+    transcripts array that records from before call_transcripts still embed.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")  # keyset pagination tiebreaker; not serialized
+    room_name: str
+    queue_id: Optional[str] = None
+    assistant_id: Optional[str] = None
+    assistant_name: Optional[str] = None
+    is_passthrough: bool = False
+    to_number: str
+    call_status: str
+    call_status_reason: Optional[str] = None
+    sip_status_code: Optional[int] = None
+    sip_status_text: Optional[str] = None
+    answered_at: Optional[datetime] = None
+    call_end_reason: Optional[str] = None
+    recording_path: Optional[str] = None
+    transcript_count: int = 0
+    transcript_last_at: Optional[datetime] = None
+    started_at: datetime
+    ended_at: Optional[datetime] = None
+    call_duration_minutes: Optional[float] = None
+    billable_duration_minutes: Optional[int] = None
+    created_by_email: Optional[EmailStr] = None
+    call_type: Optional[str] = None
+    call_service: Optional[str] = None
+    platform_number: Optional[str] = None
+
+
+class CallTranscript(Document):
+    """One transcript line of a call. Append-only: written in batches, never updated."""
+
+    room_name: str
+    seq: int  # per-call write order, reserved from CallRecord.transcript_count; breaks timestamp ties
+    speaker: str
+    text: str
+    timestamp: datetime  # when the utterance was spoken, not when it was written
+
+    class Settings:
+        name = "call_transcripts"
+        indexes = [
+            IndexModel([("room_name", 1), ("timestamp", 1), ("seq", 1)], unique=True),
+        ]
+
+
+class CallDailyRollup(Document):
+    """Call count and minutes per UTC day for one combination of the key fields.
+
+    Analytics reads these instead of scanning call_records. Maintained by
+    src/services/analytics/rollup.py as calls reach a terminal status; rebuilt by
+    scripts/backfill_call_rollups.py.
+    """
+
+    # Key — one row per distinct combination
+    user_email: Optional[str] = None  # CallRecord.created_by_email
+    assistant_id: Optional[str] = None
+    day: datetime  # UTC midnight of CallRecord.started_at
+    call_type: Optional[str] = None
+    call_service: Optional[str] = None
+    call_status: str
+    platform_number: Optional[str] = None  # by-phone-number buckets on it
+
+    assistant_name: Optional[str] = None  # latest name seen for assistant_id; not part of the key
+    total_calls: int = 0
+    total_duration_minutes: float = 0.0
+
+    class Settings:
+        name = "call_daily_rollups"
+        indexes = [
+            IndexModel(
+                [
+                    ("user_email", 1),
+                    ("assistant_id", 1),
+                    ("day", 1),
+                    ("call_type", 1),
+                    ("call_service", 1),
+                    ("call_status", 1),
+                    ("platform_number", 1),
+                ],
+                unique=True,
+            ),
+            IndexModel([("day", 1)]),  # cross-tenant admin windows
+        ]
+
+
 class ToolParameter(BaseModel):
     """Single parameter definition for a tool."""
 
@@ -302,11 +396,20 @@ class OutboundCallQueue(Document):
     job_metadata: Dict = Field(default_factory=dict)
     status: str = "pending"   # pending | dispatching | dispatched | failed
     queued_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Set together with status="dispatching" by the dispatcher's batch claim: one token per
+    # claimed batch, so the claimed rows can be read back after a single update_many.
+    claim_token: Optional[str] = None
+    claimed_at: Optional[datetime] = None
+    # Which dispatcher replica owns the claim, and until when. The owner renews the lease
+    # while it dispatches; once it lapses any replica may put the item back to 'pending'.
+    claimed_by: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
     dispatched_at: Optional[datetime] = None
     room_name: Optional[str] = None
     retry_count: int = 0
     last_error: Optional[str] = None
     passthrough_room_name: Optional[str] = None  # pre-created room for passthrough calls
+    batch_key: Optional[str] = None  # client idempotency key of the bulk enqueue that queued it
 
     class Settings:
         name = "outbound_call_queue"
@@ -317,6 +420,26 @@ class OutboundCallQueue(Document):
         ]
 
 
+class DispatcherLease(Document):
+    """Short-lived ownership records shared by outbound dispatcher replicas.
+
+    Two kinds of row, told apart by name: "dispatcher:<id>" is one replica's heartbeat, and
+    "outbound_claim" is the lock that serializes batch claims so replicas together stay
+    within MAX_CONCURRENT_JOBS. A row is held while expires_at is in the future.
+    """
+
+    name: Indexed(str, unique=True)
+    holder: str
+    expires_at: datetime
+
+    class Settings:
+        name = "dispatcher_leases"
+        indexes = [
+            # Rows of replicas that died without unregistering clear themselves out.
+            IndexModel([("expires_at", 1)], expireAfterSeconds=3600),
+        ]
+
+
 class ActivityLog(Document):
     """User-visible activity log — one record per notable event (tool call, webhook fire)."""
 
@@ -333,6 +456,9 @@ class ActivityLog(Document):
 
     class Settings:
         name = "activity_logs"
+        indexes = [
+            IndexModel([("user_email", 1), ("timestamp", -1), ("_id", -1)]),
+        ]
 
 
 class UsageRecord(Document):
@@ -368,6 +494,11 @@ class UsageRecord(Document):
     stt_model: Optional[str] = None  # e.g. "saaras:v3", "ink-whisper", "nova-3", "scribe_v2_realtime", "gpt-4o-mini-transcribe"
     stt_audio_duration: float = 0.0  # seconds of audio transcribed
 
+    # Sarvam transcription tap (pipeline/realtime with Sarvam STT): gated silence the tap
+    # held back instead of streaming — see SilenceSuppressor in stt/sarvam_parallel.py.
+    stt_silence_skipped_seconds: float = 0.0
+    stt_silence_skipped_bytes: int = 0
+
     # Telephony duration (copied from CallRecord for aggregation convenience)
     call_duration_minutes: float = 0.0
 
@@ -0,0 +1,4 @@
+from src.services.analytics.cache import AnalyticsCache, analytics_cache, cache_window
+from src.services.analytics.rollup import apply_call_rollup, rollup_source
+
+__all__ = ["AnalyticsCache", "analytics_cache", "apply_call_rollup", "cache_window", "rollup_source"]
@@ -0,0 +1,131 @@
+"""In-process response cache for the /analytics endpoints.
+
+Dashboards poll, and every poll is one or two aggregations. Responses are cached per
+(endpoint, user, normalised range, other params), with the TTL chosen by the range:
+
+- a range reaching into today is still changing — it lives ANALYTICS_CACHE_TTL seconds,
+  and a defaulted bound ("now", "30 days ago") is snapped down to CURRENT_BUCKET_SECONDS
+  so consecutive polls land on the same key;
+- a range that ended before today only moves when a late call finalizes, and lives
+  ANALYTICS_CACHE_HISTORICAL_TTL.
+
+Concurrent misses for one key share a single computation (single-flight). It runs as its
+own task, so a caller that disconnects doesn't cancel it for the others; a failure reaches
+every waiter and is not cached.
+
+Per process, like the OpenAI model cache: replicas each keep their own.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from src.core.config import settings
+from src.services.analytics.rollup import as_utc, day_start
+
+CURRENT_BUCKET_SECONDS = 60
+DEFAULT_RANGE = timedelta(days=30)
+
+
+def _snap(ts: datetime) -> datetime:
+    return datetime.fromtimestamp(
+        ts.timestamp() // CURRENT_BUCKET_SECONDS * CURRENT_BUCKET_SECONDS, tz=timezone.utc
+    )
+
+
+def cache_window(
+    start: Optional[datetime], end: Optional[datetime], now: Optional[datetime] = None
+) -> tuple[datetime, datetime, float]:
+    """Resolve an endpoint's optional range to (start, end, ttl).
+
+    Missing bounds default to the last 30 days, as the endpoints always have. Explicit
+    bounds are kept exactly.
+    """
+    now = now or datetime.now(timezone.utc)
+    end = as_utc(end) if end else _snap(now)
+    start = as_utc(start) if start else _snap(now - DEFAULT_RANGE)
+    if end >= day_start(now):
+        return start, end, settings.ANALYTICS_CACHE_TTL
+    return start, end, settings.ANALYTICS_CACHE_HISTORICAL_TTL
+
+
+class AnalyticsCache:
+    """TTL + LRU cache with single-flight fills and hit/miss/latency counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # misses that joined an in-flight computation
+        self.errors = 0
+        self._computes = 0
+        self._compute_seconds = 0.0
+        self._compute_max = 0.0
+
+    async def get_or_compute(self, key: Hashable, ttl: float, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached value for `key`, or `compute()`'s result cached for `ttl` seconds.
+
+        Callers must treat the value as read-only: it is shared with every later hit.
+        """
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(key, ttl, compute))
+            # Retrieve a failure nobody is left waiting for, so it isn't logged as unhandled.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: Hashable, ttl: float, compute: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        try:
+            value = await compute()
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            elapsed = time.perf_counter() - started
+            self._computes += 1
+            self._compute_seconds += elapsed
+            self._compute_max = max(self._compute_max, elapsed)
+
+        if ttl > 0:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "compute_ms_avg": round(self._compute_seconds / self._computes * 1000, 2) if self._computes else 0.0,
+            "compute_ms_max": round(self._compute_max * 1000, 2),
+        }
+
+
+analytics_cache = AnalyticsCache(max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES)
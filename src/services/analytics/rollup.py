@@ -0,0 +1,173 @@
+"""Daily call rollups: write path and the read-side pipeline prefix.
+
+Write side: once a call reaches a terminal status, apply_call_rollup() adds it to the
+call_daily_rollups row for its key (see CallDailyRollup). A call can be finalized more
+than once — end_call() patching a missing duration, a reaper racing the session — so each
+record remembers what it last contributed in ROLLUP_FIELD, and a later pass moves that
+contribution rather than adding a second one. The marker is claimed with a compare-and-set,
+so concurrent passes for the same call apply at most one delta each.
+
+ROLLUP_FIELD is deliberately not a CallRecord field: Beanie's save() $sets every declared
+field from the in-memory copy, and a stale copy would silently overwrite the marker.
+
+Read side: rollup_source() is the opening stages of an aggregation on call_daily_rollups
+that yields rollup-shaped rows for [start, end]. Whole UTC days come from the rollups; the
+partial day at either edge (always including today) is read live from call_records.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from src.core.billing import TERMINAL_CALL_STATUSES
+from src.core.config import settings
+from src.core.db.database import Database
+from src.core.db.db_schemas import CallDailyRollup, CallRecord
+from src.core.logger import logger
+
+ROLLUP_FIELD = "_rollup"
+
+# CallRecord fields that make up the rollup key, by rollup field name.
+KEY_FIELDS = {
+    "user_email": "created_by_email",
+    "assistant_id": "assistant_id",
+    "call_type": "call_type",
+    "call_service": "call_service",
+    "call_status": "call_status",
+    "platform_number": "platform_number",
+}
+
+_MAX_ATTEMPTS = 3
+
+
+def as_utc(ts: datetime) -> datetime:
+    """Aware UTC copy of `ts`. Naive datetimes are taken as UTC, as Mongo stores them."""
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def day_start(ts: datetime) -> datetime:
+    """UTC midnight of `ts`."""
+    return as_utc(ts).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def contribution(doc: dict) -> dict:
+    """What a terminal call record adds to the rollups: its key and its minutes."""
+    key = {field: doc.get(source) for field, source in KEY_FIELDS.items()}
+    key["day"] = day_start(doc["started_at"])
+    return {"key": key, "minutes": doc.get("call_duration_minutes") or 0.0}
+
+
+async def apply_rollup(records, rollups, room_name: str) -> bool:
+    """Bring `rollups` in line with the call's current state. True if anything changed.
+
+    No-op for calls not yet terminal or already counted as they are now.
+    """
+    projection = {"assistant_name": 1, "started_at": 1, "call_duration_minutes": 1, ROLLUP_FIELD: 1}
+    projection.update({source: 1 for source in KEY_FIELDS.values()})
+
+    for _ in range(_MAX_ATTEMPTS):
+        doc = await records.find_one({"room_name": room_name}, projection)
+        if not doc or doc.get("call_status") not in TERMINAL_CALL_STATUSES or not doc.get("started_at"):
+            return False
+        old, new = doc.get(ROLLUP_FIELD), contribution(doc)
+        if old == new:
+            return False
+
+        # Claim the move from old to new. Another pass that read the same `old` loses here
+        # and re-reads, so the delta below is applied exactly once.
+        claimed = await records.update_one(
+            {"_id": doc["_id"], ROLLUP_FIELD: old}, {"$set": {ROLLUP_FIELD: new}}
+        )
+        if claimed.modified_count == 0:
+            continue
+
+        if old:
+            await rollups.update_one(
+                old["key"], {"$inc": {"total_calls": -1, "total_duration_minutes": -old["minutes"]}}
+            )
+        await rollups.update_one(
+            new["key"],
+            {
+                "$inc": {"total_calls": 1, "total_duration_minutes": new["minutes"]},
+                "$set": {"assistant_name": doc.get("assistant_name")},
+            },
+            upsert=True,
+        )
+        return True
+
+    logger.warning(f"Rollup for room {room_name} kept losing to concurrent updates; leaving it to the backfill")
+    return False
+
+
+async def apply_call_rollup(room_name: str) -> None:
+    """Fold a call's terminal state into call_daily_rollups. Never raises.
+
+    Call after saving a terminal status or a changed duration. A failure here only costs
+    dashboard accuracy, which scripts/backfill_call_rollups.py restores — it must not
+    break the call-ending path that invoked it.
+    """
+    try:
+        db = Database.client[settings.DATABASE_NAME]
+        await apply_rollup(db[CallRecord.Settings.name], db[CallDailyRollup.Settings.name], room_name)
+    except Exception as e:
+        logger.warning(f"Failed to update call rollup for room {room_name}: {e}")
+
+
+def rollup_source(
+    start: datetime, end: datetime, match: Optional[dict] = None, exact: Iterable[datetime] = ()
+) -> list:
+    """Aggregation stages (run on call_daily_rollups) yielding rollup rows for [start, end].
+
+    `match` filters on rollup field names (user_email, assistant_id, ...). Each output row
+    has the key fields, assistant_name, day, total_calls and total_duration_minutes; rows
+    from the live edges are single calls with `day` set to their started_at, so `day`
+    comparisons and $dateToString on it work the same for both kinds.
+
+    `exact` lists instants inside the range that later stages cut on (a $facet matching
+    `day` against a narrower range, say). Their days are read live as well, so such a cut
+    is exact to the call rather than to the day. Midnights are already day boundaries and
+    are skipped.
+    """
+    match = match or {}
+    start, end = as_utc(start), as_utc(end)
+    first_full = day_start(start)
+    if first_full < start:
+        first_full += timedelta(days=1)
+    end_full = day_start(end)
+
+    day_filter = {}
+    if first_full < end_full:
+        live_ranges = [
+            {"started_at": {"$gte": start, "$lt": first_full}},
+            {"started_at": {"$gte": end_full, "$lte": end}},
+        ]
+        cut_days = sorted({
+            day_start(t) for t in exact if first_full <= day_start(t) < end_full and day_start(t) != as_utc(t)
+        })
+        if cut_days:
+            day_filter["$nin"] = cut_days
+            live_ranges += [{"started_at": {"$gte": d, "$lt": d + timedelta(days=1)}} for d in cut_days]
+    else:  # no whole day inside the range
+        first_full = end_full = start
+        live_ranges = [{"started_at": {"$gte": start, "$lte": end}}]
+
+    live_match = {KEY_FIELDS.get(field, field): value for field, value in match.items()}
+    live_rows = {field: f"${source}" for field, source in KEY_FIELDS.items()}
+    live_rows.update(
+        _id=0,
+        assistant_name=1,
+        day="$started_at",
+        total_calls={"$literal": 1},
+        total_duration_minutes={"$ifNull": ["$call_duration_minutes", 0]},
+    )
+    return [
+        {"$match": {**match, "day": {"$gte": first_full, "$lt": end_full, **day_filter}, "total_calls": {"$gt": 0}}},
+        {
+            "$unionWith": {
+                "coll": CallRecord.Settings.name,
+                "pipeline": [
+                    {"$match": {**live_match, "$or": live_ranges}},
+                    {"$project": live_rows},
+                ],
+            }
+        },
+    ]
@@ -54,7 +54,8 @@ async def run_bridge(
     preallocated_port  : port already acquired by parent process; skip pool.acquire/release.
     call_id            : pre-generated by parent; passed to ExotelSipClient so parent can
                          register the inbound BYE event before the subprocess starts.
-    inbound_bye_event  : multiprocessing.Event from parent; skip register_call_id when set.
+    inbound_bye_event  : multiprocessing.Event from parent, or an asyncio.Event when run
+                         on a pool host; skip register_call_id when set.
     """
     if not validate_config():
         return
@@ -258,10 +259,15 @@ async def run_bridge(
         lk_task = asyncio.create_task(lk_disconnected.wait())
 
         async def _watch_inbound_bye():
-            """Poll multiprocessing.Event with a short timeout so the worker
-            thread releases promptly when the call ends via another path.
-            (asyncio.Task cancel does not interrupt threads running to_thread,
-            so an unbounded Event.wait would leak a thread for up to 300s.)"""
+            """Await the BYE. A pool host sets an asyncio.Event on this loop, so
+            there is nothing to poll. A multiprocessing.Event is polled with a
+            short timeout so the worker thread releases promptly when the call
+            ends via another path. (asyncio.Task cancel does not interrupt
+            threads running to_thread, so an unbounded Event.wait would leak a
+            thread for up to 300s.)"""
+            if isinstance(inbound_bye, asyncio.Event):
+                await inbound_bye.wait()
+                return
             while True:
                 if await asyncio.to_thread(inbound_bye.wait, 1.0):
                     return
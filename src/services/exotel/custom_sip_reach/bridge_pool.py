@@ -0,0 +1,362 @@
+"""
+Warm pool of outbound bridge host processes.
+
+Spawning a fresh process per outbound call means every call re-imports livekit,
+numpy and scipy and rebuilds the RTP filters before its INVITE can go out — a
+second or more of CPU, all at once when a campaign bursts. The pool keeps
+BRIDGE_WARM_POOL_SIZE hosts that have already paid that cost and are waiting on
+a pipe. A call is a job dict sent down the pipe; the host runs run_bridge() as a
+task on its event loop (uvloop when installed) and reports back when the call
+is over. Hosts are retired after BRIDGE_WORKER_MAX_CALLS calls and replaced.
+
+Each host runs up to BRIDGE_HOST_MAX_CALLS calls at once. At 1 (the default) a
+host is one call at a time, keeping the per-process FFI isolation described in
+call-flows.md. Raising it multiplexes calls into one interpreter — a few MB per
+call instead of a whole process — at the cost of sharing that process's FFI
+queue, which saturated at ~5–8 calls when bridges were threads.
+
+Everything per-call (SIP result, inbound BYE, cancel) travels as tagged
+messages on the host's pipe, since one host serves many calls and
+multiprocessing primitives can't be handed over after spawn.
+
+Only used by the dispatcher process.
+"""
+
+import asyncio
+import multiprocessing
+import queue as _stdlib_queue
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Connection
+
+from .bridge import run_bridge
+from .config import BRIDGE_HOST_MAX_CALLS, BRIDGE_WARM_POOL_SIZE, BRIDGE_WORKER_MAX_CALLS
+from src.core.logger import logger
+
+_JOIN_POLL_SECONDS = 0.05
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Host process side
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _ResultRelay:
+    """The result_queue run_bridge() sees inside a host: put() goes up the pipe."""
+
+    def __init__(self, conn: Connection, call_id: str):
+        self._conn = conn
+        self._call_id = call_id
+
+    def put(self, payload: dict) -> None:
+        self._conn.send(("result", self._call_id, payload))
+
+
+def _bridge_worker_main(conn: Connection) -> None:
+    """Host process entry point. Importing this module already paid for
+    livekit/numpy/scipy and the filter design."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(_serve(conn))
+
+
+async def _serve(conn: Connection) -> None:
+    """Run bridge calls as tasks until the parent says stop (or goes away)."""
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    byes: dict[str, asyncio.Event] = {}
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def _run_call(job: dict) -> None:
+        call_id = job["call_id"]
+        try:
+            await run_bridge(
+                result_queue=_ResultRelay(conn, call_id),
+                inbound_bye_event=byes[call_id],
+                **job,
+            )
+        except asyncio.CancelledError:
+            pass  # parent gave up on this call; run_bridge's finally has cleaned up
+        except Exception as e:
+            logger.error(f"[BRIDGE-HOST] Call {call_id} crashed: {e}", exc_info=True)
+        finally:
+            byes.pop(call_id, None)
+            tasks.pop(call_id, None)
+            # run_bridge has closed its sockets by now, so the parent may reuse the port.
+            conn.send(("done", call_id))
+
+    def _on_readable() -> None:
+        try:
+            while conn.poll():
+                msg = conn.recv()
+                if msg is None:
+                    stopped.set()
+                    return
+                kind, payload = msg
+                if kind == "call":
+                    # Set right here on the loop; run_bridge awaits it without a thread.
+                    byes[payload["call_id"]] = asyncio.Event()
+                    tasks[payload["call_id"]] = asyncio.create_task(_run_call(payload))
+                elif kind == "bye" and payload in byes:
+                    byes[payload].set()
+                elif kind == "cancel" and payload in tasks:
+                    tasks[payload].cancel()
+        except (EOFError, OSError):
+            stopped.set()  # parent went away
+
+    loop.add_reader(conn.fileno(), _on_readable)
+    conn.send(("ready", None))
+    await stopped.wait()
+    loop.remove_reader(conn.fileno())
+    for task in list(tasks.values()):
+        task.cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Parent (dispatcher) side
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _BridgeWorker:
+    """Parent-side view of one host process and the calls it is running."""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_bridge_worker_main,
+            args=(child_conn,),
+            daemon=True,
+            name="bridge-host",
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.retiring = False
+        self.calls = 0  # lifetime total, for recycling
+        self.results: dict[str, deque] = {}  # call_id → SIP results not yet read
+        self.done: set[str] = set()
+        self._send_lock = threading.Lock()  # BYEs arrive from the SIP listener
+        self._recv_lock = threading.Lock()  # join() pumps from a worker thread
+
+    @property
+    def active(self) -> int:
+        return len(self.results)
+
+    def send(self, msg) -> bool:
+        try:
+            with self._send_lock:
+                self.conn.send(msg)
+            return True
+        except (BrokenPipeError, OSError):
+            return False
+
+    def pump(self) -> None:
+        """Route everything the host has sent so far to its call."""
+        with self._recv_lock:
+            try:
+                while self.conn.poll():
+                    kind, call_id, *rest = self.conn.recv()
+                    if kind == "ready":
+                        self.ready = True
+                    elif kind == "result" and call_id in self.results:
+                        self.results[call_id].append(rest[0])
+                    elif kind == "done":
+                        self.done.add(call_id)
+            except (EOFError, OSError):
+                pass
+        if not self.process.is_alive():
+            self.done.update(self.results)
+
+    def poll_ready(self) -> bool:
+        """True once the host has finished importing and is accepting jobs."""
+        self.pump()
+        return self.ready and not self.retiring and self.process.is_alive()
+
+    def stop(self) -> None:
+        """Ask an idle host to exit; kill it if it doesn't."""
+        self.send(None)
+        self.process.join(timeout=3)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=3)
+        self.conn.close()
+
+
+class _CallResults:
+    """The result_queue the dispatcher monitor polls: this call's results only."""
+
+    def __init__(self, worker: _BridgeWorker, call_id: str):
+        self._worker = worker
+        self._call_id = call_id
+
+    def get_nowait(self) -> dict:
+        self._worker.pump()
+        pending = self._worker.results.get(self._call_id)
+        if not pending:
+            raise _stdlib_queue.Empty
+        return pending.popleft()
+
+
+class _ByeRelay:
+    """Registered with the inbound SIP listener in place of a multiprocessing.Event."""
+
+    def __init__(self, worker: _BridgeWorker, call_id: str):
+        self._worker = worker
+        self._call_id = call_id
+
+    def set(self) -> None:
+        self._worker.send(("bye", self._call_id))
+
+
+class PooledBridgeCall:
+    """One call running on a bridge host.
+
+    Stands in for the per-call multiprocessing.Process the dispatcher monitor used to
+    hold: is_alive() is "call still running", terminate() abandons this call only (other
+    calls on the host carry on), join() waits for it to finish and frees its slot.
+    Unlike Process.join, join() returns False when the call is still running after
+    `timeout` on a host that other calls keep alive; call it again later.
+    """
+
+    def __init__(self, pool: "BridgeWorkerPool", worker: _BridgeWorker, call_id: str):
+        self._pool = pool
+        self._worker = worker
+        self._call_id = call_id
+        self._returned = False
+        self.result_queue = _CallResults(worker, call_id)
+        self.inbound_bye = _ByeRelay(worker, call_id)
+
+    def is_alive(self) -> bool:
+        self._worker.pump()
+        return self._call_id not in self._worker.done
+
+    def terminate(self) -> None:
+        self._worker.send(("cancel", self._call_id))
+
+    def join(self, timeout: float | None = None) -> bool:
+        if self._returned:
+            return True
+        # Like Process.join: give run_bridge up to `timeout` to finish its BYE and close
+        # its sockets — the monitor releases the RTP port right after this returns.
+        # Other calls on the host keep sending, so wait for this call's "done", not
+        # for the pipe to become readable. Blocks; the dispatcher calls it off-loop.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(_JOIN_POLL_SECONDS)
+        self._returned = self._pool._checkin(self._worker, self._call_id)
+        return self._returned
+
+
+class BridgeWorkerPool:
+    """Supervisor for the bridge hosts. Not thread-safe beyond its own lock."""
+
+    def __init__(self, size: int, max_calls: int, calls_per_host: int = 1):
+        self._ctx = multiprocessing.get_context("spawn")
+        self._size = size
+        self._max_calls = max_calls
+        self._calls_per_host = max(1, calls_per_host)
+        self._workers: list[_BridgeWorker] = []
+        self._lock = threading.Lock()
+
+    @property
+    def idle_count(self) -> int:
+        return sum(1 for w in self._workers if w.active == 0 and not w.retiring)
+
+    def start(self) -> None:
+        """Fill the pool. Safe to call repeatedly."""
+        with self._lock:
+            self._refill()
+        logger.info(
+            f"[BridgePool] Warm pool started with {self._size} host(s), "
+            f"{self._calls_per_host} call(s) per host"
+        )
+
+    def _refill(self) -> None:
+        """Drop dead hosts; spawn until `size` hosts are idle and accepting."""
+        self._workers = [w for w in self._workers if w.process.is_alive() or w.active]
+        for _ in range(self._size - self.idle_count):
+            self._workers.append(_BridgeWorker(self._ctx))
+
+    def run_call(self, job: dict) -> PooledBridgeCall | None:
+        """Hand `job` (run_bridge kwargs, including call_id) to a ready host.
+
+        Returns None if no host has room and has finished warming up; the caller falls
+        back to spawning a process for this call. The returned call's inbound_bye must
+        be registered for job["call_id"] by the caller.
+        """
+        call_id = job["call_id"]
+        with self._lock:
+            ready = [
+                w for w in self._workers
+                if w.active < self._calls_per_host and w.poll_ready()
+            ]
+            if not ready:
+                self._refill()
+                return None
+            # Least-loaded first: spreads calls across hosts' FFI queues.
+            worker = min(ready, key=lambda w: w.active)
+            worker.results[call_id] = deque()
+            if not worker.send(("call", job)):
+                del worker.results[call_id]
+                worker.retiring = True
+                self._refill()
+                return None
+            worker.calls += 1
+            if worker.calls >= self._max_calls:
+                worker.retiring = True  # finish what it has, take nothing new
+            self._refill()  # keep `size` hosts idle, so the next call is warm too
+        return PooledBridgeCall(self, worker, call_id)
+
+    def _checkin(self, worker: _BridgeWorker, call_id: str) -> bool:
+        """A call has ended (or been given up on): free its slot, retire the host if due.
+
+        False if the call is still running and other calls keep its host alive: it is
+        cancelled and keeps its slot (its RTP port may still be bound) until the host
+        reports it done.
+        """
+        with self._lock:
+            stuck = call_id not in worker.done
+            if stuck and worker.active > 1 and worker.process.is_alive():
+                worker.retiring = True
+                worker.send(("cancel", call_id))
+                return False
+            worker.results.pop(call_id, None)
+            worker.done.discard(call_id)
+            if stuck or not worker.process.is_alive():
+                # run_bridge didn't finish within the grace period (or the host died);
+                # it can't be trusted with new calls.
+                worker.retiring = True
+            # Keep up to twice the target idle so a steady call rate reuses hosts instead
+            # of spawning.
+            surplus = worker.active == 0 and self.idle_count > 2 * self._size
+            if worker.active or not (worker.retiring or surplus):
+                return True
+            self._workers.remove(worker)
+            self._refill()
+        if stuck:
+            worker.process.terminate()
+        worker.stop()
+        return True
+
+
+_bridge_pool: BridgeWorkerPool | None = None
+
+
+def get_bridge_pool() -> BridgeWorkerPool | None:
+    """The process-wide warm pool, started on first use. None when disabled."""
+    global _bridge_pool
+    if BRIDGE_WARM_POOL_SIZE <= 0:
+        return None
+    if _bridge_pool is None:
+        _bridge_pool = BridgeWorkerPool(
+            BRIDGE_WARM_POOL_SIZE, BRIDGE_WORKER_MAX_CALLS, BRIDGE_HOST_MAX_CALLS
+        )
+        _bridge_pool.start()
+    return _bridge_pool
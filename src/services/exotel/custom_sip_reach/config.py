@@ -6,6 +6,7 @@ config validator live here.
 """
 
 import os
+import tempfile
 from dotenv import load_dotenv
 from src.core.logger import logger
 
@@ -53,6 +54,12 @@ RTP_PORT_START = int(
 RTP_PORT_END = int(
     os.getenv("SIP_BRIDGE_PORT_RANGE_END", os.getenv("RTP_PORT_END", "31100"))
 )  # 50 simultaneous calls max
+# Directory of per-port lease files (port_pool.py) through which every process on the
+# host — dispatcher, inbound listener, bridges, API workers — shares the range above.
+# Mount it into each container that allocates ports. Empty = per-process pool only.
+RTP_PORT_LOCK_DIR = os.getenv(
+    "RTP_PORT_LOCK_DIR", os.path.join(tempfile.gettempdir(), "sip_rtp_ports")
+)
 
 RTP_HEADER_SIZE = 12
 PCMU_PAYLOAD_TYPE = 0
@@ -61,6 +68,12 @@ SAMPLE_RATE_SIP = 8000
 SAMPLE_RATE_LK = 48000
 MAX_FRAME_BUFFER = 2000  # ~20 seconds of 10ms LiveKit frames (10ms × 2000 = 20s)
 
+# Inbound jitter buffer (jitter_buffer.py): playout delay it starts at and may grow to.
+RTP_JITTER_TARGET_MS = int(os.getenv("RTP_JITTER_TARGET_MS", "60"))
+RTP_JITTER_MAX_MS = int(os.getenv("RTP_JITTER_MAX_MS", "200"))
+# Consecutive lost 20 ms packets concealed (last frame, fading) before going silent.
+RTP_PLC_MAX_PACKETS = int(os.getenv("RTP_PLC_MAX_PACKETS", "3"))
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Timeout Configuration
 # ─────────────────────────────────────────────────────────────────────────────
@@ -78,6 +91,26 @@ EXOTEL_SIP_ALLOWED_IPS: set[str] = set(
     filter(None, os.getenv("EXOTEL_SIP_ALLOWED_IPS", "").split(","))
 )
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Outbound Bridge Worker Pool
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Idle bridge processes kept pre-imported (livekit, numpy, scipy, filter design) so an
+# outbound call starts its INVITE without paying spawn + import. 0 = spawn per call.
+BRIDGE_WARM_POOL_SIZE = int(os.getenv("BRIDGE_WARM_POOL_SIZE", "2"))
+# A worker is retired and replaced after this many calls, bounding any slow leak.
+BRIDGE_WORKER_MAX_CALLS = int(os.getenv("BRIDGE_WORKER_MAX_CALLS", "50"))
+# Concurrent calls multiplexed on one worker's event loop. 1 keeps one FFI queue per call;
+# higher values trade that isolation for a few MB per call instead of a whole interpreter.
+BRIDGE_HOST_MAX_CALLS = int(os.getenv("BRIDGE_HOST_MAX_CALLS", "1"))
+# Transcode all of a bridge host's calls together, one 2-D array per loop iteration
+# (dsp_batch.py). Only pays off with several calls per event loop, so it follows the above.
+RTP_BATCH_DSP = os.getenv("RTP_BATCH_DSP", str(BRIDGE_HOST_MAX_CALLS > 1)).lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Config Validation
@@ -0,0 +1,231 @@
+"""
+Cross-bridge batched DSP for bridge hosts.
+
+When one process multiplexes many RTPMediaBridges on one event loop (see
+bridge_pool.py), each bridge transcoding its own 160-sample packet spends most
+of its time in NumPy call overhead, not arithmetic. DSPBatch gathers every
+packet (and outbound frame) submitted during one loop iteration into a 2-D
+array — one row per bridge — runs the high-pass and polyphase resampler once
+over all rows, and scatters the rows back to the awaiting bridges.
+
+Per-call filter state lives here as rows (history + high-pass state) indexed by
+a row number each bridge registers for. The arithmetic is the same as
+_InboundDSP / _OutboundDSP in rtp_bridge.py, so a call sounds identical batched
+or not.
+
+Latency: nothing waits for a timer. The first submission in an iteration
+schedules the flush with call_soon, so packets that woke up together are
+processed together and the rest go through on their own.
+"""
+
+import asyncio
+import weakref
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .config import PCMA_PAYLOAD_TYPE, PCMU_PAYLOAD_TYPE
+from .rtp_bridge import (
+    _ALAW_TO_FLOAT,
+    _DOWN_HISTORY,
+    _DOWN_TAPS,
+    _HP_ZI_TEMPLATE,
+    _RESAMPLE_HALF,
+    _RESAMPLE_RATIO,
+    _ULAW_TO_FLOAT,
+    _UP_PHASES,
+    _UP_TAPS,
+    _hp_block_matrix,
+)
+from src.core.logger import logger
+
+_UP_HISTORY = 2 * _RESAMPLE_HALF
+# PCMA codes at [0, 256), PCMU codes at [256, 512): one gather decodes mixed-codec rows.
+_G711_TO_FLOAT = np.concatenate([_ALAW_TO_FLOAT, _ULAW_TO_FLOAT])
+
+
+class DSPBatch:
+    """Row-per-bridge DSP state plus the pending work for the current loop iteration.
+
+    Bound to one event loop (futures are). Use get_dsp_batch() rather than constructing.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, capacity: int = 16):
+        self._loop = loop
+        self._cap = 0
+        self._free: list[int] = []
+        self._up_hist = np.zeros((0, _UP_HISTORY), dtype=np.float32)
+        self._hp_state = np.zeros((0, 2), dtype=np.float32)
+        self._hp_started = np.zeros(0, dtype=bool)
+        self._down_hist = np.zeros((0, _DOWN_HISTORY), dtype=np.float32)
+        self._grow(capacity)
+        # (row, payload, pt, future) / (row, int16 frame, future) awaiting the next flush
+        self._inbound: list[tuple[int, bytes, int, asyncio.Future]] = []
+        self._outbound: list[tuple[int, np.ndarray, asyncio.Future]] = []
+        self._flush_scheduled = False
+
+    # ── Rows ─────────────────────────────────────────────────────────────────
+
+    def _grow(self, capacity: int) -> None:
+        old = self._cap
+        self._up_hist = np.concatenate(
+            [self._up_hist, np.zeros((capacity - old, _UP_HISTORY), dtype=np.float32)]
+        )
+        self._hp_state = np.concatenate(
+            [self._hp_state, np.zeros((capacity - old, 2), dtype=np.float32)]
+        )
+        self._hp_started = np.concatenate([self._hp_started, np.zeros(capacity - old, dtype=bool)])
+        self._down_hist = np.concatenate(
+            [self._down_hist, np.zeros((capacity - old, _DOWN_HISTORY), dtype=np.float32)]
+        )
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self._cap = capacity
+
+    def register(self) -> int:
+        """Claim a row of filter state for a new bridge."""
+        if not self._free:
+            self._grow(self._cap * 2)
+        row = self._free.pop()
+        self._up_hist[row] = 0.0
+        self._hp_state[row] = 0.0
+        self._hp_started[row] = False
+        self._down_hist[row] = 0.0
+        return row
+
+    def unregister(self, row: int) -> None:
+        """Give a bridge's row back. Work it still has queued is dropped (resolving
+        empty, as a non-G.711 packet does): a bridge registering in the same iteration
+        gets this row, and the stale job would otherwise run on its fresh state."""
+        for jobs, empty in ((self._inbound, b""), (self._outbound, np.empty(0, dtype=np.int16))):
+            stale = [job for job in jobs if job[0] == row]
+            if not stale:
+                continue
+            jobs[:] = [job for job in jobs if job[0] != row]
+            for job in stale:
+                if not job[-1].done():
+                    job[-1].set_result(empty)
+        self._free.append(row)
+
+    # ── Submission ───────────────────────────────────────────────────────────
+
+    def _schedule(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+
+    def decode(self, row: int, payload: bytes, pt: int) -> "asyncio.Future[bytes]":
+        """SIP→LiveKit for one packet: resolves to 48 kHz int16 bytes (b"" if not G.711)."""
+        fut = self._loop.create_future()
+        if (pt != PCMA_PAYLOAD_TYPE and pt != PCMU_PAYLOAD_TYPE) or not payload:
+            fut.set_result(b"")
+            return fut
+        self._inbound.append((row, payload, pt, fut))
+        self._schedule()
+        return fut
+
+    def downsample(self, row: int, pcm48: memoryview | bytes) -> "asyncio.Future[np.ndarray]":
+        """LiveKit→SIP for one frame: resolves to 8 kHz int16 samples."""
+        fut = self._loop.create_future()
+        self._outbound.append((row, np.frombuffer(pcm48, dtype=np.int16), fut))
+        self._schedule()
+        return fut
+
+    # ── Flush ────────────────────────────────────────────────────────────────
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        inbound, self._inbound = self._inbound, []
+        outbound, self._outbound = self._outbound, []
+        for group in _by_length(inbound, lambda job: len(job[1])):
+            self._run(self._flush_inbound, group, futures=[job[3] for job in group])
+        for group in _by_length(outbound, lambda job: len(job[1])):
+            self._run(self._flush_outbound, group, futures=[job[2] for job in group])
+
+    @staticmethod
+    def _run(fn, group, futures) -> None:
+        try:
+            results = fn(group)
+        except Exception as e:
+            logger.error(f"[DSP-BATCH] Batch of {len(group)} failed: {e}", exc_info=True)
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for fut, result in zip(futures, results):
+            if not fut.done():  # the bridge may have been cancelled meanwhile
+                fut.set_result(result)
+
+    def _flush_inbound(self, group: list) -> list[bytes]:
+        rows = np.fromiter((job[0] for job in group), dtype=np.intp, count=len(group))
+        n = len(group[0][1])
+        k = len(group)
+
+        codes = np.frombuffer(b"".join(job[1] for job in group), dtype=np.uint8).reshape(k, n)
+        offsets = np.fromiter(
+            (0 if job[2] == PCMA_PAYLOAD_TYPE else 256 for job in group), dtype=np.intp, count=k
+        )
+
+        # [packet, high-pass state] per row, filtered by the same block matrix _InboundDSP uses.
+        xz = np.empty((k, n + 2), dtype=np.float32)
+        np.take(_G711_TO_FLOAT, codes + offsets[:, None], out=xz[:, :n])
+        fresh = ~self._hp_started[rows]
+        if fresh.any():
+            # Scale template to first-sample DC level (scipy idiom) to suppress startup transient.
+            self._hp_state[rows[fresh]] = _HP_ZI_TEMPLATE.ravel() * xz[fresh, :1]
+            self._hp_started[rows[fresh]] = True
+        xz[:, n:] = self._hp_state[rows]
+        yz = xz @ _hp_block_matrix(n).T
+        self._hp_state[rows] = yz[:, n:]
+
+        x = np.empty((k, _UP_HISTORY + n), dtype=np.float32)  # [history, filtered packet]
+        x[:, :_UP_HISTORY] = self._up_hist[rows]
+        x[:, _UP_HISTORY:] = yz[:, :n]
+        self._up_hist[rows] = x[:, -_UP_HISTORY:]
+
+        up = sliding_window_view(x, _UP_TAPS, axis=1) @ _UP_PHASES  # (k, n, 6)
+        up = up.reshape(k, n * _RESAMPLE_RATIO)
+        up *= 1.5
+        np.tanh(up, out=up)  # boost quiet phone audio, soft-clip peaks
+        up *= 32767.0
+        pcm = up.astype(np.int16)
+        return [pcm[i].tobytes() for i in range(k)]
+
+    def _flush_outbound(self, group: list) -> list[np.ndarray]:
+        rows = np.fromiter((job[0] for job in group), dtype=np.intp, count=len(group))
+        n = len(group[0][1])
+        k = len(group)
+
+        x = np.empty((k, _DOWN_HISTORY + n), dtype=np.float32)  # [history, frame]
+        x[:, :_DOWN_HISTORY] = self._down_hist[rows]
+        samples = x[:, _DOWN_HISTORY:]
+        np.multiply(np.stack([job[1] for job in group]), 0.7 / 32768.0, out=samples)
+        np.tanh(samples, out=samples)  # soft limit — prevents SIP distortion
+        self._down_hist[rows] = x[:, -_DOWN_HISTORY:]
+
+        windows = sliding_window_view(x, len(_DOWN_TAPS), axis=1)[:, ::_RESAMPLE_RATIO]
+        down = windows[:, : n // _RESAMPLE_RATIO] @ _DOWN_TAPS  # (k, n / 6)
+        down *= 32767.0
+        pcm = down.astype(np.int16)
+        return [pcm[i] for i in range(k)]
+
+
+def _by_length(jobs: list, length) -> list[list]:
+    """Split jobs into same-block-size groups (almost always exactly one group)."""
+    groups: dict[int, list] = {}
+    for job in jobs:
+        groups.setdefault(length(job), []).append(job)
+    return list(groups.values())
+
+
+_batches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DSPBatch]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_dsp_batch() -> DSPBatch:
+    """The DSPBatch for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    batch = _batches.get(loop)
+    if batch is None:
+        batch = _batches[loop] = DSPBatch(loop)
+    return batch
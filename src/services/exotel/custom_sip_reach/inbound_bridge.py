@@ -32,7 +32,12 @@ from .rtp_bridge import RTPMediaBridge
 from .sip_client import format_exotel_number
 from src.core.db.db_schemas import Assistant, InboundSIP
 from src.services.livekit.livekit_svc import LiveKitService
-from src.services.outbound_dispatcher.dispatcher import try_reserve_slot, release_slot, _watch_agent_join
+from src.services.outbound_dispatcher.dispatcher import (
+    try_reserve_slot,
+    release_slot,
+    track_live_call,
+    _watch_agent_join,
+)
 from src.core.logger import logger, set_room_context, clear_room_context
 
 
@@ -285,7 +290,7 @@ async def handle_inbound_call(
         return
 
     try:
-        await livekit_service.initialize_call_record(
+        call_record = await livekit_service.initialize_call_record(
             room_name=room_name,
             assistant_id=assistant.assistant_id,
             assistant_name=assistant.assistant_name,
@@ -301,7 +306,8 @@ async def handle_inbound_call(
         await _reject("SIP/2.0 500 Internal Server Error", release=True)
         return
 
-    # Release in-memory reservation; CallRecord (status="initiated") now tracked via DB.
+    # Swap the in-memory reservation for the live-call entry of the CallRecord just written.
+    track_live_call(call_record)
     release_slot()
 
     if cancel_event.is_set():
@@ -0,0 +1,147 @@
+"""
+Adaptive jitter buffer for inbound RTP.
+
+Packets go in as they arrive (any order, duplicates, gaps); the bridge's playout
+loop takes exactly one out every 20 ms. Ordering is by RTP sequence number with
+16-bit wraparound; the RTP timestamp feeds the RFC 3550 interarrival-jitter
+estimate reported in stats.
+
+Depth adapts between a target and a maximum: every late packet (arrived after
+its slot was played) deepens the buffer by one packet, and a long run without
+late packets shrinks it back by one. Deepening mid-talkspurt holds the playout
+point (concealing) for up to one slot per added packet while the extra packets
+arrive, so added depth is added latency. When the sender stops (hold, DTX, end
+of call) the buffer drains and re-primes on the next packet instead of counting
+the silence as loss.
+
+Pure data structure — no asyncio, no sockets — so it is driven and tested
+directly; RTPMediaBridge owns the clock.
+"""
+
+from dataclasses import asdict, dataclass
+
+_SEQ_MOD = 1 << 16
+
+# pop() result for a slot whose packet never arrived — the caller conceals it.
+LOST = object()
+
+# Packets of clean playout (no late arrivals) before the depth steps back toward target.
+_SHRINK_AFTER_PACKETS = 500  # 10 s at 20 ms
+
+
+def _seq_diff(a: int, b: int) -> int:
+    """a − b in sequence space, in [-32768, 32767]."""
+    return ((a - b + _SEQ_MOD // 2) % _SEQ_MOD) - _SEQ_MOD // 2
+
+
+@dataclass
+class JitterStats:
+    received: int = 0
+    played: int = 0
+    late: int = 0         # arrived after its slot was played (or concealed)
+    lost: int = 0         # slot played with no packet — concealed
+    reordered: int = 0    # arrived before a packet with a lower sequence number
+    duplicate: int = 0
+    overflow: int = 0     # dropped by a skip-ahead when the buffer ran past max depth
+    depth: int = 0        # current target depth, packets
+    jitter_ms: float = 0.0
+
+
+class JitterBuffer:
+    def __init__(self, target_packets: int = 3, max_packets: int = 10, clock_rate: int = 8000):
+        self._target = max(1, target_packets)
+        self._max = max(self._target, max_packets)
+        self._clock_rate = clock_rate
+        self._depth = self._target
+        self._slots: dict[int, object] = {}  # seq → item
+        self._next_seq: int | None = None    # next slot to play; None while priming
+        self._hold_slots = 0                 # depth went up: slots to hold while it fills
+        self._highest_seq: int | None = None
+        self._clean_pops = 0
+        # RFC 3550 §6.4.1 interarrival jitter, in timestamp units
+        self._jitter = 0.0
+        self._last_transit: float | None = None
+        self.stats = JitterStats(depth=self._depth)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def push(self, seq: int, timestamp: int, arrival: float, item: object) -> None:
+        """Insert one packet. `arrival` is a monotonic clock in seconds."""
+        s = self.stats
+        s.received += 1
+
+        transit = arrival * self._clock_rate - timestamp
+        if self._last_transit is not None:
+            d = abs(transit - self._last_transit)
+            if d < self._clock_rate:  # ignore timestamp jumps (new talkspurt, SSRC change)
+                self._jitter += (d - self._jitter) / 16.0
+        self._last_transit = transit
+        s.jitter_ms = self._jitter * 1000.0 / self._clock_rate
+
+        if self._next_seq is not None and _seq_diff(seq, self._next_seq) < 0:
+            s.late += 1
+            self._clean_pops = 0
+            self._set_depth(self._depth + 1)
+            return
+        if seq in self._slots:
+            s.duplicate += 1
+            return
+        if self._highest_seq is not None and _seq_diff(seq, self._highest_seq) < 0:
+            s.reordered += 1
+        else:
+            self._highest_seq = seq
+        self._slots[seq] = item
+
+        if self._next_seq is not None and _seq_diff(seq, self._next_seq) >= self._max:
+            # Playout fell too far behind (burst after a stall): jump so that only the
+            # newest `depth` slots remain, rather than playing stale audio late.
+            new_next = (seq - self._depth + 1) % _SEQ_MOD
+            for old in [q for q in self._slots if _seq_diff(q, new_next) < 0]:
+                del self._slots[old]
+                s.overflow += 1
+            self._next_seq = new_next
+
+    def pop(self) -> object | None:
+        """Item for the next 20 ms slot, LOST for a gap (or a slot held while the
+        buffer deepens), or None while priming/drained."""
+        if self._next_seq is None:
+            if len(self._slots) < self._depth:
+                return None
+            self._next_seq = min(
+                self._slots, key=lambda q: _seq_diff(q, self._highest_seq)
+            )
+        if not self._slots:
+            # Sender went quiet. Re-prime when it comes back rather than count loss.
+            self._next_seq = None
+            self._hold_slots = 0
+            return None
+        if self._hold_slots:
+            self._hold_slots -= 1
+            if _seq_diff(self._highest_seq, self._next_seq) + 1 < self._depth:
+                return LOST  # conceal without advancing: the extra depth becomes delay
+            self._hold_slots = 0
+
+        seq = self._next_seq
+        self._next_seq = (seq + 1) % _SEQ_MOD
+        self._clean_pops += 1
+        if self._clean_pops >= _SHRINK_AFTER_PACKETS:
+            self._clean_pops = 0
+            self._set_depth(self._depth - 1)
+
+        item = self._slots.pop(seq, LOST)
+        if item is LOST:
+            self.stats.lost += 1
+        else:
+            self.stats.played += 1
+        return item
+
+    def _set_depth(self, depth: int) -> None:
+        depth = min(self._max, max(self._target, depth))
+        if depth > self._depth and self._next_seq is not None:
+            self._hold_slots += depth - self._depth
+        self._depth = depth
+        self.stats.depth = self._depth
+
+    def snapshot(self) -> dict:
+        return asdict(self.stats)
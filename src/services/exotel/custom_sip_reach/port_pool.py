@@ -4,48 +4,165 @@ Thread-safe port pool for allocating RTP UDP ports.
 Each concurrent SIP call needs a unique port pair (RTP + RTCP).
 Includes a cooldown period after release to avoid stale-packet crossover
 when a port is reused immediately.
+
+Ports ready for use sit in a min-heap (lowest port first, as before); released
+ports wait in a FIFO in release order — which is also cooldown-expiry order —
+and move to the heap once their cooldown has passed. acquire() and release()
+are O(log n) regardless of how wide the port range is.
+
+Across processes: with a lease directory (RTP_PORT_LOCK_DIR), a port is only
+handed out once this process holds an exclusive flock on <dir>/<port>.lock.
+The kernel drops the lock when the holder exits, however it exits, so a killed
+dispatcher, listener or bridge can never leak a port. On release the holder
+writes its release time into the file before unlocking, and whichever process
+takes the port next honours the same cooldown. Ports found held (or cooling)
+by another process are retried after a cooldown of their own.
 """
 
+import heapq
+import os
 import threading
 import time
+from collections import deque
 
-from .config import RTP_PORT_START, RTP_PORT_END
+try:
+    import fcntl
+except ImportError:  # Windows dev boxes: per-process pool only
+    fcntl = None
+
+from .config import RTP_PORT_START, RTP_PORT_END, RTP_PORT_LOCK_DIR
 from src.core.logger import logger
 
 
 class PortPool:
-    """Thread-safe pool of UDP ports for RTP sockets."""
+    """Thread-safe pool of UDP ports for RTP sockets, optionally shared host-wide."""
 
     COOLDOWN_SECONDS = 5  # minimum seconds before a released port can be reused
 
-    def __init__(self, start: int, end: int):
+    def __init__(self, start: int, end: int, lock_dir: str | None = None):
         # Step by 2 so port+1 is free for RTCP
-        # Map port → release_timestamp (0.0 = immediately eligible)
-        self._free: dict[int, float] = {p: 0.0 for p in range(start, end, 2)}
+        self._ports = frozenset(range(start, end, 2))
+        self._ready: list[int] = sorted(self._ports)  # sorted list is a valid heap
+        self._cooling: deque[tuple[float, int]] = deque()  # (released_at, port), oldest first
+        self._cooling_ports: set[int] = set()
+        self._remote: set[int] = set()  # cooling here because another process had them
+        self._in_use: set[int] = set()
+        self._leases: dict[int, int] = {}  # port → fd holding its flock
         self._lock = threading.Lock()
-        logger.info(f"[PortPool] Ready with {len(self._free)} ports ({start}-{end})")
+
+        self._lock_dir = lock_dir if lock_dir and fcntl is not None else None
+        if lock_dir and self._lock_dir is None:
+            logger.warning("[PortPool] fcntl unavailable — port leases are per-process only")
+        if self._lock_dir:
+            os.makedirs(self._lock_dir, exist_ok=True)
+        logger.info(
+            f"[PortPool] Ready with {len(self._ports)} ports ({start}-{end})"
+            + (f", leases in {self._lock_dir}" if self._lock_dir else "")
+        )
+
+    def _promote_cooled(self, now: float) -> None:
+        while self._cooling and now - self._cooling[0][0] >= self.COOLDOWN_SECONDS:
+            _, port = self._cooling.popleft()
+            self._cooling_ports.discard(port)
+            self._remote.discard(port)
+            heapq.heappush(self._ready, port)
+
+    def _cool(self, port: int, now: float) -> None:
+        self._cooling.append((now, port))
+        self._cooling_ports.add(port)
+
+    # ── Host-wide leases ─────────────────────────────────────────────────────
+
+    def _take_lease(self, port: int) -> bool:
+        """Lock port's lease file. False if another process holds it or it is cooling."""
+        if self._lock_dir is None:
+            return True
+        fd = os.open(os.path.join(self._lock_dir, f"{port}.lock"), os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        try:
+            released_at = float(os.pread(fd, 32, 0) or 0)
+        except ValueError:
+            released_at = 0.0  # torn write from a holder killed mid-release
+        if time.time() - released_at < self.COOLDOWN_SECONDS:
+            os.close(fd)  # closing drops the flock
+            return False
+        self._leases[port] = fd
+        return True
+
+    def _drop_lease(self, port: int) -> None:
+        fd = self._leases.pop(port, None)
+        if fd is None:
+            return
+        try:
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, repr(time.time()).encode(), 0)
+        finally:
+            os.close(fd)
+
+    # ── Public API ───────────────────────────────────────────────────────────
 
     def acquire(self) -> int:
         with self._lock:
-            now = time.time()
-            eligible = [
-                p for p, released_at in self._free.items()
-                if now - released_at >= self.COOLDOWN_SECONDS
-            ]
-            if not eligible:
+            now = time.monotonic()
+            self._promote_cooled(now)
+            port = None
+            while self._ready:
+                candidate = heapq.heappop(self._ready)
+                if self._take_lease(candidate):
+                    port = candidate
+                    break
+                self._cool(candidate, now)
+                self._remote.add(candidate)
+            if port is None:
                 raise RuntimeError(
-                    f"No free RTP ports in {RTP_PORT_START}-{RTP_PORT_END}. "
+                    f"No free RTP ports in {RTP_PORT_START}-{RTP_PORT_END} "
+                    f"({self._stats_locked()}). "
                     "Increase RTP_PORT_END or reduce concurrent calls."
                 )
-            port = min(eligible)
-            del self._free[port]
-            logger.debug(f"[PortPool] Acquired {port}. Remaining: {len(self._free)}")
+            self._in_use.add(port)
+            logger.debug(f"[PortPool] Acquired {port}. {self._stats_locked()}")
             return port
 
     def release(self, port: int) -> None:
         with self._lock:
-            self._free[port] = time.time()  # start cooldown
-            logger.debug(f"[PortPool] Released {port}. Remaining: {len(self._free)}")
+            if port not in self._in_use:
+                # Double release, or a port this pool never handed out — nothing to free.
+                logger.debug(f"[PortPool] Ignoring release of {port}: not in use")
+                return
+            self._in_use.remove(port)
+            try:
+                self._drop_lease(port)
+            except OSError as e:
+                logger.warning(f"[PortPool] Could not record release of {port}: {e}")
+            self._cool(port, time.monotonic())  # start cooldown
+            logger.debug(f"[PortPool] Released {port}. {self._stats_locked()}")
+
+    def _stats_locked(self) -> str:
+        s = self._counts()
+        return (
+            f"free={s['free']} cooling={s['cooling']} "
+            f"in_use={s['in_use']} other_process={s['other_process']}"
+        )
+
+    def _counts(self) -> dict[str, int]:
+        return {
+            "free": len(self._ready),
+            "cooling": len(self._cooling_ports) - len(self._remote),
+            "in_use": len(self._in_use),
+            "other_process": len(self._remote),
+        }
+
+    def stats(self) -> dict[str, int]:
+        """Gauges: ports free now, cooling down after release, held by this process's
+        calls, and last seen held or cooling in another process (rechecked after a cooldown).
+        """
+        with self._lock:
+            self._promote_cooled(time.monotonic())
+            return self._counts()
 
 
 _port_pool: PortPool | None = None
@@ -56,5 +173,5 @@ def get_port_pool() -> PortPool:
     global _port_pool
     with _port_pool_lock:
         if _port_pool is None:
-            _port_pool = PortPool(RTP_PORT_START, RTP_PORT_END)
+            _port_pool = PortPool(RTP_PORT_START, RTP_PORT_END, lock_dir=RTP_PORT_LOCK_DIR)
         return _port_pool
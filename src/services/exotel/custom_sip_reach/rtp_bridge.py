@@ -16,9 +16,11 @@ import socket
 import struct
 import time
 from collections.abc import AsyncIterator
+from functools import lru_cache
 
 import audioop
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.signal import butter, resample_poly, sosfilt, sosfilt_zi, firwin
 
 from livekit import rtc
@@ -26,11 +28,16 @@ from livekit import rtc
 from .config import (
     PCMA_PAYLOAD_TYPE,
     PCMU_PAYLOAD_TYPE,
+    RTP_BATCH_DSP,
     RTP_HEADER_SIZE,
     SAMPLE_RATE_LK,
     SAMPLE_RATE_SIP,
     MAX_FRAME_BUFFER,
+    RTP_JITTER_MAX_MS,
+    RTP_JITTER_TARGET_MS,
+    RTP_PLC_MAX_PACKETS,
 )
+from .jitter_buffer import LOST, JitterBuffer
 from src.core.logger import logger
 
 # High-pass at 80 Hz removes DC offset and sub-bass hum without touching speech.
@@ -42,11 +49,177 @@ _HP_ZI_TEMPLATE = sosfilt_zi(_HP_SOS)  # shape (n_sections, 2), scaled per-packe
 # Pin our own custom FIR filter to protect against SciPy updates.
 # A filter with half_len=10 has 2 * 10 * 6 + 1 = 121 taps, group delay is exactly 10 samples (at low rate)
 _RESAMPLE_FILTER = firwin(121, 1.0 / 6.0, window=("kaiser", 5.0))
+_RESAMPLE_RATIO = SAMPLE_RATE_LK // SAMPLE_RATE_SIP  # 6
+_RESAMPLE_HALF = 10  # filter half-length in low-rate samples → 20 samples of history inbound
+
+# The same FIR, rearranged for direct polyphase use (what resample_poly does internally,
+# minus its per-call padding and allocation). Inbound: one column per output phase, rows
+# ordered to line up with a 21-sample sliding window over [history, packet].
+# out[6q + p] = 6 · Σ_j x[q + j] · h[6·(20 − j) + p]
+_UP_TAPS = 2 * _RESAMPLE_HALF + 1
+_UP_PHASES = np.zeros((_UP_TAPS, _RESAMPLE_RATIO), dtype=np.float32)
+for _j in range(_UP_TAPS):
+    for _p in range(_RESAMPLE_RATIO):
+        _i = _RESAMPLE_RATIO * (_UP_TAPS - 1 - _j) + _p
+        if _i < len(_RESAMPLE_FILTER):
+            _UP_PHASES[_j, _p] = _RESAMPLE_RATIO * _RESAMPLE_FILTER[_i]
+# Outbound: out[q] = Σ_j x[6q + j] · h[120 − j] over a 121-sample window stepping by 6.
+_DOWN_TAPS = _RESAMPLE_FILTER[::-1].astype(np.float32)
+_DOWN_HISTORY = 2 * _RESAMPLE_HALF * _RESAMPLE_RATIO  # 120 samples at 48 kHz
+
+# G.711 as lookup tables — built once from audioop so the codec matches it bit for bit.
+# Decode: 256 code bytes → float32 in [-1, 1). Encode: 65536 int16 values → code byte.
+_ALAW_TO_FLOAT = (
+    np.frombuffer(audioop.alaw2lin(bytes(range(256)), 2), dtype=np.int16).astype(np.float32)
+    / 32768.0
+)
+_ULAW_TO_FLOAT = (
+    np.frombuffer(audioop.ulaw2lin(bytes(range(256)), 2), dtype=np.int16).astype(np.float32)
+    / 32768.0
+)
+_ALL_INT16 = np.arange(-32768, 32768, dtype=np.int16).tobytes()
+_LIN_TO_ALAW = np.frombuffer(audioop.lin2alaw(_ALL_INT16, 2), dtype=np.uint8)
+_LIN_TO_ULAW = np.frombuffer(audioop.lin2ulaw(_ALL_INT16, 2), dtype=np.uint8)
+del _ALL_INT16, _j, _p, _i
+
+
+@lru_cache(maxsize=4)
+def _hp_block_matrix(n: int) -> np.ndarray:
+    """The 80 Hz high-pass over one n-sample block, as a single matrix.
+
+    The filter is linear, so [y; z_out] = F @ [x; z_in] exactly, where z is sosfilt's
+    (1, 2) state flattened. Columns are the filter's response to each unit input sample and
+    each unit state. One (n+2)² matmul replaces a per-packet sosfilt call, which was most of
+    the inbound cost (~60 µs of Python/C round trip for 160 samples).
+    """
+    size = n + _HP_SOS.shape[0] * 2
+    f = np.zeros((size, size))
+    basis = np.eye(size)
+    for k in range(size):
+        x, z = basis[k, :n], basis[k, n:].reshape(_HP_SOS.shape[0], 2)
+        y, zf = sosfilt(_HP_SOS, x, zi=z)
+        f[:n, k] = y
+        f[n:, k] = zf.ravel()
+    return f.astype(np.float32)
+
+
+class _InboundDSP:
+    """Per-bridge SIP→LiveKit path: G.711 → 80 Hz high-pass → 8k→48k → soft clip → int16.
+
+    Same output as _decode_rtp_payload(), but into buffers allocated once per bridge: a
+    packet costs a table lookup, two small matmuls and the final tobytes().
+    Grows its buffers if a packet isn't the usual 160 samples.
+    """
+
+    def __init__(self):
+        self._hp_started = False
+        self._alloc(160)
+
+    def _alloc(self, n: int) -> None:
+        h = 2 * _RESAMPLE_HALF
+        history = self._x[:h].copy() if hasattr(self, "_x") else np.zeros(h, dtype=np.float32)
+        self._n = n
+        self._x = np.zeros(h + n, dtype=np.float32)  # [history, packet]
+        self._x[:h] = history
+        self._windows = sliding_window_view(self._x, _UP_TAPS)  # (n, 21) view, no copy
+        state = self._xz[-2:].copy() if hasattr(self, "_xz") else np.zeros(2, dtype=np.float32)
+        self._hp = _hp_block_matrix(n)
+        self._xz = np.empty(n + 2, dtype=np.float32)  # [packet, high-pass state]
+        self._xz[n:] = state
+        self._yz = np.empty(n + 2, dtype=np.float32)
+        self._up = np.empty((n, _RESAMPLE_RATIO), dtype=np.float32)
+        self._up_flat = self._up.reshape(-1)  # interleaved phases = 48 kHz stream
+        self._pcm = np.empty(n * _RESAMPLE_RATIO, dtype=np.int16)
+
+    def process(self, payload: bytes, pt: int) -> bytes:
+        """Decode one RTP payload. Non-G.711 payload types (DTMF, CN) decode to b""."""
+        if pt == PCMA_PAYLOAD_TYPE:
+            table = _ALAW_TO_FLOAT
+        elif pt == PCMU_PAYLOAD_TYPE:
+            table = _ULAW_TO_FLOAT
+        else:
+            return b""
+        n = len(payload)
+        if n == 0:
+            return b""
+        if n != self._n:
+            self._alloc(n)
+
+        x, xz, yz = self._x, self._xz, self._yz
+        h = 2 * _RESAMPLE_HALF
+        np.take(table, np.frombuffer(payload, dtype=np.uint8), out=xz[:n])
+
+        # Scale template to first-sample DC level (scipy idiom) to suppress startup transient.
+        if not self._hp_started:
+            xz[n:] = (_HP_ZI_TEMPLATE * xz[0]).ravel()
+            self._hp_started = True
+        np.matmul(self._hp, xz, out=yz)  # high-pass the packet and advance the filter state
+        x[h:] = yz[:n]
+        xz[n:] = yz[n:]
+
+        np.matmul(self._windows, _UP_PHASES, out=self._up)
+        x[:h] = x[-h:]  # this packet's tail is the next packet's history
+        out = self._up_flat
+        out *= 1.5
+        np.tanh(out, out=out)  # boost quiet phone audio, soft-clip peaks
+        out *= 32767.0
+        np.copyto(self._pcm, out, casting="unsafe")
+        return self._pcm.tobytes()
+
+
+class _OutboundDSP:
+    """Per-bridge LiveKit→SIP path: int16 48 kHz → soft limit → 48k→8k → int16 8 kHz.
+
+    The allocation-free counterpart of the resample_poly path _send_frame used to run,
+    with G.711 encoding by lookup table. Grows its buffers if a frame isn't 10 ms.
+    """
+
+    def __init__(self):
+        self._alloc(480)
+
+    def _alloc(self, n: int) -> None:
+        if hasattr(self, "_x"):
+            history = self._x[:_DOWN_HISTORY].copy()
+        else:
+            history = np.zeros(_DOWN_HISTORY, dtype=np.float32)
+        self._n = n
+        self._x = np.zeros(_DOWN_HISTORY + n, dtype=np.float32)  # [history, frame]
+        self._x[:_DOWN_HISTORY] = history
+        # One 121-sample window per 8 kHz output sample — a strided view, no copy.
+        self._windows = sliding_window_view(self._x, len(_DOWN_TAPS))[::_RESAMPLE_RATIO][
+            : n // _RESAMPLE_RATIO
+        ]
+        self._down = np.empty(n // _RESAMPLE_RATIO, dtype=np.float32)
+        self._pcm = np.empty(n // _RESAMPLE_RATIO, dtype=np.int16)
+
+    def process(self, pcm48: memoryview | bytes) -> np.ndarray:
+        """Resample one frame of 48 kHz int16 PCM. Returns a reused int16 buffer."""
+        frame = np.frombuffer(pcm48, dtype=np.int16)
+        if len(frame) != self._n:
+            self._alloc(len(frame))
+        x = self._x
+        samples = x[_DOWN_HISTORY:]
+        np.multiply(frame, 0.7 / 32768.0, out=samples)
+        np.tanh(samples, out=samples)  # soft limit — prevents SIP distortion
+        np.matmul(self._windows, _DOWN_TAPS, out=self._down)
+        x[:_DOWN_HISTORY] = x[-_DOWN_HISTORY:]  # carried into the next frame
+        self._down *= 32767.0
+        np.copyto(self._pcm, self._down, casting="unsafe")
+        return self._pcm
+
+    @staticmethod
+    def encode(pcm8: np.ndarray, pt: int) -> bytes:
+        """G.711-encode int16 samples with the lookup table for payload type `pt`."""
+        table = _LIN_TO_ALAW if pt == PCMA_PAYLOAD_TYPE else _LIN_TO_ULAW
+        return table[pcm8.view(np.uint16) ^ 0x8000].tobytes()
 
 
 def _decode_rtp_payload(payload: bytes, pt: int, state: object) -> tuple[bytes, object]:
     """Decode G.711, high-pass filter (80 Hz), resample 8 kHz→48 kHz.
 
+    Reference implementation of what _InboundDSP does per bridge; allocates ~10 arrays
+    per packet. Kept for the equivalence tests and scripts/bench_rtp_dsp.py.
+
     Uses stateful polyphase resampling (scipy) with overlap-save to avoid packet
     boundary transients and aliasing artifacts that degrade voice quality and STT.
     state: tuple of (hp_zi, resample_history) or None, or just hp_zi (for backward compatibility).
@@ -134,8 +307,16 @@ class RTPMediaBridge:
         self._rtp_ts = random.randint(0, 0xFFFFFFFF)
         self._rtp_ssrc = random.randint(0, 0xFFFFFFFF)
 
-        self._hp_zi = (None, np.zeros(20, dtype=np.float32))  # state tuple for inbound high-pass + stateful upsampler
-        self._outbound_resample_history = np.zeros(120, dtype=np.float32)  # stateful downsampler overlap history
+        self._rx_dsp = _InboundDSP()   # high-pass + upsampler state and buffers, SIP→LiveKit
+        self._tx_dsp = _OutboundDSP()  # downsampler state and buffers, LiveKit→SIP
+        # With RTP_BATCH_DSP, filter state lives in a row of the loop's shared DSPBatch
+        # instead, and packets are transcoded together with every other bridge on this loop.
+        self._dsp_batch = None
+        self._dsp_row: int | None = None
+        if RTP_BATCH_DSP:
+            from .dsp_batch import get_dsp_batch
+            self._dsp_batch = get_dsp_batch()
+            self._dsp_row = self._dsp_batch.register()
 
         self._rx = 0
         self._tx = 0
@@ -164,9 +345,16 @@ class RTPMediaBridge:
         self._mixer_task: asyncio.Task | None = None
         self._track_streams: list[rtc.AudioStream] = []
 
-        # Bounded inbound RTP queue. ~1s @ 50pps. _on_rtp_readable drops oldest on overflow
-        # so playback can't drift behind real-time under bursty input.
-        self._recv_queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+        # Inbound RTP is reordered by sequence number and played out every 20 ms by
+        # _recv_loop. The buffer skips ahead past RTP_JITTER_MAX_MS so playback can't
+        # drift behind real-time under bursty input.
+        self._jitter = JitterBuffer(
+            target_packets=max(1, RTP_JITTER_TARGET_MS // 20),
+            max_packets=max(1, RTP_JITTER_MAX_MS // 20),
+            clock_rate=SAMPLE_RATE_SIP,
+        )
+        self._last_pcm48 = b""   # last decoded frame, repeated (fading) to conceal loss
+        self._concealed_run = 0
 
     def set_early_media_endpoint(self, ip: str, port: int, pt: int = PCMA_PAYLOAD_TYPE):
         """Unlock inbound RTP (SIP→web) before answer. Used by passthrough calls on 183+SDP.
@@ -245,35 +433,8 @@ class RTPMediaBridge:
             # from a prior call (port reuse) leaking audio into the wrong room.
             if self._remote_addr and addr != self._remote_addr:
                 return
-            try:
-                self._recv_queue.put_nowait((data, addr))
-            except asyncio.QueueFull:
-                # Drop oldest to keep playback aligned with real-time.
-                try:
-                    self._recv_queue.get_nowait()
-                    self._recv_queue.put_nowait((data, addr))
-                except Exception:
-                    pass
-        except BlockingIOError:
-            pass  # no data yet, ignore
-        except Exception as e:
-            logger.error(f"[RTP] recvfrom error: {e}")
-
-    async def _recv_loop(self):
-        logger.info(f"[RTP] recv_loop STARTED port={self.local_port}")
-        while self._running:
-            try:
-                data, addr = await asyncio.wait_for(self._recv_queue.get(), timeout=5.0)
-            except asyncio.TimeoutError:
-                continue  # just check _running flag
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"[RTP] Queue error: {e}")
-                continue
-
             if len(data) <= RTP_HEADER_SIZE:
-                continue
+                return
 
             if not self._first_rx:
                 # Lock onto first sender if remote not yet set (inbound flow)
@@ -287,18 +448,58 @@ class RTPMediaBridge:
             self._last_rx_ts = time.time()
 
             if not self._rx_ready:
-                continue  # gates closed: agent calls wait for 200 OK, passthrough opens on 183
+                return  # gates closed: agent calls wait for 200 OK, passthrough opens on 183
 
+            seq, ts = struct.unpack_from("!HI", data, 2)
             pt = data[1] & 0x7F
-            payload = data[RTP_HEADER_SIZE:]
+            self._jitter.push(seq, ts, time.monotonic(), (pt, data[RTP_HEADER_SIZE:]))
+        except BlockingIOError:
+            pass  # no data yet, ignore
+        except Exception as e:
+            logger.error(f"[RTP] recvfrom error: {e}")
+
+    def _conceal(self) -> bytes:
+        """Stand-in for a lost packet: the last frame again, fading out; then nothing."""
+        self._concealed_run += 1
+        if not self._last_pcm48 or self._concealed_run > RTP_PLC_MAX_PACKETS:
+            return b""
+        gain = 0.5 ** self._concealed_run
+        faded = np.frombuffer(self._last_pcm48, dtype=np.int16) * gain
+        return faded.astype(np.int16).tobytes()
 
+    async def _recv_loop(self):
+        """Play out the jitter buffer at a steady 20 ms cadence.
+
+        Ticks sit on a shared 20 ms grid of the loop clock, so every bridge on a loop wakes
+        in the same iteration — which is what lets DSPBatch transcode them together.
+        """
+        logger.info(f"[RTP] recv_loop STARTED port={self.local_port}")
+        loop = asyncio.get_running_loop()
+        tick = (loop.time() // 0.02 + 1) * 0.02
+        while self._running:
             try:
-                # Decode in thread pool so the event loop can schedule other coroutines.
-                # sosfilt returns a new zi array (no in-place mutation) so passing self._hp_zi
-                # to the thread is safe — no shared-state race with the next packet.
-                pcm48, self._hp_zi = await asyncio.to_thread(
-                    _decode_rtp_payload, payload, pt, self._hp_zi
-                )
+                await asyncio.sleep(max(0.0, tick - loop.time()))
+            except asyncio.CancelledError:
+                break
+            tick += 0.02
+            if tick < loop.time() - 0.1:
+                tick = (loop.time() // 0.02 + 1) * 0.02  # stalled; don't burst to catch up
+
+            item = self._jitter.pop()
+            if item is None:
+                continue  # priming, or the sender is quiet
+            try:
+                if item is LOST:
+                    pcm48 = self._conceal()
+                else:
+                    pt, payload = item
+                    if self._dsp_row is not None:
+                        pcm48 = await self._dsp_batch.decode(self._dsp_row, payload, pt)
+                    else:
+                        pcm48 = self._rx_dsp.process(payload, pt)
+                    if pcm48:
+                        self._last_pcm48 = pcm48
+                        self._concealed_run = 0
                 if not pcm48:
                     continue
                 frame = rtc.AudioFrame(
@@ -308,6 +509,8 @@ class RTPMediaBridge:
                     samples_per_channel=len(pcm48) // 2,
                 )
                 await self._audio_source.capture_frame(frame)
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"[RTP] Decode error: {e}", exc_info=True)
 
@@ -363,37 +566,21 @@ class RTPMediaBridge:
         if not self._tx_ready or not self._remote_addr:
             return
         try:
-            raw = bytes(frame.data.cast("b"))
-            samples_48k = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
-            samples_48k = np.tanh(samples_48k * 0.7)      # soft limit — prevents SIP distortion
-
-            # Stateful polyphase downsampling (48 kHz -> 8 kHz, up=1, down=6)
-            # Prepend history of 120 samples to avoid left-edge filter boundary transients.
-            full_input = np.concatenate([self._outbound_resample_history, samples_48k])
-            self._outbound_resample_history = full_input[-len(self._outbound_resample_history):]
-
-            resampled_full = resample_poly(full_input, 1, 6, window=_RESAMPLE_FILTER)
-
-            # Group delay is 60 samples at high-rate. Align output:
-            start_idx = (len(self._outbound_resample_history) - 60) // 6
-            end_idx = start_idx + len(samples_48k) // 6
-            samples_8k = resampled_full[start_idx:end_idx]
-
-            pcm8 = (samples_8k * 32767.0).astype(np.int16).tobytes()
-            self._pcm_accumulator.extend(pcm8)
+            # Soft limit + stateful polyphase 48 kHz → 8 kHz, in the bridge's own buffers.
+            if self._dsp_row is not None:
+                samples_8k = await self._dsp_batch.downsample(self._dsp_row, frame.data.cast("B"))
+            else:
+                samples_8k = self._tx_dsp.process(frame.data.cast("B"))
+            self._pcm_accumulator.extend(samples_8k.data)
 
             # Send one packet per full 20ms chunk; discard any remainder
             # (remainder is < 10ms and will be completed by the next frame)
             while len(self._pcm_accumulator) >= self._PTIME_BYTES:
-                chunk = bytes(self._pcm_accumulator[: self._PTIME_BYTES])
+                chunk = np.frombuffer(self._pcm_accumulator, dtype=np.int16, count=160)
+                payload = _OutboundDSP.encode(chunk, self.negotiated_pt)
+                del chunk  # release the buffer export before resizing the bytearray
                 del self._pcm_accumulator[: self._PTIME_BYTES]
 
-                payload = (
-                    audioop.lin2alaw(chunk, 2)
-                    if self.negotiated_pt == PCMA_PAYLOAD_TYPE
-                    else audioop.lin2ulaw(chunk, 2)
-                )
-
                 # Timestamp advances by exactly 160 samples (20ms @ 8kHz)
                 self._rtp_seq = (self._rtp_seq + 1) & 0xFFFF
                 self._rtp_ts = (self._rtp_ts + 160) & 0xFFFFFFFF
@@ -435,6 +622,9 @@ class RTPMediaBridge:
 
     def stop(self):
         self._running = False
+        if self._dsp_batch is not None and self._dsp_row is not None:
+            self._dsp_batch.unregister(self._dsp_row)
+            self._dsp_row = None
         # Cancel the mixer output loop
         if self._mixer_task and not self._mixer_task.done():
             self._mixer_task.cancel()
@@ -450,7 +640,9 @@ class RTPMediaBridge:
             self._sock.close()
         except Exception:
             pass
-        logger.info(f"[RTP] Stopped | RX={self._rx} TX={self._tx}")
+        logger.info(
+            f"[RTP] Stopped | RX={self._rx} TX={self._tx} | jitter={self._jitter.snapshot()}"
+        )
         if self._rx == 0:
             logger.warning(
                 "[RTP] ⚠️  ZERO inbound packets! Likely causes:\n"
@@ -462,6 +654,10 @@ class RTPMediaBridge:
                 self.local_port,
             )
 
+    def jitter_stats(self) -> dict:
+        """Inbound jitter buffer counters: late, lost, reordered, duplicate, depth, jitter_ms."""
+        return self._jitter.snapshot()
+
     def seconds_since_rx(self) -> float | None:
         if self._last_rx_ts is None:
             return None
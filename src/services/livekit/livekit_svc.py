@@ -4,7 +4,7 @@ import json
 import time
 import httpx
 from contextlib import asynccontextmanager
-from typing import List, Optional, Dict, Literal
+from typing import AsyncIterator, List, Optional, Dict, Literal
 from datetime import datetime, timezone
 from livekit import api
 from livekit.api import LiveKitAPI, AccessToken, VideoGrants
@@ -15,17 +15,21 @@ from livekit.protocol.sip import (
 )
 from src.core.config import settings
 from src.core.logger import logger
-from src.core.billing import calculate_billable_duration_minutes, NON_BILLABLE_FINAL_STATUSES
-from src.core.db.db_schemas import CallRecord, Assistant, ActivityLog, UsageRecord
+from src.core.billing import (
+    calculate_billable_duration_minutes,
+    NON_BILLABLE_FINAL_STATUSES,
+    TERMINAL_CALL_STATUSES,
+)
+from beanie import UpdateResponse
+from pymongo.errors import BulkWriteError
+from pydantic_core import to_jsonable_python
+from beanie.operators import In
+from src.core.db.db_schemas import CallRecord, CallTranscript, Assistant, ActivityLog, UsageRecord
+from src.services.analytics import apply_call_rollup
 
 
 PASSTHROUGH_ROOM_PREFIX = "passthrough"
 
-# A call that reached any of these is finalized: duration written and end-call webhook
-# already sent. Both end_call()'s dedupe guard and the dispatcher's safety net read this,
-# so the two can't drift apart on what "already ended" means.
-TERMINAL_CALL_STATUSES = NON_BILLABLE_FINAL_STATUSES | {"completed"}
-
 
 class LiveKitService:
     # Shared client reused across all operations to avoid per-call connection overhead
@@ -141,33 +145,75 @@ class LiveKitService:
         platform_number: Optional[str] = None,
         timestamp: Optional[datetime] = None,
     ):
-        """Append a transcript entry to an existing call record or create a new one.
+        """Append one transcript entry. See add_transcripts."""
+        await self.add_transcripts(
+            room_name=room_name,
+            entries=[{
+                "speaker": speaker,
+                "text": text,
+                "timestamp": timestamp or datetime.now(timezone.utc),
+            }],
+            assistant_id=assistant_id,
+            assistant_name=assistant_name,
+            to_number=to_number,
+            recording_path=recording_path,
+            created_by_email=created_by_email,
+            call_type=call_type,
+            call_service=call_service,
+            platform_number=platform_number,
+        )
+
+    async def add_transcripts(
+        self,
+        room_name: str,
+        entries: List[Dict],
+        assistant_id: str,
+        assistant_name: str,
+        to_number: str,
+        recording_path: Optional[str],
+        created_by_email: Optional[str] = None,
+        call_type: Optional[str] = None,
+        call_service: Optional[str] = None,
+        platform_number: Optional[str] = None,
+    ):
+        """Append a batch of transcript entries to a call, creating its record if missing.
 
-        `timestamp` is when the utterance was captured, not when it is written. User
-        transcripts come back from Sarvam after a network round-trip, so they can be
-        written after the agent reply they triggered — the $sort below slots them back
-        into speaking order.
+        Each entry is {speaker, text, timestamp}, where timestamp is when the utterance
+        was captured, not when it is written. User transcripts come back from Sarvam after
+        a network round-trip, so they can be written after the agent reply they triggered;
+        readers order by (timestamp, seq), which slots them back into speaking order.
+
+        Lines go to call_transcripts. The CallRecord only gets its count and last-spoken
+        time bumped, and that same atomic update reserves the batch's seq numbers — so
+        the cost of a write does not grow with the length of the call. If the insert
+        fails, the count is taken back down by the lines that were not written.
         """
-        entry = {
-            "speaker": speaker,
-            "text": text,
-            "timestamp": timestamp or datetime.now(timezone.utc),
-        }
-        # Atomic append. A read-modify-save() here would race the other writers of this
-        # document (update_call_status, end_call, the dispatcher safety net) and could
-        # overwrite transcripts with a stale snapshot.
-        result = await CallRecord.find_one(CallRecord.room_name == room_name).update(
-            {"$push": {"transcripts": {"$each": [entry], "$sort": {"timestamp": 1}}}}
+        if not entries:
+            return
+        entries = sorted(entries, key=lambda e: e["timestamp"])
+        last_at = entries[-1]["timestamp"]
+        # Atomic bump. A read-modify-save() here would race the other writers of this
+        # document (update_call_status, end_call, the dispatcher safety net).
+        before = await CallRecord.find_one(CallRecord.room_name == room_name).update(
+            {
+                "$inc": {"transcript_count": len(entries)},
+                "$max": {"transcript_last_at": last_at},
+            },
+            response_type=UpdateResponse.OLD_DOCUMENT,
         )
-        if getattr(result, "matched_count", 0) == 0:
+        if before is not None:
+            first_seq = before.transcript_count
+        else:
             # Create new call record (fallback if initialize_call_record was not called)
+            first_seq = 0
             call_record = CallRecord(
                 room_name=room_name,
                 assistant_id=assistant_id,
                 assistant_name=assistant_name,
                 to_number=to_number,
                 recording_path=recording_path,
-                transcripts=[entry],
+                transcript_count=len(entries),
+                transcript_last_at=last_at,
                 started_at=datetime.now(timezone.utc),
                 created_by_email=created_by_email,
                 call_type=call_type,
@@ -176,6 +222,51 @@ class LiveKitService:
             )
             await call_record.insert()
 
+        try:
+            await CallTranscript.insert_many([
+                CallTranscript(
+                    room_name=room_name,
+                    seq=first_seq + i,
+                    speaker=entry["speaker"],
+                    text=entry["text"],
+                    timestamp=entry["timestamp"],
+                )
+                for i, entry in enumerate(entries)
+            ])
+        except Exception as e:
+            # The seq numbers stay reserved (a gap is harmless); the count must not
+            # claim lines that were never written.
+            written = e.details.get("nInserted", 0) if isinstance(e, BulkWriteError) else 0
+            await CallRecord.find_one(CallRecord.room_name == room_name).update(
+                {"$inc": {"transcript_count": written - len(entries)}}
+            )
+            raise
+
+    async def iter_transcript(self, room_name: str) -> AsyncIterator[Dict]:
+        """Stream a call's transcript lines in speaking order, one {speaker, text, timestamp} at a time."""
+        lines = CallTranscript.find(CallTranscript.room_name == room_name).sort(
+            +CallTranscript.timestamp, +CallTranscript.seq
+        )
+        async for line in lines:
+            yield {"speaker": line.speaker, "text": line.text, "timestamp": line.timestamp}
+
+    async def get_transcripts(self, room_names: List[str]) -> Dict[str, List[Dict]]:
+        """Transcripts for several calls in one query, keyed by room_name.
+
+        Rooms with no lines are absent from the result.
+        """
+        transcripts: Dict[str, List[Dict]] = {}
+        if not room_names:
+            return transcripts
+        lines = CallTranscript.find(In(CallTranscript.room_name, list(room_names))).sort(
+            +CallTranscript.room_name, +CallTranscript.timestamp, +CallTranscript.seq
+        )
+        async for line in lines:
+            transcripts.setdefault(line.room_name, []).append(
+                {"speaker": line.speaker, "text": line.text, "timestamp": line.timestamp}
+            )
+        return transcripts
+
     async def initialize_call_record(
         self,
         room_name: str,
@@ -288,6 +379,8 @@ class LiveKitService:
         elif call_status in NON_BILLABLE_FINAL_STATUSES:
             call_record.billable_duration_minutes = 0
         await call_record.save()
+        if call_status in TERMINAL_CALL_STATUSES:
+            await apply_call_rollup(room_name)
         return call_record
 
     async def mark_agent_ready(self, room_name: str) -> None:
@@ -429,6 +522,10 @@ class LiveKitService:
             return
         full_data = json.loads(call_record.model_dump_json())
         filtered_data = {key: value for key, value in full_data.items() if key not in ["id"]}
+        # Webhook consumers have always received the full transcript inline.
+        filtered_data["transcripts"] = to_jsonable_python(
+            [line async for line in self.iter_transcript(room_name)]
+        )
 
         # Enrich with usage data if available
         usage_record = await UsageRecord.find_one(UsageRecord.room_name == room_name)
@@ -503,6 +600,7 @@ class LiveKitService:
                             call_duration_minutes=call_record.call_duration_minutes,
                         )
                         await call_record.save()
+                        await apply_call_rollup(room_name)
                         logger.info(f"Patched missing duration for room: {room_name} | {call_record.call_duration_minutes:.2f}min")
                 logger.info(
                     f"Call already ended with status={call_record.call_status} for room: {room_name}; skipping duplicate webhook"
@@ -524,6 +622,7 @@ class LiveKitService:
             )
             call_record.call_status = "completed"
             await call_record.save()
+            await apply_call_rollup(room_name)
             logger.info(f"Call record ended for room: {room_name}")
             await self.send_end_call_webhook(room_name=room_name, assistant_id=assistant_id)
 
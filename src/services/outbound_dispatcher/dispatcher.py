@@ -1,20 +1,40 @@
 import asyncio
 import multiprocessing
+import os
 import queue as _stdlib_queue
+import socket
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from beanie.operators import In
+from beanie import PydanticObjectId
+from beanie.operators import In, Set
+from pydantic import BaseModel, Field
+from pymongo.errors import DuplicateKeyError
 
 from src.core.config import settings
 from src.core.db.database import Database
-from src.core.db.db_schemas import CallRecord, OutboundCallQueue, OutboundSIP
+from src.core.db.db_schemas import CallRecord, DispatcherLease, OutboundCallQueue, OutboundSIP
 from src.core.logger import logger
+from src.services.analytics import apply_call_rollup
 from src.services.livekit.livekit_svc import LiveKitService, TERMINAL_CALL_STATUSES
 
-# Queue items stuck in 'dispatching' longer than this indicate a worker crash
-# mid-dispatch. Reset them back to 'pending' (or 'failed' past MAX_RETRIES).
-STUCK_DISPATCHING_MINUTES = 5
+# This replica's identity on its queue claims and in dispatcher_leases. Several dispatcher
+# replicas may share one queue; each claim names its owner.
+DISPATCHER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+# A queue item in 'dispatching' belongs to its claimer only while its lease is fresh. The
+# owner renews every LEASE_RENEW_SECONDS; a replica that crashes stops renewing, and any
+# replica puts its claims back to 'pending' (or 'failed' past MAX_RETRIES) once the lease
+# lapses — seconds, where a fixed 5-minute "stuck" cutoff used to apply.
+DISPATCH_LEASE_SECONDS = 15
+LEASE_RENEW_SECONDS = 5
+
+# dispatcher_leases row that serializes batch claims, so replicas that wake on the same
+# change-stream event don't each fill the whole MAX_CONCURRENT_JOBS budget. Held only for
+# the duration of one claim; the expiry just covers a holder that dies mid-claim.
+_CLAIM_LOCK = "outbound_claim"
+_CLAIM_LOCK_SECONDS = 10
+_REPLICA_LEASE_PREFIX = "dispatcher:"
 
 MAX_RETRIES = 3           # permanent failure after this many attempts
 
@@ -32,6 +52,14 @@ AGENT_ANSWER_WAIT_SECONDS = 60
 # before the call is treated as silently dead and force-ended.
 AGENT_JOIN_GRACE_SECONDS = 15
 
+# How often the in-memory live-call set is rebuilt from Mongo. The change stream keeps it
+# current between sweeps; this only bounds the drift a missed event (stream restart,
+# resume-token gap) can cause.
+LIVE_CALL_RECONCILE_INTERVAL_SECONDS = 60
+
+# A CallRecord in one of these statuses occupies a concurrency slot.
+_LIVE_STATUSES = ("initiated", "answered")
+
 livekit_services = LiveKitService()
 
 _new_call_event = asyncio.Event()
@@ -40,13 +68,93 @@ _new_call_event = asyncio.Event()
 # (room created but CallRecord not yet written). Prevents double-dispatch.
 _dispatching_count = 0
 
+# _id (as str) of every CallRecord currently initiated/answered, across all containers.
+# Seeded at startup, kept current by _watch_for_call_completions and by our own dispatches,
+# and rebuilt every LIVE_CALL_RECONCILE_INTERVAL_SECONDS. Slot checks read its size instead
+# of counting call_records on every tick.
+_live_calls: set[str] = set()
+# While a reconcile sweep is reading call_records: record id → live, for every change made
+# to _live_calls meanwhile. Replayed onto the sweep's result so the swap can't undo them.
+_sweep_changes: dict[str, bool] | None = None
+
+# queue_ids this replica has claimed and not yet finished dispatching — the claims its
+# heartbeat keeps alive.
+_owned_claims: set[str] = set()
+
+
+async def _acquire_lease(name: str, seconds: float) -> bool:
+    """Take or renew the dispatcher_leases row `name`. False if another holder has it.
+
+    The filter only matches a lapsed row or one we already hold; when a live holder has it
+    the upsert tries to insert a second row with the same unique name and fails, which is
+    the "not acquired" answer.
+    """
+    now = datetime.now(timezone.utc)
+    col = Database.client[settings.DATABASE_NAME][DispatcherLease.Settings.name]
+    try:
+        await col.update_one(
+            {"name": name, "$or": [{"expires_at": {"$lt": now}}, {"holder": DISPATCHER_ID}]},
+            {"$set": {"holder": DISPATCHER_ID, "expires_at": now + timedelta(seconds=seconds)}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+
+async def _release_lease(name: str) -> None:
+    """Give up a dispatcher_leases row we hold. No-op if someone else holds it."""
+    col = Database.client[settings.DATABASE_NAME][DispatcherLease.Settings.name]
+    await col.delete_one({"name": name, "holder": DISPATCHER_ID})
+
+
+async def _other_dispatchers_alive() -> bool:
+    """True if another replica has sent a heartbeat within DISPATCH_LEASE_SECONDS."""
+    col = Database.client[settings.DATABASE_NAME][DispatcherLease.Settings.name]
+    other = await col.find_one({
+        "name": {"$regex": f"^{_REPLICA_LEASE_PREFIX}"},
+        "holder": {"$ne": DISPATCHER_ID},
+        "expires_at": {"$gt": datetime.now(timezone.utc)},
+    })
+    return other is not None
+
+
+async def _renew_leases() -> None:
+    """Heartbeat: refresh this replica's registration and the lease on every claim in flight."""
+    await _acquire_lease(f"{_REPLICA_LEASE_PREFIX}{DISPATCHER_ID}", DISPATCH_LEASE_SECONDS)
+    if not _owned_claims:
+        return
+    await OutboundCallQueue.find(
+        In(OutboundCallQueue.queue_id, list(_owned_claims)),
+        OutboundCallQueue.claimed_by == DISPATCHER_ID,
+        OutboundCallQueue.status == "dispatching",
+    ).update_many(
+        Set({
+            OutboundCallQueue.lease_expires_at:
+                datetime.now(timezone.utc) + timedelta(seconds=DISPATCH_LEASE_SECONDS),
+        })
+    )
+
 
 async def _fail_all_active_calls() -> None:
     """On startup, immediately fail every initiated/answered call record.
 
     These calls belong to agent processes that died with the previous server
     instance. They will never complete, so fail them now to free concurrency slots.
+
+    Skipped while another dispatcher replica is alive: the live calls may be its calls,
+    still running. A heartbeat seen at startup may also be this replica's own previous
+    process (crashed and restarted inside DISPATCH_LEASE_SECONDS, under another
+    DISPATCHER_ID), so one lease is waited out before deciding. If a replica is still
+    renewing after that, the orphan reaper — which checks the LiveKit room — runs now
+    rather than half an hour later, so dead calls don't hold slots until then.
     """
+    if await _other_dispatchers_alive():
+        await asyncio.sleep(DISPATCH_LEASE_SECONDS)
+        if await _other_dispatchers_alive():
+            logger.info("Startup cleanup skipped: other dispatcher replica(s) are live; reaping orphans")
+            await _reap_orphaned_calls()
+            return
     now = datetime.now(timezone.utc)
     stale = await CallRecord.find(
         In(CallRecord.call_status, ["initiated", "answered"]),
@@ -57,6 +165,7 @@ async def _fail_all_active_calls() -> None:
             record.call_status_reason = "Marked failed on server startup — agent process no longer running"
             record.ended_at = now
             await record.save()
+            await apply_call_rollup(record.room_name)
         logger.warning(
             f"Startup cleanup: marked {len(stale)} call record(s) as failed"
         )
@@ -88,6 +197,7 @@ async def _reap_orphaned_calls() -> None:
             if record.ended_at is None:
                 record.ended_at = datetime.now(timezone.utc)
             await record.save()
+            await apply_call_rollup(record.room_name)
             reaped += 1
             logger.warning(f"Reaper: marked orphaned call failed | room={record.room_name}")
 
@@ -95,43 +205,213 @@ async def _reap_orphaned_calls() -> None:
         logger.warning(f"Reaper: cleaned up {reaped} orphaned call record(s)")
 
 
-async def _recover_stuck_dispatching() -> None:
-    """Recover queue items left in 'dispatching' by a crashed worker.
+async def _recover_expired_claims() -> None:
+    """Recover queue items whose dispatcher stopped renewing their lease.
 
-    Runs on every dispatcher tick. Resets them to 'pending' so they retry,
-    or 'failed' once MAX_RETRIES is reached.
+    Runs on every dispatcher tick, on every replica. Resets them to 'pending' so they
+    retry, or 'failed' once MAX_RETRIES is reached. Each update re-checks the lapsed lease,
+    so two replicas recovering at once never count the same item twice. A claim with no
+    lease at all predates leases and is treated as lapsed. Never raises: a Mongo error
+    here must not take the dispatcher loop down; the next tick retries.
     """
-    queue_cutoff = datetime.now(timezone.utc) - timedelta(minutes=STUCK_DISPATCHING_MINUTES)
-    stuck = await OutboundCallQueue.find(
-        OutboundCallQueue.status == "dispatching",
-        OutboundCallQueue.queued_at < queue_cutoff,
-    ).to_list()
-    if stuck:
-        for item in stuck:
-            item.retry_count += 1
-            item.last_error = "Worker crashed mid-dispatch"
-            if item.retry_count >= MAX_RETRIES:
-                item.status = "failed"
+    try:
+        await _release_lapsed_claims()
+    except Exception as e:
+        logger.error(f"Cleanup: could not recover lapsed claims: {e}", exc_info=True)
+
+
+async def _release_lapsed_claims() -> None:
+    now = datetime.now(timezone.utc)
+    lapsed = {
+        "status": "dispatching",
+        "$or": [{"lease_expires_at": {"$lt": now}}, {"lease_expires_at": None}],
+    }
+    release = {
+        "$inc": {"retry_count": 1},
+        "$unset": {"claim_token": "", "claimed_by": "", "lease_expires_at": ""},
+    }
+    failed = await OutboundCallQueue.find(
+        lapsed, {"retry_count": {"$gte": MAX_RETRIES - 1}}
+    ).update_many({
+        **release,
+        "$set": {"status": "failed", "last_error": "Dispatcher crashed mid-dispatch"},
+    })
+    retried = await OutboundCallQueue.find(lapsed).update_many({
+        **release,
+        "$set": {"status": "pending", "last_error": "Dispatcher crashed mid-dispatch"},
+    })
+    recovered = (
+        getattr(failed, "modified_count", 0) + getattr(retried, "modified_count", 0)
+    )
+    if recovered:
+        logger.warning(
+            f"Cleanup: recovered {recovered} 'dispatching' queue item(s) with lapsed leases"
+        )
+
+
+async def _reconcile_live_calls() -> None:
+    """Rebuild the live-call set from Mongo. Runs at startup and then periodically.
+
+    Only _id is projected, so the sweep never drags transcripts over the wire. Calls
+    tracked or finished while the cursor is being read are applied on top of its result.
+    """
+    global _live_calls, _sweep_changes
+    col = Database.client[settings.DATABASE_NAME]["call_records"]
+    _sweep_changes = {}
+    try:
+        cursor = col.find({"call_status": {"$in": list(_LIVE_STATUSES)}}, {"_id": 1})
+        fresh = {str(doc["_id"]) async for doc in cursor}
+        for record_id, live in _sweep_changes.items():
+            if live:
+                fresh.add(record_id)
             else:
-                item.status = "pending"
-            await item.save()
+                fresh.discard(record_id)
+    finally:
+        _sweep_changes = None
+
+    if fresh != _live_calls:
+        logger.info(
+            f"Live-call set reconciled: {len(_live_calls)} → {len(fresh)} "
+            f"(+{len(fresh - _live_calls)} / -{len(_live_calls - fresh)})"
+        )
+    freed = len(fresh) < len(_live_calls)
+    _live_calls = fresh
+    if freed:
+        _new_call_event.set()
+
+
+def track_live_call(record: CallRecord | None) -> None:
+    """Count a CallRecord we just wrote as live, ahead of its change-stream event.
+
+    Call this before release_slot(): otherwise the call is counted neither as a
+    reservation nor as live until the insert event arrives, and the gap admits one
+    call too many. The later event is an idempotent re-add.
+    """
+    if record is not None and record.id is not None and record.call_status in _LIVE_STATUSES:
+        _set_live(str(record.id), True)
+
+
+def _set_live(record_id: str, live: bool) -> None:
+    if _sweep_changes is not None:
+        _sweep_changes[record_id] = live
+    if live:
+        _live_calls.add(record_id)
+    else:
+        _live_calls.discard(record_id)
+
+
+def _apply_call_record_change(change: dict) -> bool:
+    """Fold one call_records change event into the live-call set.
+
+    Returns True when a call left the set (a slot freed up).
+    """
+    record_id = str(change["documentKey"]["_id"])
+    op = change["operationType"]
+    if op == "delete":
+        status = None
+    elif op == "update":
+        status = change["updateDescription"]["updatedFields"].get("call_status")
+    else:  # insert | replace
+        status = (change.get("fullDocument") or {}).get("call_status")
+
+    if status in _LIVE_STATUSES:
+        _set_live(record_id, True)
+        return False
+    was_live = record_id in _live_calls
+    _set_live(record_id, False)  # even if unseen: the running sweep may have read it live
+    return was_live
+
+
+class _QueueItemId(BaseModel):
+    """Projection for the claim's candidate scan — the _id is all it needs."""
+
+    id: PydanticObjectId = Field(alias="_id")
+
+
+async def _claim_pending(limit: int) -> list[OutboundCallQueue]:
+    """Move up to `limit` of the oldest pending queue items to 'dispatching' in one update.
+
+    update_many can neither sort nor limit, so the oldest pending _ids are read first and
+    the update re-checks status == "pending": an item another dispatcher claimed in between
+    no longer matches and is never handed out twice. Every row the update did flip carries
+    this batch's claim_token, which is how the claimed documents are read back — among the
+    candidate _ids, so the read uses the _id index instead of scanning a queue that keeps
+    every dispatched row. Three round trips per batch, however large, instead of one save()
+    per item.
+    """
+    candidates = (
+        await OutboundCallQueue.find(OutboundCallQueue.status == "pending")
+        .sort("queued_at")
+        .limit(limit)
+        .project(_QueueItemId)
+        .to_list()
+    )
+    if not candidates:
+        return []
+
+    claim_token = uuid.uuid4().hex
+    now = datetime.now(timezone.utc)
+    candidate_ids = [c.id for c in candidates]
+    await OutboundCallQueue.find(
+        In(OutboundCallQueue.id, candidate_ids),
+        OutboundCallQueue.status == "pending",
+    ).update_many(
+        Set({
+            OutboundCallQueue.status: "dispatching",
+            OutboundCallQueue.claim_token: claim_token,
+            OutboundCallQueue.claimed_at: now,
+            OutboundCallQueue.claimed_by: DISPATCHER_ID,
+            OutboundCallQueue.lease_expires_at: now + timedelta(seconds=DISPATCH_LEASE_SECONDS),
+        })
+    )
+    claimed = (
+        await OutboundCallQueue.find(
+            In(OutboundCallQueue.id, candidate_ids),
+            OutboundCallQueue.claim_token == claim_token,
+        )
+        .sort("queued_at")
+        .to_list()
+    )
+    _owned_claims.update(item.queue_id for item in claimed)
+    return claimed
+
+
+async def _finish_claim(item: OutboundCallQueue) -> None:
+    """Write a dispatch outcome back to the queue item — only if the claim is still ours.
+
+    If this replica stalled past its lease, another replica may already have put the item
+    back to 'pending' and claimed it again; overwriting that with our stale outcome would
+    hide the second attempt. The claim_token in the filter makes the write a no-op then.
+    """
+    result = await OutboundCallQueue.find_one(
+        OutboundCallQueue.queue_id == item.queue_id,
+        OutboundCallQueue.claim_token == item.claim_token,
+    ).update(
+        Set({
+            OutboundCallQueue.status: item.status,
+            OutboundCallQueue.dispatched_at: item.dispatched_at,
+            OutboundCallQueue.room_name: item.room_name,
+            OutboundCallQueue.retry_count: item.retry_count,
+            OutboundCallQueue.last_error: item.last_error,
+            OutboundCallQueue.lease_expires_at: None,
+        })
+    )
+    if getattr(result, "matched_count", 0) == 0:
         logger.warning(
-            f"Cleanup: recovered {len(stuck)} stuck 'dispatching' queue item(s)"
+            f"Queued call {item.queue_id}: claim lapsed before dispatch finished; "
+            f"outcome '{item.status}' not written"
         )
 
 
-async def _get_active_session_count() -> int:
+def _get_active_session_count() -> int:
     """Count calls that are live (initiated/answered) PLUS any mid-dispatch reservations."""
-    db_active = await CallRecord.find(
-        In(CallRecord.call_status, ["initiated", "answered"])
-    ).count()
-    return db_active + _dispatching_count
+    return len(_live_calls) + _dispatching_count
 
 
 async def try_reserve_slot() -> bool:
     """Atomically reserve a session slot if one is free. Returns True on success."""
     global _dispatching_count
-    if await _get_active_session_count() >= settings.MAX_CONCURRENT_JOBS:
+    if _get_active_session_count() >= settings.MAX_CONCURRENT_JOBS:
         return False
     _dispatching_count += 1
     return True
@@ -152,12 +432,27 @@ def _terminate_bridge(process: multiprocessing.Process) -> None:
         pass  # process already exited
 
 
-def _reap_bridge(process: multiprocessing.Process) -> None:
-    """Join (reap) bridge subprocess to prevent zombie accumulation."""
+async def _reap_bridge(process: multiprocessing.Process) -> bool:
+    """Join (reap) bridge subprocess to prevent zombie accumulation.
+
+    join() blocks for up to 3s, so it runs on a worker thread rather than the loop.
+    False only for a pooled call still running on a shared host (it has been
+    cancelled): its RTP port may still be bound, so it must not be released yet.
+    """
     try:
-        process.join(timeout=3)
+        return await asyncio.to_thread(process.join, 3) is not False
     except Exception:
-        pass
+        return True
+
+
+async def _release_port_after_bridge(process: multiprocessing.Process, port: int, room_name: str) -> None:
+    """Reap a bridge that outlived its grace period, then put its RTP port back."""
+    from src.services.exotel.custom_sip_reach.port_pool import get_port_pool
+
+    while not await _reap_bridge(process):
+        await asyncio.sleep(1)
+    get_port_pool().release(port)
+    logger.info(f"[MONITOR] Port {port} released after its bridge finished | room={room_name}")
 
 
 async def _finalize_if_agent_failed(room_name: str, assistant_id: str | None) -> None:
@@ -249,6 +544,9 @@ async def _monitor_exotel_result(
     Phase 1 — SIP setup (max 60 s): poll result_queue for INVITE outcome.
     Phase 2 — Active call: wait for process to exit before releasing port.
 
+    bridge_process is either the call's own Process or a PooledBridgeCall on a warm
+    worker; the latter reports "exited" when its call ends and is handed back on join.
+
     Port and call_id are released in finally, guaranteeing cleanup regardless
     of how the subprocess exits (normal end, crash, SIGTERM, or OOM).
     """
@@ -403,10 +701,14 @@ async def _monitor_exotel_result(
     finally:
         # Reap zombie before releasing port — prevents the OS from keeping the
         # socket FD open in a zombie process while a new call tries to bind it.
-        _reap_bridge(bridge_process)
-        pool.release(port)
+        if await _reap_bridge(bridge_process):
+            pool.release(port)
+            logger.info(f"[MONITOR] Port {port} released | room={room_name}")
+        else:
+            logger.warning(f"[MONITOR] Bridge still running, holding port {port} | room={room_name}")
+            asyncio.create_task(_release_port_after_bridge(bridge_process, port, room_name))
         unregister_call_id(call_id)
-        logger.info(f"[MONITOR] Port {port} released, call_id {call_id} unregistered | room={room_name}")
+        logger.info(f"[MONITOR] call_id {call_id} unregistered | room={room_name}")
 
 
 async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
@@ -434,7 +736,7 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
             await livekit_services.create_agent_dispatch(room_name, job_metadata)
 
         if item.call_service == "twilio":
-            await livekit_services.initialize_call_record(
+            record = await livekit_services.initialize_call_record(
                 room_name=room_name,
                 assistant_id=item.assistant_id,
                 assistant_name=item.assistant_name,
@@ -447,6 +749,7 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
                 queue_id=item.queue_id,
                 is_passthrough=is_passthrough,
             )
+            track_live_call(record)
             await livekit_services.create_sip_participant(
                 room_name=room_name,
                 to_number=item.to_number,
@@ -467,11 +770,12 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
 
         elif item.call_service == "exotel":
             from src.services.exotel.custom_sip_reach.bridge import _bridge_subprocess_entry
+            from src.services.exotel.custom_sip_reach.bridge_pool import get_bridge_pool
             from src.services.exotel.custom_sip_reach.port_pool import get_port_pool
             from src.services.exotel.custom_sip_reach.inbound_listener import register_call_id_with_event
 
             sip_config = trunk.trunk_config
-            await livekit_services.initialize_call_record(
+            record = await livekit_services.initialize_call_record(
                 room_name=room_name,
                 assistant_id=item.assistant_id,
                 assistant_name=item.assistant_name,
@@ -484,25 +788,42 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
                 queue_id=item.queue_id,
                 is_passthrough=is_passthrough,
             )
+            track_live_call(record)
 
             # Pre-allocate resources in parent so monitor can release them
             # regardless of how the subprocess exits.
             pool = get_port_pool()
             bridge_port = pool.acquire()
             bridge_call_id = str(uuid.uuid4())
-            ctx = multiprocessing.get_context("spawn")
-            inbound_bye = ctx.Event()
-            register_call_id_with_event(bridge_call_id, inbound_bye)
-            result_queue: multiprocessing.Queue = ctx.Queue()
-
-            bridge_process = ctx.Process(
-                target=_bridge_subprocess_entry,
-                args=(item.to_number, room_name, sip_config, result_queue,
-                      bridge_port, bridge_call_id, inbound_bye, is_passthrough),
-                daemon=True,
-                name=f"bridge-out-{item.to_number}",
-            )
-            bridge_process.start()
+
+            # Prefer a warm bridge host; spawn a fresh process only if none has room.
+            # Either way bridge_process offers is_alive/terminate/join to the monitor.
+            bridge_pool = get_bridge_pool()
+            bridge_process = bridge_pool and bridge_pool.run_call({
+                "phone_number": item.to_number,
+                "room_name": room_name,
+                "sip_config": sip_config,
+                "preallocated_port": bridge_port,
+                "call_id": bridge_call_id,
+                "is_passthrough": is_passthrough,
+            })
+            if bridge_process is not None:
+                register_call_id_with_event(bridge_call_id, bridge_process.inbound_bye)
+                result_queue = bridge_process.result_queue
+            else:
+                ctx = multiprocessing.get_context("spawn")
+                inbound_bye = ctx.Event()
+                register_call_id_with_event(bridge_call_id, inbound_bye)
+                result_queue = ctx.Queue()
+
+                bridge_process = ctx.Process(
+                    target=_bridge_subprocess_entry,
+                    args=(item.to_number, room_name, sip_config, result_queue,
+                          bridge_port, bridge_call_id, inbound_bye, is_passthrough),
+                    daemon=True,
+                    name=f"bridge-out-{item.to_number}",
+                )
+                bridge_process.start()
             asyncio.create_task(
                 _monitor_exotel_result(
                     room_name, item.assistant_id, result_queue,
@@ -520,7 +841,7 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
         item.status = "dispatched"
         item.dispatched_at = datetime.now(timezone.utc)
         item.room_name = room_name
-        await item.save()
+        await _finish_claim(item)
         logger.info(
             f"Dispatched queued call {item.queue_id} → room={room_name} | to={item.to_number}"
         )
@@ -542,37 +863,52 @@ async def _dispatch_queued_call(item: OutboundCallQueue) -> None:
                 f"Queued call {item.queue_id} will retry "
                 f"(attempt {item.retry_count}/{MAX_RETRIES})"
             )
-        await item.save()
+        await _finish_claim(item)
 
     finally:
+        _owned_claims.discard(item.queue_id)
         release_slot()  # release reservation taken at top of this function
 
 
 async def _process_pending() -> None:
-    """Check queue and dispatch as many calls as current capacity allows."""
+    """Check queue and dispatch as many calls as current capacity allows.
+
+    MAX_CONCURRENT_JOBS is global across dispatcher replicas. Live calls are already global
+    (the call_records change stream sees every container); claims other replicas are still
+    dispatching are counted from the queue, under the claim lock so no two replicas spend
+    the same free slots.
+    """
     global _dispatching_count
     try:
-        active = await _get_active_session_count()
+        acquired = await _acquire_lease(_CLAIM_LOCK, _CLAIM_LOCK_SECONDS)
+    except Exception as e:
+        # Network blip or election: skip this tick rather than kill the dispatcher loop.
+        logger.error(f"Dispatcher: could not take claim lock: {e}")
+        return
+    if not acquired:
+        # Another replica is claiming right now, woken by the same event — it will use
+        # the free slots. Anything it leaves gets picked up on our next wake.
+        logger.debug("Dispatcher: claim lock held by another replica, skipping tick")
+        return
+    try:
+        elsewhere = await OutboundCallQueue.find(
+            OutboundCallQueue.status == "dispatching",
+            OutboundCallQueue.claimed_by != DISPATCHER_ID,
+        ).count()
+        active = _get_active_session_count() + elsewhere
         slots = settings.MAX_CONCURRENT_JOBS - active
 
         if slots <= 0:
             logger.info(f"Dispatcher: active={active}, no slots available (max={settings.MAX_CONCURRENT_JOBS})")
             return
 
-        pending = (
-            await OutboundCallQueue.find(OutboundCallQueue.status == "pending")
-            .sort("queued_at")
-            .limit(slots)
-            .to_list()
-        )
+        pending = await _claim_pending(slots)
 
         if not pending:
             logger.debug(f"Dispatcher: active={active}, slots={slots}, queue empty")
             return
 
         for item in pending:
-            item.status = "dispatching"
-            await item.save()
             _dispatching_count += 1  # reserve before task starts to prevent double-dispatch
             asyncio.create_task(_dispatch_queued_call(item))
 
@@ -582,12 +918,11 @@ async def _process_pending() -> None:
         )
     except Exception as e:
         logger.error(f"Dispatcher process error: {e}", exc_info=True)
-
-
-_TERMINAL_STATUSES = [
-    "completed", "failed", "busy", "no_answer",
-    "rejected", "cancelled", "unreachable", "timeout",
-]
+    finally:
+        try:
+            await _release_lease(_CLAIM_LOCK)
+        except Exception as e:
+            logger.warning(f"Dispatcher: could not release claim lock, it expires in {_CLAIM_LOCK_SECONDS}s: {e}")
 
 
 async def _watch_for_new_calls() -> None:
@@ -605,20 +940,42 @@ async def _watch_for_new_calls() -> None:
 
 
 async def _watch_for_call_completions() -> None:
-    """Change Stream: wakes dispatcher when a call finishes → chain next pending call."""
-    pipeline = [{
-        "$match": {
-            "operationType": "update",
-            "updateDescription.updatedFields.call_status": {"$in": _TERMINAL_STATUSES},
-        }
-    }]
+    """Change Stream: keeps the live-call set current and wakes the dispatcher when a
+    call finishes → chain next pending call.
+
+    Sees call_status writes from every container (web calls are created by the API),
+    so the set counts calls this process never dispatched.
+    """
+    pipeline = [
+        {
+            "$match": {
+                "$or": [
+                    {"operationType": {"$in": ["insert", "replace", "delete"]}},
+                    {
+                        "operationType": "update",
+                        "updateDescription.updatedFields.call_status": {"$exists": True},
+                    },
+                ]
+            }
+        },
+        # Inserts carry the whole document; only the status matters here.
+        {
+            "$project": {
+                "operationType": 1,
+                "documentKey": 1,
+                "fullDocument.call_status": 1,
+                "updateDescription.updatedFields.call_status": 1,
+            }
+        },
+    ]
     while True:
         try:
             col = Database.client[settings.DATABASE_NAME]["call_records"]
             async with await col.watch(pipeline) as stream:
-                async for _ in stream:
-                    logger.info("ChangeStream: call completed → checking pending queue")
-                    _new_call_event.set()
+                async for change in stream:
+                    if _apply_call_record_change(change):
+                        logger.info("ChangeStream: call completed → checking pending queue")
+                        _new_call_event.set()
         except Exception as e:
             logger.warning(f"ChangeStream (completions) error, restarting in 5s: {e}")
             await asyncio.sleep(5)
@@ -634,28 +991,74 @@ async def _orphan_reaper_loop() -> None:
             logger.error(f"Orphan reaper error: {e}", exc_info=True)
 
 
+def _warm_bridge_pool() -> None:
+    """Start the Exotel bridge worker pool now, so the first outbound call finds it warm."""
+    try:
+        from src.services.exotel.custom_sip_reach.bridge_pool import get_bridge_pool
+        get_bridge_pool()
+    except Exception as e:
+        logger.error(f"Bridge worker pool failed to start, spawning per call: {e}", exc_info=True)
+
+
+async def _lease_heartbeat_loop() -> None:
+    """Run _renew_leases() every LEASE_RENEW_SECONDS forever."""
+    while True:
+        await asyncio.sleep(LEASE_RENEW_SECONDS)
+        try:
+            await _renew_leases()
+        except Exception as e:
+            logger.error(f"Lease heartbeat error: {e}", exc_info=True)
+
+
+async def _live_call_reconcile_loop() -> None:
+    """Run _reconcile_live_calls() on a fixed interval forever."""
+    while True:
+        await asyncio.sleep(LIVE_CALL_RECONCILE_INTERVAL_SECONDS)
+        try:
+            await _reconcile_live_calls()
+        except Exception as e:
+            logger.error(f"Live-call reconcile error: {e}", exc_info=True)
+
+
 async def outbound_dispatcher_loop() -> None:
     """Event-driven dispatcher: wakes instantly when a call is enqueued or completes.
 
     Change Streams provide cross-container notification. 30s poll is a safety-net fallback.
+    Any number of replicas may run this loop against one queue; see _process_pending().
     """
-    logger.info(f"Outbound call dispatcher started (max_concurrent={settings.MAX_CONCURRENT_JOBS})")
+    logger.info(
+        f"Outbound call dispatcher started (max_concurrent={settings.MAX_CONCURRENT_JOBS}, "
+        f"id={DISPATCHER_ID})"
+    )
 
     await _fail_all_active_calls()
+    await _renew_leases()
+    _warm_bridge_pool()
+    await _reconcile_live_calls()
     await _process_pending()
 
     asyncio.create_task(_watch_for_new_calls())
     asyncio.create_task(_watch_for_call_completions())
     asyncio.create_task(_orphan_reaper_loop())
+    asyncio.create_task(_live_call_reconcile_loop())
+    asyncio.create_task(_lease_heartbeat_loop())
 
-    while True:
+    try:
+        while True:
+            try:
+                await asyncio.wait_for(_new_call_event.wait(), timeout=30.0)
+            except asyncio.TimeoutError:
+                pass  # safety-net poll
+            finally:
+                _new_call_event.clear()
+
+            # Take back claims whose dispatcher died
+            await _recover_expired_claims()
+            await _process_pending()
+    finally:
+        # Clean shutdown: stop counting as a live replica straight away, so a restart
+        # here runs its startup cleanup instead of waiting out our heartbeat.
         try:
-            await asyncio.wait_for(_new_call_event.wait(), timeout=30.0)
-        except asyncio.TimeoutError:
-            pass  # safety-net poll
-        finally:
-            _new_call_event.clear()
-
-        # Check for stuck dispatching
-        await _recover_stuck_dispatching()
-        await _process_pending()
+            await _release_lease(f"{_REPLICA_LEASE_PREFIX}{DISPATCHER_ID}")
+        except Exception as e:
+            logger.warning(f"Could not unregister dispatcher {DISPATCHER_ID}: {e}")
@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.core.config import settings
+from src.services.analytics.cache import AnalyticsCache, cache_window
+
+NOW = datetime(2026, 3, 10, 14, 30, 45, tzinfo=timezone.utc)
+
+
+class Counter:
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("aggregation failed")
+        return [{"total_calls": self.calls}]
+
+
+class TestAnalyticsCache(unittest.IsolatedAsyncioTestCase):
+    async def test_hit_until_ttl_then_recompute(self):
+        cache, compute = AnalyticsCache(max_entries=10), Counter()
+        clock = [100.0]
+        with patch("src.services.analytics.cache.time.monotonic", lambda: clock[0]):
+            await cache.get_or_compute("k", 30, compute)
+            await cache.get_or_compute("k", 30, compute)
+            clock[0] += 31
+            await cache.get_or_compute("k", 30, compute)
+
+        self.assertEqual(compute.calls, 2)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    async def test_concurrent_misses_share_one_computation(self):
+        cache, compute = AnalyticsCache(max_entries=10), Counter(delay=0.01)
+        results = await asyncio.gather(*(cache.get_or_compute("k", 30, compute) for _ in range(5)))
+
+        self.assertEqual(compute.calls, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual((cache.stats()["misses"], cache.stats()["coalesced"]), (1, 4))
+
+    async def test_failure_reaches_every_waiter_and_is_not_cached(self):
+        cache, compute = AnalyticsCache(max_entries=10), Counter(delay=0.01, fail=True)
+        results = await asyncio.gather(
+            *(cache.get_or_compute("k", 30, compute) for _ in range(3)), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+        compute.fail = False
+        await cache.get_or_compute("k", 30, compute)
+        self.assertEqual(compute.calls, 2)
+        self.assertEqual(cache.stats()["errors"], 1)
+
+    async def test_cancelled_caller_does_not_cancel_the_shared_computation(self):
+        cache, compute = AnalyticsCache(max_entries=10), Counter(delay=0.02)
+        first = asyncio.ensure_future(cache.get_or_compute("k", 30, compute))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_compute("k", 30, compute))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, [{"total_calls": 1}])
+        self.assertEqual(compute.calls, 1)
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache, compute = AnalyticsCache(max_entries=2), Counter()
+        for key in ("a", "b", "a", "c"):  # "a" refreshed, so "b" is the oldest
+            await cache.get_or_compute(key, 30, compute)
+        await cache.get_or_compute("a", 30, compute)
+        await cache.get_or_compute("b", 30, compute)
+        self.assertEqual(compute.calls, 4)  # a, b, c, then b again
+
+
+class TestCacheWindow(unittest.TestCase):
+    def test_defaults_snap_to_the_bucket_and_use_the_short_ttl(self):
+        start, end, ttl = cache_window(None, None, now=NOW)
+        self.assertEqual(end, NOW.replace(second=0))
+        self.assertEqual(start, (NOW - timedelta(days=30)).replace(second=0))
+        self.assertEqual(ttl, settings.ANALYTICS_CACHE_TTL)
+        self.assertEqual(cache_window(None, None, now=NOW + timedelta(seconds=10))[:2], (start, end))
+
+    def test_range_ended_before_today_is_historical_and_kept_exact(self):
+        start = datetime(2026, 2, 1, 8, 15, 7, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 28, 23, 59, 59, tzinfo=timezone.utc)
+        self.assertEqual(cache_window(start, end, now=NOW), (start, end, settings.ANALYTICS_CACHE_HISTORICAL_TTL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.api.routes.analytics import _dashboard_pipeline, get_dashboard
+from src.services.analytics import analytics_cache
+
+USER = SimpleNamespace(user_email="user@example.com")
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def to_list(self):
+        return self._rows
+
+
+class TestDashboard(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        analytics_cache.clear()
+
+    async def test_one_aggregation_returns_summary_periods_and_status(self):
+        pipelines = []
+
+        def fake_aggregate(pipeline):
+            pipelines.append(pipeline)
+            return _FakeCursor([{
+                "summary": [{"_id": None, "total_calls": 10, "total_duration_minutes": 25.0}],
+                "by_status": [
+                    {"_id": "failed", "count": 2},
+                    {"_id": "completed", "count": 8},
+                    {"_id": "busy", "count": 0},
+                ],
+                "today": [{"_id": None, "count": 3}],
+                "this_week": [],
+                "this_month": [{"_id": None, "count": 12}],
+            }])
+
+        with patch("src.api.routes.analytics.CallDailyRollup.aggregate", side_effect=fake_aggregate):
+            data = (await get_dashboard(start_date=None, end_date=None, current_user=USER)).data
+            await get_dashboard(start_date=None, end_date=None, current_user=USER)  # cached
+
+        self.assertEqual(len(pipelines), 1)
+        self.assertEqual(set(pipelines[0][-1]["$facet"]), {"summary", "by_status", "today", "this_week", "this_month"})
+        self.assertEqual((data["total_calls"], data["avg_duration_minutes"]), (10, 2.5))
+        self.assertEqual((data["calls_today"], data["calls_this_week"], data["calls_this_month"]), (3, 0, 12))
+        self.assertEqual(list(data["status_breakdown"].items()), [("completed", 8), ("failed", 2)])
+
+    async def test_empty_result(self):
+        with patch("src.api.routes.analytics.CallDailyRollup.aggregate", return_value=_FakeCursor([])):
+            data = (await get_dashboard(start_date=None, end_date=None, current_user=USER)).data
+        self.assertEqual((data["total_calls"], data["calls_today"], data["status_breakdown"]), (0, 0, {}))
+
+    def test_source_spans_range_and_month_with_range_bounds_cut_exactly(self):
+        now = datetime(2026, 3, 20, 9, 0, tzinfo=timezone.utc)
+        start = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 10, 18, 0, tzinfo=timezone.utc)
+        rollup_match, union, facet = _dashboard_pipeline(USER.user_email, start, end, now)
+
+        day = rollup_match["$match"]["day"]
+        self.assertEqual(day["$gte"], datetime(2026, 1, 6, tzinfo=timezone.utc))
+        self.assertEqual(day["$lt"], datetime(2026, 3, 20, tzinfo=timezone.utc))
+        self.assertEqual(day["$nin"], [datetime(2026, 2, 10, tzinfo=timezone.utc)])
+        self.assertEqual(facet["$facet"]["summary"][0], {"$match": {"day": {"$gte": start, "$lte": end}}})
+        self.assertEqual(
+            facet["$facet"]["this_month"][0], {"$match": {"day": {"$gte": datetime(2026, 3, 1, tzinfo=timezone.utc)}}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.api.dependencies import key_cache
+from src.api.dependencies.key_cache import APIKeyCache
+
+
+class Loader:
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = 0
+
+    async def __call__(self, api_key):
+        self.calls += 1
+        return self.docs.get(api_key)
+
+
+def _doc(doc_id, key):
+    return SimpleNamespace(id=doc_id, api_key=key, user_email=f"{doc_id}@example.com")
+
+
+class TestAPIKeyCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.clock = [100.0]
+        patcher = patch("src.api.dependencies.key_cache.time.monotonic", lambda: self.clock[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_valid_key_is_cached_for_the_ttl(self):
+        cache, load = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5), Loader({"k1": _doc(1, "k1")})
+        first = await cache.get("k1", load)
+        self.assertIs(await cache.get("k1", load), first)
+        self.clock[0] += 61
+        await cache.get("k1", load)
+        self.assertEqual(load.calls, 2)
+
+    async def test_unknown_key_is_cached_briefly(self):
+        cache, load = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5), Loader({})
+        self.assertIsNone(await cache.get("bad", load))
+        self.assertIsNone(await cache.get("bad", load))
+        self.clock[0] += 6
+        await cache.get("bad", load)
+        self.assertEqual(load.calls, 2)
+
+    async def test_invalid_keys_do_not_evict_valid_ones(self):
+        cache, load = APIKeyCache(max_entries=2, ttl=60, negative_ttl=5), Loader({"k1": _doc(1, "k1")})
+        await cache.get("k1", load)
+        for i in range(5):
+            await cache.get(f"bad-{i}", load)
+        await cache.get("k1", load)
+        self.assertEqual(load.calls, 6)
+
+    async def test_change_by_document_id_evicts_the_key(self):
+        docs = {"k1": _doc(1, "k1")}
+        cache, load = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5), Loader(docs)
+        await cache.get("k1", load)
+
+        del docs["k1"]  # deactivated
+        cache.invalidate(1)
+        self.assertIsNone(await cache.get("k1", load))
+
+    async def test_new_key_is_not_held_back_by_a_negative_entry(self):
+        docs = {}
+        cache, load = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5), Loader(docs)
+        self.assertIsNone(await cache.get("k2", load))
+
+        docs["k2"] = _doc(2, "k2")
+        cache.invalidate(2, "k2")
+        self.assertIsNotNone(await cache.get("k2", load))
+
+    async def test_lookup_in_flight_across_an_invalidation_is_not_cached(self):
+        docs = {"k1": _doc(1, "k1")}
+        cache = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5)
+        load = Loader(docs)
+
+        async def slow_load(api_key):
+            doc = await load(api_key)  # reads the still-active document...
+            cache.invalidate(1)  # ...which is revoked before the lookup returns
+            return doc
+
+        await cache.get("k1", slow_load)
+        del docs["k1"]
+        self.assertIsNone(await cache.get("k1", load))
+
+
+class FakeStream:
+    def __init__(self, changes):
+        self.changes = changes
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for change in self.changes:
+            yield change
+        raise asyncio.CancelledError  # end the watcher's loop
+
+
+class TestWatchAPIKeys(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_start_clears_and_changes_invalidate(self):
+        cache = APIKeyCache(max_entries=10, ttl=60, negative_ttl=5)
+        await cache.get("k1", Loader({"k1": _doc(1, "k1")}))
+        await cache.get("k2", Loader({"k2": _doc(2, "k2")}))
+        changes = [{"operationType": "delete", "documentKey": {"_id": 2}}]
+        calls = []
+
+        async def watch(pipeline, full_document=None):
+            calls.append(full_document)
+            return FakeStream(changes)
+
+        collection = SimpleNamespace(watch=watch)
+        client = {key_cache.settings.DATABASE_NAME: {"api_keys": collection}}
+        with patch.object(key_cache, "api_key_cache", cache), patch.object(key_cache.Database, "client", client):
+            with patch.object(cache, "clear", wraps=cache.clear) as clear:
+                with self.assertRaises(asyncio.CancelledError):
+                    await key_cache.watch_api_keys()
+
+        self.assertEqual(calls, ["updateLookup"])
+        clear.assert_called_once()
+        self.assertEqual(cache._valid, {})
+
+if __name__ == "__main__":
+    unittest.main()
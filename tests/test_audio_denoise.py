@@ -74,6 +74,15 @@ class TestSpeechGate(unittest.TestCase):
 
         self.assertLess(rms_out.max(), 1.0, "keyboard clatter should never open the gate")
 
+    def test_warm_up_leaves_no_state_behind(self):
+        """Prewarm runs one inference on a gate a call will later use; the call must see
+        the same gate a fresh one would be."""
+        noise = (np.random.default_rng(0).normal(0, 1500, SAMPLE_RATE)).astype(np.int16)
+        warmed = SpeechGate()
+        warmed.warm_up()
+
+        np.testing.assert_array_equal(_run(warmed, noise)[1], _run(SpeechGate(), noise)[1])
+
     def test_speech_passes_through(self):
         """Guards the failure mode that matters most: muting the actual caller.
 
@@ -222,5 +231,137 @@ class TestSpeechGate(unittest.TestCase):
         self.assertGreater(out_rms, 1000)
 
 
+class TestSharedVADSession(unittest.TestCase):
+    """Every gate in a process runs on one Silero session; each keeps its own state."""
+
+    def _windows(self, seed: int) -> list:
+        rng = np.random.default_rng(seed)
+        return [rng.normal(0, 3000, 512).astype(np.int16) for _ in range(30)]
+
+    def test_gates_share_one_session(self):
+        self.assertIs(SpeechGate()._vad, SpeechGate()._vad)
+
+    def test_bound_run_matches_a_plain_run(self):
+        session, state = SpeechGate()._vad, np.zeros((2, 1, 128), dtype=np.float32)
+        context, expected = np.zeros(64, dtype=np.float32), []
+        for chunk in self._windows(6):
+            window = chunk.astype(np.float32) / 32768.0
+            out, state = session.run(None, {
+                "input": np.concatenate((context, window))[np.newaxis, :],
+                "state": state,
+                "sr": np.array(16000, dtype=np.int64),
+            })
+            context = window[-64:]
+            expected.append(float(out[0][0]))
+
+        gate = SpeechGate()
+        np.testing.assert_allclose([gate._speech_prob(c) for c in self._windows(6)], expected, atol=1e-6)
+
+    def test_interleaved_gates_do_not_share_state(self):
+        gate = SpeechGate()
+        a_alone = [gate._speech_prob(c) for c in self._windows(7)]
+        gate = SpeechGate()
+        b_alone = [gate._speech_prob(c) for c in self._windows(8)]
+
+        a, b = SpeechGate(), SpeechGate()
+        a_mixed, b_mixed = [], []
+        for ca, cb in zip(self._windows(7), self._windows(8)):
+            a_mixed.append(a._speech_prob(ca))
+            b_mixed.append(b._speech_prob(cb))
+
+        self.assertEqual(a_mixed, a_alone)
+        self.assertEqual(b_mixed, b_alone)
+
+
+class TestSpeechGateSubscribers(unittest.TestCase):
+    """The Sarvam tap rides on the session input's gate instead of running a second APM +
+    VAD over the same track, so what a subscriber gets must match what its own gate gave."""
+
+    def _frames(self, gate: SpeechGate, pcm: np.ndarray, rate: int = 24000) -> list:
+        got = []
+        gate.subscribe(lambda frame, open_: got.append((frame, open_)))
+        frame_len = rate // 20
+        for start in range(0, len(pcm) - frame_len, frame_len):
+            gate._process(rtc.AudioFrame(
+                data=pcm[start : start + frame_len].tobytes(),
+                sample_rate=rate,
+                num_channels=1,
+                samples_per_channel=frame_len,
+            ))
+        return got
+
+    def test_subscribers_get_gated_16k_mono(self):
+        gate = SpeechGate()
+        noise = (np.random.default_rng(4).normal(0, 1500, 24000 * 2)).astype(np.int16)
+
+        got = self._frames(gate, noise)
+
+        self.assertTrue(got)
+        self.assertTrue(all(f.sample_rate == 16000 and f.num_channels == 1 for f, _ in got))
+        self.assertFalse(any(open_ for _, open_ in got), "noise never opens the gate")
+        self.assertLess(max(np.abs(np.asarray(f.data)).max() for f, _ in got), 1, "noise is gated for subscribers too")
+
+    def test_speech_reaches_subscribers_even_while_muted(self):
+        """The guard keeps the caller from the model, not out of the transcript."""
+        gate = SpeechGate()
+        gate._speech_prob = lambda _chunk: 0.9
+        gate.muted = True
+        tone = (np.sin(2 * np.pi * 220 * np.arange(24000) / 24000) * 8000).astype(np.int16)
+
+        got = self._frames(gate, tone)
+
+        self.assertTrue(all(open_ for _, open_ in got))
+        self.assertGreater(np.abs(np.concatenate([np.asarray(f.data) for f, _ in got])).max(), 1000)
+
+    def test_multichannel_input_reaches_subscribers_downmixed_and_ungated(self):
+        gate = SpeechGate()
+        got = []
+        gate.subscribe(lambda frame, open_: got.append((frame, open_)))
+        tone = (np.sin(2 * np.pi * 220 * np.arange(24000) / 24000) * 8000).astype(np.int16)
+        stereo = np.repeat(tone, 2)
+
+        for start in range(0, len(stereo) - 2400, 2400):
+            gate._process(rtc.AudioFrame(
+                data=stereo[start : start + 2400].tobytes(),
+                sample_rate=24000,
+                num_channels=2,
+                samples_per_channel=1200,
+            ))
+
+        self.assertTrue(got)
+        self.assertTrue(all(f.sample_rate == 16000 and f.num_channels == 1 for f, _ in got))
+        self.assertTrue(all(open_ for _, open_ in got))
+        self.assertGreater(np.abs(np.concatenate([np.asarray(f.data) for f, _ in got])).max(), 1000)
+
+    def test_failing_subscriber_leaves_the_model_input_alone(self):
+        gate = SpeechGate()
+        gate._speech_prob = lambda _chunk: 0.9
+        gate.subscribe(lambda _frame, _open: 1 / 0)
+        tone = (np.sin(2 * np.pi * 220 * np.arange(SAMPLE_RATE) / SAMPLE_RATE) * 8000).astype(
+            np.int16
+        )
+
+        _, rms_out = _run(gate, tone)
+
+        self.assertTrue((rms_out > 1.0).all())
+
+    def test_unsubscribed_consumer_gets_nothing_more(self):
+        gate = SpeechGate()
+        noise = (np.random.default_rng(5).normal(0, 1500, 24000)).astype(np.int16)
+        stopped = []
+
+        def consumer(frame, open_):
+            stopped.append(frame)
+
+        gate.subscribe(consumer)
+        gate.unsubscribe(consumer)
+        gate.unsubscribe(consumer)  # a second call is harmless
+
+        still = self._frames(gate, noise)
+
+        self.assertTrue(still)
+        self.assertEqual(stopped, [])
+
+
 if __name__ == "__main__":
     unittest.main()
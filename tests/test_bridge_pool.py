@@ -0,0 +1,212 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+from src.services.exotel.custom_sip_reach import bridge_pool
+from src.services.exotel.custom_sip_reach.bridge_pool import (
+    BridgeWorkerPool,
+    PooledBridgeCall,
+    _BridgeWorker,
+)
+
+
+def _wait(predicate, timeout: float = 60.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestBridgeWorkerPool(unittest.TestCase):
+    """Real spawned hosts. With no Exotel/LiveKit env, run_bridge() returns straight
+    away after validate_config(), which is enough to exercise the job round trip."""
+
+    def _pool(self, **kwargs) -> BridgeWorkerPool:
+        pool = BridgeWorkerPool(size=1, **kwargs)
+        pool.start()
+        self.addCleanup(lambda: [w.stop() for w in list(pool._workers)])
+        return pool
+
+    def _run(self, pool, call_id="c"):
+        call = pool.run_call({"phone_number": "0000", "call_id": call_id})
+        self.assertIsNotNone(call)
+        self.assertTrue(_wait(lambda: not call.is_alive()))
+        with self.assertRaises(queue.Empty):
+            call.result_queue.get_nowait()  # config check failed before any SIP result
+        call.join(timeout=3)
+        return call._worker
+
+    def test_host_is_reused_then_recycled(self):
+        pool = self._pool(max_calls=2)
+        self.assertTrue(_wait(lambda: any(w.poll_ready() for w in pool._workers)))
+
+        first = self._run(pool, "c1")
+        self.assertTrue(first.process.is_alive())
+        self.assertIn(first, pool._workers)
+        self.assertEqual(first.active, 0)
+
+        # Second call on the same host reaches max_calls; it is retired, not kept.
+        pool._workers.sort(key=lambda w: w is not first)
+        self.assertIs(self._run(pool, "c2"), first)
+        self.assertFalse(first.process.is_alive())
+        self.assertNotIn(first, pool._workers)
+        self.assertEqual(pool.idle_count, 1)
+
+    def test_host_multiplexes_up_to_its_call_limit(self):
+        pool = self._pool(max_calls=50, calls_per_host=2)
+        self.assertTrue(_wait(lambda: any(w.poll_ready() for w in pool._workers)))
+        host = next(w for w in pool._workers if w.ready)
+
+        a = pool.run_call({"phone_number": "0000", "call_id": "a"})
+        b = pool.run_call({"phone_number": "0000", "call_id": "b"})
+        self.assertIs(a._worker, host)
+        self.assertIs(b._worker, host)
+        self.assertTrue(_wait(lambda: not a.is_alive() and not b.is_alive()))
+        a.join(timeout=3)
+        b.join(timeout=3)
+        self.assertEqual(host.active, 0)
+        self.assertEqual(host.calls, 2)
+
+    def test_no_ready_host_means_spawn_fallback(self):
+        pool = self._pool(max_calls=2)
+        self.assertIsNone(pool.run_call({"phone_number": "0000", "call_id": "c"}))
+
+
+class _AliveProcess:
+    def is_alive(self) -> bool:
+        return True
+
+    def join(self, timeout=None) -> None:
+        pass
+
+    def terminate(self) -> None:
+        pass
+
+
+class _RecordingPool:
+    def __init__(self):
+        self.checkins = []
+
+    def _checkin(self, worker, call_id):
+        self.checkins.append((call_id, call_id in worker.done))
+
+
+def _worker_over(conn) -> _BridgeWorker:
+    """A parent-side worker on a bare pipe, no host process behind it."""
+    worker = _BridgeWorker.__new__(_BridgeWorker)
+    worker.conn = conn
+    worker.process = _AliveProcess()
+    worker.ready = True
+    worker.retiring = False
+    worker.calls = 0
+    worker.results = {}
+    worker.done = set()
+    worker._send_lock = threading.Lock()
+    worker._recv_lock = threading.Lock()
+    return worker
+
+
+class TestPooledCallJoin(unittest.TestCase):
+    def setUp(self):
+        self.parent, self.host = multiprocessing.Pipe()
+        self.addCleanup(self.parent.close)
+        self.addCleanup(self.host.close)
+        self.worker = _worker_over(self.parent)
+        self.pool = _RecordingPool()
+
+    def _call(self, call_id):
+        self.worker.results[call_id] = deque()
+        return PooledBridgeCall(self.pool, self.worker, call_id)
+
+    def test_sibling_message_does_not_end_the_wait(self):
+        mine = self._call("mine")
+        self._call("sibling")
+        self.host.send(("done", "sibling"))
+        threading.Timer(0.3, self.host.send, args=(("done", "mine"),)).start()
+
+        mine.join(timeout=3)
+
+        self.assertEqual(self.pool.checkins, [("mine", True)])
+
+    def test_gives_up_at_the_deadline(self):
+        mine = self._call("mine")
+
+        started = time.monotonic()
+        mine.join(timeout=0.3)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        self.assertEqual(self.pool.checkins, [("mine", False)])
+
+
+class TestStuckCallOnASharedHost(unittest.TestCase):
+    def setUp(self):
+        self.parent, self.host = multiprocessing.Pipe()
+        self.addCleanup(self.parent.close)
+        self.addCleanup(self.host.close)
+        self.worker = _worker_over(self.parent)
+        self.pool = BridgeWorkerPool(size=0, max_calls=50, calls_per_host=2)
+        self.pool._workers = [self.worker]
+
+    def _call(self, call_id):
+        self.worker.results[call_id] = deque()
+        return PooledBridgeCall(self.pool, self.worker, call_id)
+
+    def test_stuck_call_is_cancelled_and_keeps_its_slot_until_done(self):
+        busy, stuck = self._call("busy"), self._call("stuck")
+
+        # Its sibling keeps the host alive, so the host can't be killed: the stuck
+        # call is cancelled and its slot (and RTP port) stays taken.
+        self.assertFalse(stuck.join(timeout=0.2))
+        self.assertEqual(self.host.recv(), ("cancel", "stuck"))
+        self.assertTrue(self.worker.retiring)
+        self.assertEqual(self.worker.active, 2)
+
+        self.host.send(("done", "busy"))
+        self.assertTrue(busy.join(timeout=1))
+        self.assertIn(self.worker, self.pool._workers)  # still running the stuck call
+
+        self.host.send(("done", "stuck"))
+        self.assertTrue(stuck.join(timeout=1))
+        self.assertEqual(self.worker.active, 0)
+        self.assertNotIn(self.worker, self.pool._workers)
+        self.assertIsNone(self.host.recv())  # retired host told to stop
+
+    def test_stuck_last_call_takes_the_host_down(self):
+        stuck = self._call("stuck")
+
+        self.assertTrue(stuck.join(timeout=0.2))
+        self.assertIsNone(self.host.recv())
+        self.assertNotIn(self.worker, self.pool._workers)
+
+
+class TestHostInboundBye(unittest.IsolatedAsyncioTestCase):
+    async def test_bye_wakes_run_bridge_on_the_host_loop(self):
+        parent, host = multiprocessing.Pipe()
+        self.addCleanup(parent.close)
+        seen = {}
+
+        async def fake_run_bridge(result_queue, inbound_bye_event, **job):
+            seen["event"] = inbound_bye_event
+            await inbound_bye_event.wait()
+
+        with patch.object(bridge_pool, "run_bridge", fake_run_bridge):
+            serving = asyncio.create_task(bridge_pool._serve(host))
+            self.assertEqual(await asyncio.to_thread(parent.recv), ("ready", None))
+            parent.send(("call", {"phone_number": "0000", "call_id": "c"}))
+            parent.send(("bye", "c"))
+            self.assertEqual(await asyncio.to_thread(parent.recv), ("done", "c"))
+            parent.send(None)
+            await asyncio.wait_for(serving, 3)
+
+        self.assertIsInstance(seen["event"], asyncio.Event)
+
+
+if __name__ == "__main__":
+    unittest.main()
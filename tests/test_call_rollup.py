@@ -0,0 +1,161 @@
+import copy
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from src.services.analytics.rollup import ROLLUP_FIELD, apply_rollup, rollup_source
+
+T0 = datetime(2026, 3, 10, 14, 30, tzinfo=timezone.utc)
+DAY = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+class FakeCollection:
+    """Enough of a Mongo collection for equality filters, $set/$inc and upsert."""
+
+    def __init__(self, docs=()):
+        self.docs = [dict(d) for d in docs]
+
+    @staticmethod
+    def _matches(doc, flt):
+        return all(doc.get(k) == v for k, v in flt.items())
+
+    @staticmethod
+    def _apply(doc, update):
+        doc.update(copy.deepcopy(update.get("$set", {})))
+        for field, delta in update.get("$inc", {}).items():
+            doc[field] = doc.get(field, 0) + delta
+
+    async def find_one(self, flt, projection=None):
+        for doc in self.docs:
+            if self._matches(doc, flt):
+                return copy.deepcopy(doc)
+        return None
+
+    async def update_one(self, flt, update, upsert=False):
+        for doc in self.docs:
+            if self._matches(doc, flt):
+                self._apply(doc, update)
+                return SimpleNamespace(modified_count=1)
+        if upsert:
+            doc = dict(flt)
+            self._apply(doc, update)
+            self.docs.append(doc)
+        return SimpleNamespace(modified_count=0)
+
+
+def _call(**fields):
+    return {
+        "_id": 1,
+        "room_name": "room-1",
+        "created_by_email": "user@example.com",
+        "assistant_id": "a-1",
+        "assistant_name": "Support Bot",
+        "call_type": "outbound",
+        "call_service": "twilio",
+        "platform_number": "+15550001",
+        "call_status": "completed",
+        "started_at": T0,
+        "call_duration_minutes": 2.5,
+        **fields,
+    }
+
+
+class TestApplyRollup(unittest.IsolatedAsyncioTestCase):
+    def _rows(self, rollups):
+        return sorted(
+            (row["call_status"], row["total_calls"], row["total_duration_minutes"]) for row in rollups.docs
+        )
+
+    async def test_terminal_call_is_counted_once_under_its_day(self):
+        records, rollups = FakeCollection([_call()]), FakeCollection()
+
+        self.assertTrue(await apply_rollup(records, rollups, "room-1"))
+        self.assertFalse(await apply_rollup(records, rollups, "room-1"))  # re-finalized: no double count
+
+        (row,) = rollups.docs
+        self.assertEqual(row["day"], DAY)
+        self.assertEqual(row["user_email"], "user@example.com")
+        self.assertEqual(row["assistant_name"], "Support Bot")
+        self.assertEqual((row["total_calls"], row["total_duration_minutes"]), (1, 2.5))
+
+    async def test_live_call_is_not_counted(self):
+        records, rollups = FakeCollection([_call(call_status="answered")]), FakeCollection()
+        self.assertFalse(await apply_rollup(records, rollups, "room-1"))
+        self.assertEqual(rollups.docs, [])
+
+    async def test_patched_duration_moves_minutes_not_calls(self):
+        records, rollups = FakeCollection([_call(call_duration_minutes=None)]), FakeCollection()
+        await apply_rollup(records, rollups, "room-1")
+        records.docs[0]["call_duration_minutes"] = 4.0
+        await apply_rollup(records, rollups, "room-1")
+        self.assertEqual(self._rows(rollups), [("completed", 1, 4.0)])
+
+    async def test_status_change_moves_the_call_between_rows(self):
+        records, rollups = FakeCollection([_call(call_status="failed", call_duration_minutes=None)]), FakeCollection()
+        await apply_rollup(records, rollups, "room-1")
+        records.docs[0].update(call_status="completed", call_duration_minutes=3.0)
+        await apply_rollup(records, rollups, "room-1")
+        self.assertEqual(self._rows(rollups), [("completed", 1, 3.0), ("failed", 0, 0.0)])
+
+    async def test_losing_the_marker_race_rereads_instead_of_double_counting(self):
+        records, rollups = FakeCollection([_call()]), FakeCollection()
+        real_update = records.update_one
+
+        async def racing_update(flt, update, upsert=False):
+            # Another pass claims the marker between our read and our claim.
+            records.update_one = real_update
+            await apply_rollup(records, rollups, "room-1")
+            return await real_update(flt, update, upsert)
+
+        records.update_one = racing_update
+        await apply_rollup(records, rollups, "room-1")
+        self.assertEqual(self._rows(rollups), [("completed", 1, 2.5)])
+        self.assertIsNotNone(records.docs[0][ROLLUP_FIELD])
+
+
+class TestRollupSource(unittest.TestCase):
+    def test_whole_days_from_rollups_edges_live(self):
+        start, end = DAY + timedelta(hours=9), DAY + timedelta(days=3, hours=5)
+        rollup_match, union = rollup_source(start, end, {"user_email": "user@example.com"})
+
+        self.assertEqual(
+            rollup_match["$match"]["day"],
+            {"$gte": DAY + timedelta(days=1), "$lt": DAY + timedelta(days=3)},
+        )
+        live_match = union["$unionWith"]["pipeline"][0]["$match"]
+        self.assertEqual(live_match["created_by_email"], "user@example.com")
+        self.assertEqual(live_match["$or"], [
+            {"started_at": {"$gte": start, "$lt": DAY + timedelta(days=1)}},
+            {"started_at": {"$gte": DAY + timedelta(days=3), "$lte": end}},
+        ])
+
+    def test_range_inside_one_day_is_all_live(self):
+        start, end = DAY + timedelta(hours=1), DAY + timedelta(hours=5)
+        rollup_match, union = rollup_source(start, end)
+
+        day = rollup_match["$match"]["day"]
+        self.assertEqual(day["$gte"], day["$lt"])  # empty
+        self.assertEqual(
+            union["$unionWith"]["pipeline"][0]["$match"]["$or"],
+            [{"started_at": {"$gte": start, "$lte": end}}],
+        )
+
+    def test_exact_cut_days_are_read_live(self):
+        start, end = DAY, DAY + timedelta(days=10)
+        cut = DAY + timedelta(days=4, hours=7)
+        rollup_match, union = rollup_source(start, end, exact=(cut, start))
+
+        cut_day = DAY + timedelta(days=4)
+        self.assertEqual(rollup_match["$match"]["day"]["$nin"], [cut_day])  # start is a midnight: no cut
+        self.assertIn(
+            {"started_at": {"$gte": cut_day, "$lt": cut_day + timedelta(days=1)}},
+            union["$unionWith"]["pipeline"][0]["$match"]["$or"],
+        )
+
+    def test_naive_bounds_are_taken_as_utc(self):
+        rollup_match, _ = rollup_source(datetime(2026, 3, 10), datetime.now(timezone.utc))
+        self.assertEqual(rollup_match["$match"]["day"]["$gte"], DAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
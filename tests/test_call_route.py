@@ -1,11 +1,27 @@
+import csv
+import io
+import json
 import unittest
+import uuid
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
+from beanie import PydanticObjectId
 from fastapi import HTTPException
 
-from src.api.models.api_schemas import TriggerOutboundCall
-from src.api.routes.call import trigger_outbound_call
+from pymongo.errors import BulkWriteError
+
+from src.api.models.api_schemas import TriggerBulkOutboundCall, TriggerOutboundCall
+from src.api.routes.call import (
+    _parse_bulk_csv,
+    export_call_records,
+    get_call_transcript,
+    list_call_records,
+    trigger_bulk_outbound_call,
+    trigger_bulk_outbound_call_csv,
+    trigger_outbound_call,
+)
+from src.core.db.db_schemas import CallRecordSummary
 
 
 class QueryField:
@@ -13,6 +29,62 @@ class QueryField:
         return other
 
 
+class FakeRecordsQuery:
+    def __init__(self, records):
+        self.records = records
+        self.projection = None
+        self.skipped = None
+        self.sort_spec = None
+
+    async def count(self):
+        return len(self.records)
+
+    def sort(self, spec):
+        self.sort_spec = spec
+        return self
+
+    def skip(self, n):
+        self.skipped = n
+        return self
+
+    def limit(self, _):
+        return self
+
+    def project(self, model):
+        self.projection = model
+        return self
+
+    async def to_list(self):
+        return self.records
+
+
+class FakeExportQuery:
+    """Async-iterable stand-in for a projected CallRecord cursor."""
+
+    def __init__(self, records):
+        self.records = records
+        self.find_kwargs = None
+        self.sort_spec = None
+
+    def sort(self, spec):
+        self.sort_spec = spec
+        return self
+
+    def project(self, _):
+        return self
+
+    async def __aiter__(self):
+        for record in self.records:
+            yield record
+
+
+def _summary(room_name: str) -> CallRecordSummary:
+    return CallRecordSummary(
+        _id=PydanticObjectId(), room_name=room_name, to_number="+911234567890",
+        call_status="completed", started_at="2026-01-01T00:00:00Z",
+    )
+
+
 class TestCallRoute(unittest.IsolatedAsyncioTestCase):
     async def test_rejects_trunk_service_mismatch(self):
         request = TriggerOutboundCall(
@@ -48,5 +120,262 @@ class TestCallRoute(unittest.IsolatedAsyncioTestCase):
         self.assertIn("does not match", ctx.exception.detail)
 
 
+    async def _list(self, limit=10, **kwargs):
+        query = FakeRecordsQuery([_summary("room-1"), _summary("room-2")])
+        self.find_args = None
+
+        def find(*args):
+            self.find_args = args
+            return query
+
+        call_record_model = SimpleNamespace(created_by_email=QueryField(), find=find)
+        get_transcripts = AsyncMock(return_value={"room-1": [{"speaker": "user", "text": "hi"}]})
+        with patch("src.api.routes.call.CallRecord", call_record_model), patch(
+            "src.api.routes.call._livekit_services.get_transcripts", get_transcripts
+        ):
+            response = await list_call_records(
+                passthrough_only=False, to_number=None, call_status=None, start_date=None,
+                end_date=None, sort_by="started_at", sort_order="desc", page=1, limit=limit,
+                current_user=SimpleNamespace(user_email="user@example.com"),
+                **{"include": None, "cursor": None, **kwargs},
+            )
+        self.pagination = response.data["pagination"]
+        return response.data["records"], query, get_transcripts
+
+    async def test_records_list_projects_summary_without_transcripts(self):
+        records, query, get_transcripts = await self._list(include=None)
+        self.assertIs(query.projection, CallRecordSummary)
+        get_transcripts.assert_not_awaited()
+        self.assertNotIn("transcripts", records[0])
+        self.assertEqual(records[0]["transcript_count"], 0)
+
+    async def test_records_list_embeds_transcripts_on_request(self):
+        records, _, get_transcripts = await self._list(include="transcripts")
+        get_transcripts.assert_awaited_once_with(["room-1", "room-2"])
+        self.assertEqual(records[0]["transcripts"], [{"speaker": "user", "text": "hi"}])
+        self.assertEqual(records[1]["transcripts"], [])
+
+    async def test_offset_page_hands_out_a_cursor_and_cursor_page_seeks_from_it(self):
+        _, query, _ = await self._list(limit=2)
+        self.assertEqual(query.skipped, 0)
+        self.assertEqual(query.sort_spec, [("started_at", -1), ("_id", -1)])
+        self.assertEqual(self.pagination["total"], 2)
+        cursor = self.pagination["next_cursor"]
+        self.assertIsNotNone(cursor)
+
+        _, query, _ = await self._list(limit=2, cursor=cursor)
+        self.assertIsNone(query.skipped)  # no skip at all on the cursor path
+        self.assertIn("$or", self.find_args[-1])
+        self.assertNotIn("total", self.pagination)
+
+    async def test_cursor_with_non_keyset_sort_is_rejected(self):
+        with self.assertRaises(HTTPException) as ctx:
+            await list_call_records(
+                passthrough_only=False, to_number=None, call_status=None, start_date=None,
+                end_date=None, sort_by="call_duration_minutes", sort_order="desc", page=1,
+                limit=10, include=None, cursor="abc",
+                current_user=SimpleNamespace(user_email="user@example.com"),
+            )
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    async def test_transcript_endpoint_is_scoped_to_the_caller(self):
+        async def lines(room_name):
+            yield {"speaker": "user", "text": "hello"}
+
+        def call_record_model(found):
+            return SimpleNamespace(
+                room_name=QueryField(),
+                created_by_email=QueryField(),
+                find_one=lambda *_: SimpleNamespace(project=AsyncMock(return_value=found)),
+            )
+
+        user = SimpleNamespace(user_email="user@example.com")
+        with patch("src.api.routes.call.CallRecord", call_record_model(None)):
+            with self.assertRaises(HTTPException) as ctx:
+                await get_call_transcript(room_name="room-1", current_user=user)
+        self.assertEqual(ctx.exception.status_code, 404)
+
+        with patch("src.api.routes.call.CallRecord", call_record_model(object())), patch(
+            "src.api.routes.call._livekit_services.iter_transcript", lines
+        ):
+            response = await get_call_transcript(room_name="room-1", current_user=user)
+        self.assertEqual(response.data["transcripts"], [{"speaker": "user", "text": "hello"}])
+
+
+class FakeQueue:
+    """OutboundCallQueue stand-in whose insert_many honours the unique queue_id."""
+
+    stored: set = set()
+    insert_calls: list = []
+
+    def __init__(self, queue_id=None, **fields):
+        self.queue_id = queue_id or uuid.uuid4().hex  # the model's default_factory
+        self.__dict__.update(fields)
+
+    @classmethod
+    async def insert_many(cls, docs, ordered=True):
+        cls.insert_calls.append(len(docs))
+        dupes = [doc for doc in docs if doc.queue_id in cls.stored]
+        cls.stored.update(doc.queue_id for doc in docs)
+        if dupes:
+            raise BulkWriteError({
+                "writeErrors": [{"code": 11000} for _ in dupes],
+                "nInserted": len(docs) - len(dupes),
+            })
+        return SimpleNamespace(inserted_ids=[doc.queue_id for doc in docs])
+
+
+class TestBulkOutbound(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        FakeQueue.stored, FakeQueue.insert_calls = set(), []
+        self.assistant_model = SimpleNamespace(
+            assistant_id=QueryField(),
+            assistant_created_by_email=QueryField(),
+            find_one=AsyncMock(return_value=SimpleNamespace(assistant_id="assistant-1", assistant_name="A")),
+        )
+        self.trunk_model = SimpleNamespace(
+            trunk_id=QueryField(),
+            trunk_created_by_email=QueryField(),
+            trunk_is_active=QueryField(),
+            find_one=AsyncMock(return_value=SimpleNamespace(trunk_id="trunk-1", trunk_type="twilio")),
+        )
+
+    async def _bulk(self, rows, batch_key="campaign-1"):
+        request = TriggerBulkOutboundCall(
+            assistant_id="assistant-1", trunk_id="trunk-1", call_service="twilio", batch_key=batch_key,
+            calls=[{"to_number": f"+9100000000{i}", "metadata": {"row": i}} for i in range(rows)],
+        )
+        with patch("src.api.routes.call.Assistant", self.assistant_model), patch(
+            "src.api.routes.call.OutboundSIP", self.trunk_model
+        ), patch("src.api.routes.call.OutboundCallQueue", FakeQueue), patch(
+            "src.api.routes.call.BULK_INSERT_CHUNK", 2
+        ):
+            response = await trigger_bulk_outbound_call(
+                request=request, current_user=SimpleNamespace(user_email="user@example.com")
+            )
+        return json.loads(response.body)["data"]
+
+    async def test_validates_once_and_inserts_in_chunks(self):
+        data = await self._bulk(5)
+
+        self.assertEqual(self.assistant_model.find_one.await_count, 1)
+        self.assertEqual(self.trunk_model.find_one.await_count, 1)
+        self.assertEqual(FakeQueue.insert_calls, [2, 2, 1])
+        self.assertEqual((data["queued"], data["already_queued"]), (5, 0))
+        self.assertEqual(len(set(data["queue_ids"])), 5)
+
+    async def test_resent_batch_key_queues_nothing_twice(self):
+        first = await self._bulk(3)
+        again = await self._bulk(5)  # retry after a partial failure, now with the full list
+
+        self.assertEqual(again["queue_ids"][:3], first["queue_ids"])
+        self.assertEqual((again["queued"], again["already_queued"]), (2, 3))
+        self.assertEqual(len(FakeQueue.stored), 5)
+
+    async def test_without_batch_key_rows_get_fresh_ids(self):
+        first, second = await self._bulk(2, batch_key=None), await self._bulk(2, batch_key=None)
+        self.assertEqual(second["queued"], 2)
+        self.assertFalse(set(first["queue_ids"]) & set(second["queue_ids"]))
+
+
+class TestParseBulkCsv(unittest.TestCase):
+    def test_other_columns_become_metadata(self):
+        raw = "\ufeffto_number,name,plan\n+911,Asha,gold\n +912 ,Ravi,\n".encode()
+        self.assertEqual(
+            _parse_bulk_csv(raw),
+            [("+911", {"name": "Asha", "plan": "gold"}), ("+912", {"name": "Ravi"})],
+        )
+
+    def test_rejects_missing_column_and_empty_numbers(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _parse_bulk_csv(b"phone,name\n+911,Asha\n")
+        self.assertIn("to_number", ctx.exception.detail)
+
+        with self.assertRaises(HTTPException) as ctx:
+            _parse_bulk_csv(b"to_number,name\n+911,Asha\n,Ravi\n")
+        self.assertIn("line(s) 3", ctx.exception.detail)
+
+
+class TestBulkCsvUpload(unittest.IsolatedAsyncioTestCase):
+    async def test_oversized_upload_is_rejected_before_parsing(self):
+        upload = SimpleNamespace(read=AsyncMock(return_value=b"to_number\n" + b"+911\n" * 10))
+        with patch("src.api.routes.call.BULK_CSV_MAX_BYTES", 16), patch(
+            "src.api.routes.call._parse_bulk_csv"
+        ) as parse, self.assertRaises(HTTPException) as ctx:
+            await trigger_bulk_outbound_call_csv(
+                file=upload, assistant_id="assistant-1", trunk_id="trunk-1", call_service="twilio",
+                batch_key=None, current_user=SimpleNamespace(user_email="user@example.com"),
+            )
+
+        self.assertEqual(ctx.exception.status_code, 413)
+        upload.read.assert_awaited_once_with(17)  # never more than the cap plus one byte
+        parse.assert_not_called()
+
+
+class TestExportCallRecords(unittest.IsolatedAsyncioTestCase):
+    async def _export(self, records, batch_size=500, **kwargs):
+        query = FakeExportQuery(records)
+
+        def find(*args, **find_kwargs):
+            query.find_kwargs = find_kwargs
+            return query
+
+        call_record_model = SimpleNamespace(created_by_email=QueryField(), find=find)
+        get_transcripts = AsyncMock(side_effect=lambda rooms: {
+            room: [{"speaker": "user", "text": f"hi from {room}", "timestamp": "2026-01-01T00:00:01Z"}]
+            for room in rooms if room != "room-2"
+        })
+        with patch("src.api.routes.call.CallRecord", call_record_model), patch(
+            "src.api.routes.call._livekit_services.get_transcripts", get_transcripts
+        ), patch("src.api.routes.call.EXPORT_BATCH_SIZE", batch_size):
+            response = await export_call_records(
+                current_user=SimpleNamespace(user_email="user@example.com"),
+                **{"format": "ndjson", "assistant_id": None, "call_status": None, "start_date": None,
+                   "end_date": None, "passthrough_only": False, "include": None, **kwargs},
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+        return response, chunks, query, get_transcripts
+
+    async def test_ndjson_streams_one_chunk_per_batch_oldest_first(self):
+        records = [_summary(f"room-{i}") for i in range(5)]
+        response, chunks, query, get_transcripts = await self._export(records, batch_size=2)
+
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        self.assertEqual(len(chunks), 3)  # 2 + 2 + 1
+        self.assertEqual(query.find_kwargs, {"batch_size": 2})
+        self.assertEqual(query.sort_spec, [("started_at", 1), ("_id", 1)])
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        self.assertEqual([r["room_name"] for r in rows], [f"room-{i}" for i in range(5)])
+        self.assertNotIn("id", rows[0])
+        self.assertNotIn("transcripts", rows[0])
+        get_transcripts.assert_not_awaited()
+
+    async def test_ndjson_nests_transcripts_fetched_per_batch(self):
+        records = [_summary(f"room-{i}") for i in range(3)]
+        _, chunks, _, get_transcripts = await self._export(records, batch_size=2, include="transcripts")
+
+        self.assertEqual(get_transcripts.await_count, 2)
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        self.assertEqual(rows[0]["transcripts"][0]["text"], "hi from room-0")
+        self.assertEqual(rows[2]["transcripts"], [])
+
+    async def test_csv_flattens_one_row_per_transcript_line(self):
+        records = [_summary("room-1"), _summary("room-2")]
+        response, chunks, _, _ = await self._export(records, format="csv", include="transcripts")
+
+        self.assertEqual(response.media_type, "text/csv")
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        self.assertEqual(
+            [(r["room_name"], r["transcript_text"]) for r in rows],
+            [("room-1", "hi from room-1"), ("room-2", "")],
+        )
+        self.assertNotIn("id", rows[0])
+
+    async def test_csv_header_is_sent_before_any_record_is_read(self):
+        _, chunks, _, _ = await self._export([], format="csv")
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0].startswith("room_name,"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pymongo.errors import BulkWriteError
+
+from scripts.migrate_transcripts import legacy_lines
+from src.services.livekit.livekit_svc import LiveKitService
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeCallTranscript:
+    inserted: list = []
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    @classmethod
+    async def insert_many(cls, docs):
+        cls.inserted.extend(docs)
+
+
+class TestAddTranscripts(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        FakeCallTranscript.inserted = []
+        patcher = patch("src.services.livekit.livekit_svc.CallTranscript", FakeCallTranscript)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _call_record_model(self, before):
+        update = AsyncMock(return_value=before)
+        model = MagicMock()
+        model.find_one.return_value = SimpleNamespace(update=update)
+        model.return_value.insert = AsyncMock()
+        return model, update
+
+    async def _add(self, entries):
+        await LiveKitService().add_transcripts(
+            room_name="room-1",
+            entries=entries,
+            assistant_id="a-1",
+            assistant_name="Assistant",
+            to_number="0000",
+            recording_path=None,
+        )
+
+    async def test_batch_reserves_seq_after_existing_lines_in_speaking_order(self):
+        model, update = self._call_record_model(SimpleNamespace(transcript_count=5))
+        with patch("src.services.livekit.livekit_svc.CallRecord", model):
+            await self._add([
+                {"speaker": "assistant", "text": "reply", "timestamp": T0 + timedelta(seconds=2)},
+                {"speaker": "user", "text": "question", "timestamp": T0},
+            ])
+
+        # One update per batch: count and last-spoken time only, no array rewrite.
+        (ops,), _ = update.await_args
+        self.assertEqual(ops, {
+            "$inc": {"transcript_count": 2},
+            "$max": {"transcript_last_at": T0 + timedelta(seconds=2)},
+        })
+        self.assertEqual(
+            [(line.seq, line.text) for line in FakeCallTranscript.inserted],
+            [(5, "question"), (6, "reply")],
+        )
+        model.assert_not_called()  # record existed — nothing created
+
+    async def test_missing_record_is_created_with_the_summary(self):
+        model, _ = self._call_record_model(None)
+        with patch("src.services.livekit.livekit_svc.CallRecord", model):
+            await self._add([{"speaker": "user", "text": "hello", "timestamp": T0}])
+
+        self.assertEqual(model.call_args.kwargs["transcript_count"], 1)
+        self.assertEqual(model.call_args.kwargs["transcript_last_at"], T0)
+        model.return_value.insert.assert_awaited_once()
+        self.assertEqual([line.seq for line in FakeCallTranscript.inserted], [0])
+
+    async def test_failed_insert_takes_the_count_back_down(self):
+        model, update = self._call_record_model(SimpleNamespace(transcript_count=5))
+        failure = BulkWriteError({"writeErrors": [{"code": 6}], "nInserted": 1})
+        entries = [
+            {"speaker": "user", "text": "a", "timestamp": T0},
+            {"speaker": "assistant", "text": "b", "timestamp": T0 + timedelta(seconds=1)},
+            {"speaker": "user", "text": "c", "timestamp": T0 + timedelta(seconds=2)},
+        ]
+        with patch("src.services.livekit.livekit_svc.CallRecord", model), patch.object(
+            FakeCallTranscript, "insert_many", AsyncMock(side_effect=failure)
+        ), self.assertRaises(BulkWriteError):
+            await self._add(entries)
+
+        reserve, rollback = (args[0] for args, _ in update.await_args_list)
+        self.assertEqual(reserve["$inc"], {"transcript_count": 3})
+        self.assertEqual(rollback, {"$inc": {"transcript_count": -2}})  # one line did land
+
+    async def test_empty_batch_writes_nothing(self):
+        model, update = self._call_record_model(None)
+        with patch("src.services.livekit.livekit_svc.CallRecord", model):
+            await self._add([])
+        update.assert_not_awaited()
+        self.assertEqual(FakeCallTranscript.inserted, [])
+
+
+class TestMigrateTranscripts(unittest.TestCase):
+    def test_legacy_lines_take_negative_seq_in_speaking_order(self):
+        lines = legacy_lines("room-1", [
+            {"speaker": "assistant", "text": "b", "timestamp": T0 + timedelta(seconds=1)},
+            {"speaker": "user", "text": "a", "timestamp": T0},
+            {"speaker": "user", "text": "no timestamp"},
+        ])
+        self.assertEqual([(line["seq"], line["text"]) for line in lines], [(-2, "a"), (-1, "b")])
+        self.assertTrue(all(line["room_name"] == "room-1" for line in lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
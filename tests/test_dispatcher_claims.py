@@ -0,0 +1,141 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.services.outbound_dispatcher import dispatcher
+from src.services.outbound_dispatcher.dispatcher import DISPATCHER_ID, _claim_pending
+
+T0 = datetime(2026, 3, 10, 9, 0, tzinfo=timezone.utc)
+
+
+class QueryField(str):
+    """A field name whose == builds a Mongo filter, as Beanie's fields do."""
+
+    __hash__ = str.__hash__
+
+    def __eq__(self, other):
+        return {str(self): other}
+
+
+def _matches(doc, query: dict) -> bool:
+    for field, cond in query.items():
+        value = getattr(doc, field, None)
+        if isinstance(cond, dict) and "$in" in cond:
+            if value not in cond["$in"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeQuery:
+    def __init__(self, model, conditions):
+        self.model = model
+        self.filter = {}
+        for cond in conditions:
+            self.filter.update(getattr(cond, "query", cond))
+        self._limit = None
+
+    def _docs(self):
+        return [d for d in self.model.docs if _matches(d, self.filter)]
+
+    def sort(self, field):
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def project(self, _model):
+        return self
+
+    async def to_list(self):
+        docs = sorted(self._docs(), key=lambda d: d.queued_at)[: self._limit]
+        self.model.reads.append(self.filter)
+        if self.model.after_read:
+            hook, self.model.after_read = self.model.after_read, None
+            hook()
+        return docs
+
+    async def update_many(self, update):
+        for doc in self._docs():
+            for field, value in update.query["$set"].items():
+                setattr(doc, field, value)
+
+
+class FakeQueue:
+    """OutboundCallQueue stand-in over an in-memory list of documents."""
+
+    id = QueryField("id")
+    status = QueryField("status")
+    claim_token = QueryField("claim_token")
+    claimed_at = QueryField("claimed_at")
+    claimed_by = QueryField("claimed_by")
+    lease_expires_at = QueryField("lease_expires_at")
+    docs: list = []
+    reads: list = []
+    after_read = None
+
+    @classmethod
+    def find(cls, *conditions):
+        return FakeQuery(cls, conditions)
+
+
+def _item(n: int, status: str = "pending"):
+    return SimpleNamespace(
+        id=f"oid-{n}", queue_id=f"q-{n}", status=status, claim_token=None,
+        queued_at=T0 + timedelta(seconds=n),
+    )
+
+
+class TestClaimPending(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        FakeQueue.docs, FakeQueue.reads, FakeQueue.after_read = [], [], None
+        dispatcher._owned_claims.clear()
+
+    async def _claim(self, limit):
+        with patch.object(dispatcher, "OutboundCallQueue", FakeQueue):
+            return await _claim_pending(limit)
+
+    async def test_claims_the_oldest_pending_items(self):
+        FakeQueue.docs = [_item(3), _item(1), _item(2, status="dispatching"), _item(4)]
+
+        claimed = await self._claim(2)
+
+        self.assertEqual([c.queue_id for c in claimed], ["q-1", "q-3"])
+        self.assertTrue(all(c.status == "dispatching" and c.claimed_by == DISPATCHER_ID for c in claimed))
+        self.assertEqual(len({c.claim_token for c in claimed}), 1)
+        self.assertEqual(FakeQueue.docs[3].status, "pending")
+        self.assertEqual(dispatcher._owned_claims, {"q-1", "q-3"})
+
+    async def test_item_claimed_elsewhere_in_between_is_not_handed_out(self):
+        FakeQueue.docs = [_item(1), _item(2)]
+
+        def other_replica_claims():
+            FakeQueue.docs[0].status = "dispatching"
+            FakeQueue.docs[0].claim_token = "theirs"
+
+        FakeQueue.after_read = other_replica_claims
+        claimed = await self._claim(2)
+
+        self.assertEqual([c.queue_id for c in claimed], ["q-2"])
+        self.assertEqual(FakeQueue.docs[0].claim_token, "theirs")
+
+    async def test_read_back_is_bounded_by_the_candidate_ids(self):
+        """The queue keeps every dispatched row; reading back by claim_token alone has no
+        index behind it and scans the whole collection."""
+        FakeQueue.docs = [_item(1), _item(2)]
+
+        await self._claim(5)
+
+        read_back = FakeQueue.reads[-1]
+        self.assertEqual(read_back["id"], {"$in": ["oid-1", "oid-2"]})
+        self.assertIn("claim_token", read_back)
+
+    async def test_empty_queue_claims_nothing(self):
+        self.assertEqual(await self._claim(3), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
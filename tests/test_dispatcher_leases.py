@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pymongo.errors import AutoReconnect, DuplicateKeyError
+
+from src.services.outbound_dispatcher import dispatcher
+from src.services.outbound_dispatcher.dispatcher import (
+    DISPATCHER_ID,
+    _acquire_lease,
+    _fail_all_active_calls,
+    _process_pending,
+    _recover_expired_claims,
+    _release_lease,
+)
+
+
+def _fake_client(col):
+    db = MagicMock()
+    db.__getitem__.return_value = col
+    client = MagicMock()
+    client.__getitem__.return_value = db
+    return client
+
+
+class TestDispatcherLease(unittest.IsolatedAsyncioTestCase):
+    """Replicas coordinate through upserts on dispatcher_leases rows."""
+
+    async def test_acquire_only_matches_lapsed_or_own_row(self):
+        col = MagicMock()
+        col.update_one = AsyncMock()
+        with patch.object(dispatcher.Database, "client", _fake_client(col)):
+            self.assertTrue(await _acquire_lease("outbound_claim", 10))
+
+        filter_, update = col.update_one.call_args.args
+        self.assertEqual(filter_["name"], "outbound_claim")
+        self.assertIn({"holder": DISPATCHER_ID}, filter_["$or"])
+        self.assertEqual(update["$set"]["holder"], DISPATCHER_ID)
+        self.assertTrue(col.update_one.call_args.kwargs["upsert"])
+
+    async def test_live_holder_elsewhere_means_not_acquired(self):
+        # The filter misses the live row, so the upsert collides on the unique name.
+        col = MagicMock()
+        col.update_one = AsyncMock(side_effect=DuplicateKeyError("dup"))
+        with patch.object(dispatcher.Database, "client", _fake_client(col)):
+            self.assertFalse(await _acquire_lease("outbound_claim", 10))
+
+    async def test_release_only_touches_own_row(self):
+        col = MagicMock()
+        col.delete_one = AsyncMock()
+        with patch.object(dispatcher.Database, "client", _fake_client(col)):
+            await _release_lease("outbound_claim")
+
+        col.delete_one.assert_awaited_once_with(
+            {"name": "outbound_claim", "holder": DISPATCHER_ID}
+        )
+
+
+class TestDispatcherSurvivesMongoErrors(unittest.IsolatedAsyncioTestCase):
+    """A network blip or election on one tick must not end outbound_dispatcher_loop."""
+
+    async def test_claim_lock_error_skips_the_tick(self):
+        with patch.object(dispatcher, "_acquire_lease", AsyncMock(side_effect=AutoReconnect("blip"))), \
+                patch.object(dispatcher, "_release_lease", AsyncMock()) as release:
+            await _process_pending()
+        release.assert_not_awaited()
+
+    async def test_claim_recovery_error_is_swallowed(self):
+        with patch.object(dispatcher, "_release_lapsed_claims", AsyncMock(side_effect=AutoReconnect("blip"))):
+            await _recover_expired_claims()
+
+
+class TestStartupCleanup(unittest.IsolatedAsyncioTestCase):
+    """Startup cleanup fails the previous process's calls unless another replica is live."""
+
+    async def _run(self, alive: list[bool]):
+        record = MagicMock(call_status="answered", room_name="room-1", save=AsyncMock())
+        model = MagicMock()
+        model.find.return_value.to_list = AsyncMock(return_value=[record])
+        with patch.object(dispatcher, "_other_dispatchers_alive", AsyncMock(side_effect=alive)), \
+                patch.object(dispatcher, "_reap_orphaned_calls", AsyncMock()) as reap, \
+                patch.object(dispatcher, "apply_call_rollup", AsyncMock()), \
+                patch.object(dispatcher, "CallRecord", model), \
+                patch.object(dispatcher.asyncio, "sleep", AsyncMock()) as sleep:
+            await _fail_all_active_calls()
+        return record, reap, sleep
+
+    async def test_own_stale_heartbeat_is_waited_out(self):
+        """A crash-and-restart sees its previous process's heartbeat; once that lapses the
+        dead calls are failed straight away."""
+        record, reap, sleep = await self._run([True, False])
+
+        sleep.assert_awaited_once_with(dispatcher.DISPATCH_LEASE_SECONDS)
+        self.assertEqual(record.call_status, "failed")
+        reap.assert_not_awaited()
+
+    async def test_live_replica_means_reap_instead(self):
+        record, reap, _ = await self._run([True, True])
+
+        self.assertEqual(record.call_status, "answered")
+        reap.assert_awaited_once()
+
+    async def test_no_other_replica_cleans_up_without_waiting(self):
+        record, reap, sleep = await self._run([False])
+
+        sleep.assert_not_awaited()
+        self.assertEqual(record.call_status, "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
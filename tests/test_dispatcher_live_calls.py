@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.services.outbound_dispatcher import dispatcher
+from src.services.outbound_dispatcher.dispatcher import (
+    _apply_call_record_change,
+    _reconcile_live_calls,
+    track_live_call,
+    try_reserve_slot,
+)
+
+
+def _change(op: str, record_id: str, status: str | None = None) -> dict:
+    change = {"operationType": op, "documentKey": {"_id": record_id}}
+    if op == "update":
+        change["updateDescription"] = {"updatedFields": {"call_status": status}}
+    elif op in ("insert", "replace"):
+        change["fullDocument"] = {"call_status": status}
+    return change
+
+
+class TestLiveCallSet(unittest.IsolatedAsyncioTestCase):
+    """Slot checks read an in-memory set fed by the call_records change stream.
+
+    They used to count call_records in Mongo on every reservation and every tick.
+    """
+
+    def setUp(self):
+        self._saved = (set(dispatcher._live_calls), dispatcher._dispatching_count)
+        dispatcher._live_calls.clear()
+        dispatcher._dispatching_count = 0
+
+    def tearDown(self):
+        dispatcher._live_calls.clear()
+        dispatcher._live_calls.update(self._saved[0])
+        dispatcher._dispatching_count = self._saved[1]
+
+    def test_insert_then_terminal_update_frees_the_slot(self):
+        self.assertFalse(_apply_call_record_change(_change("insert", "a", "initiated")))
+        self.assertFalse(_apply_call_record_change(_change("update", "a", "answered")))
+        self.assertEqual(dispatcher._live_calls, {"a"})
+
+        self.assertTrue(_apply_call_record_change(_change("update", "a", "completed")))
+        self.assertEqual(dispatcher._live_calls, set())
+
+    def test_terminal_update_for_unknown_call_does_not_wake(self):
+        # A record that finished before we saw it live (or was counted elsewhere) must
+        # not look like a freed slot.
+        self.assertFalse(_apply_call_record_change(_change("update", "x", "failed")))
+
+    def test_delete_removes_live_call(self):
+        _apply_call_record_change(_change("insert", "a", "initiated"))
+        self.assertTrue(_apply_call_record_change(_change("delete", "a")))
+        self.assertEqual(dispatcher._live_calls, set())
+
+    def test_track_live_call_is_idempotent_with_the_insert_event(self):
+        track_live_call(SimpleNamespace(id="a", call_status="initiated"))
+        _apply_call_record_change(_change("insert", "a", "initiated"))
+        self.assertEqual(dispatcher._live_calls, {"a"})
+
+        track_live_call(None)
+        track_live_call(SimpleNamespace(id="b", call_status="failed"))
+        self.assertEqual(dispatcher._live_calls, {"a"})
+
+    async def test_reserve_counts_live_calls_and_reservations(self):
+        with patch.object(dispatcher.settings, "MAX_CONCURRENT_JOBS", 2):
+            dispatcher._live_calls.add("a")
+            self.assertTrue(await try_reserve_slot())
+            self.assertFalse(await try_reserve_slot())
+
+            dispatcher.release_slot()
+            self.assertTrue(await try_reserve_slot())
+
+
+class _SuspendedCursor:
+    """Yields `ids`, pausing before the last one until `resume` is set."""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.reading = asyncio.Event()
+        self.resume = asyncio.Event()
+
+    async def __aiter__(self):
+        for i, record_id in enumerate(self.ids):
+            if i == len(self.ids) - 1:
+                self.reading.set()
+                await self.resume.wait()
+            yield {"_id": record_id}
+
+
+class TestReconcileDuringChanges(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._saved = set(dispatcher._live_calls)
+
+    def tearDown(self):
+        dispatcher._live_calls = self._saved
+
+    async def test_changes_made_while_the_cursor_is_read_survive_the_swap(self):
+        dispatcher._live_calls = {"old", "ending"}
+        cursor = _SuspendedCursor(["old", "ending"])
+        client = MagicMock()
+        client.__getitem__.return_value.__getitem__.return_value.find.return_value = cursor
+
+        with patch.object(dispatcher.Database, "client", client):
+            sweep = asyncio.create_task(_reconcile_live_calls())
+            await cursor.reading.wait()
+            track_live_call(SimpleNamespace(id="new", call_status="initiated"))
+            self.assertTrue(_apply_call_record_change(_change("update", "ending", "completed")))
+            cursor.resume.set()
+            await sweep
+
+        self.assertEqual(dispatcher._live_calls, {"old", "new"})
+        self.assertIsNone(dispatcher._sweep_changes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import audioop
+import unittest
+
+import numpy as np
+
+from src.services.exotel.custom_sip_reach.config import PCMA_PAYLOAD_TYPE, PCMU_PAYLOAD_TYPE
+from src.services.exotel.custom_sip_reach.dsp_batch import DSPBatch
+from src.services.exotel.custom_sip_reach.rtp_bridge import _InboundDSP, _OutboundDSP
+
+
+class TestDSPBatch(unittest.IsolatedAsyncioTestCase):
+    """Batched rows must sound exactly like each bridge transcoding on its own."""
+
+    async def asyncSetUp(self):
+        # Small capacity so the test also covers growing the row arrays.
+        self.batch = DSPBatch(asyncio.get_running_loop(), capacity=2)
+        self.rng = np.random.default_rng(1)
+
+    def _pcm(self, n, scale, dc=0.0):
+        return (self.rng.standard_normal(n) * scale + dc).astype(np.int16).tobytes()
+
+    async def test_inbound_rows_match_per_bridge_dsp(self):
+        rows = [self.batch.register() for _ in range(5)]
+        solo = [_InboundDSP() for _ in rows]
+        pts = [PCMA_PAYLOAD_TYPE if i % 2 else PCMU_PAYLOAD_TYPE for i in range(len(rows))]
+        for _ in range(10):
+            payloads = [
+                (audioop.lin2alaw if pt == PCMA_PAYLOAD_TYPE else audioop.lin2ulaw)(
+                    self._pcm(160, 3000, dc=500), 2
+                )
+                for pt in pts
+            ]
+            batched = await asyncio.gather(
+                *(self.batch.decode(r, p, pt) for r, p, pt in zip(rows, payloads, pts))
+            )
+            for dsp, payload, pt, got in zip(solo, payloads, pts, batched):
+                want = np.frombuffer(dsp.process(payload, pt), np.int16).astype(int)
+                self.assertLessEqual(np.abs(want - np.frombuffer(got, np.int16)).max(), 1)
+
+    async def test_outbound_rows_match_per_bridge_dsp(self):
+        rows = [self.batch.register() for _ in range(3)]
+        solo = [_OutboundDSP() for _ in rows]
+        for _ in range(10):
+            frames = [self._pcm(480, 5000) for _ in rows]
+            batched = await asyncio.gather(
+                *(self.batch.downsample(r, f) for r, f in zip(rows, frames))
+            )
+            for dsp, frame, got in zip(solo, frames, batched):
+                self.assertLessEqual(np.abs(dsp.process(frame).astype(int) - got).max(), 1)
+
+    async def test_non_g711_resolves_empty_without_a_flush(self):
+        row = self.batch.register()
+        self.assertEqual(await self.batch.decode(row, b"\x00" * 4, 101), b"")
+
+    async def test_reused_row_starts_clean(self):
+        row = self.batch.register()
+        await self.batch.downsample(row, self._pcm(480, 5000))
+        self.batch.unregister(row)
+        self.assertEqual(self.batch.register(), row)
+        got = await self.batch.downsample(row, bytes(960))
+        self.assertFalse(got.any())
+
+
+    async def test_unregister_drops_queued_work_before_the_row_is_reused(self):
+        old = self.batch.register()
+        old_in = self.batch.decode(old, audioop.lin2ulaw(self._pcm(160, 3000), 2), PCMU_PAYLOAD_TYPE)
+        old_out = self.batch.downsample(old, self._pcm(480, 5000))
+        self.batch.unregister(old)  # bridge cancelled mid-await; the flush hasn't run yet
+
+        new = self.batch.register()
+        self.assertEqual(new, old)
+        payload = audioop.lin2alaw(self._pcm(160, 3000, dc=500), 2)
+        frame = self._pcm(480, 5000)
+        got_in, got_out = await asyncio.gather(
+            self.batch.decode(new, payload, PCMA_PAYLOAD_TYPE), self.batch.downsample(new, frame)
+        )
+
+        self.assertEqual(await old_in, b"")
+        self.assertEqual(len(await old_out), 0)
+        want_in = np.frombuffer(_InboundDSP().process(payload, PCMA_PAYLOAD_TYPE), np.int16).astype(int)
+        self.assertLessEqual(np.abs(want_in - np.frombuffer(got_in, np.int16)).max(), 1)
+        self.assertLessEqual(np.abs(_OutboundDSP().process(frame).astype(int) - got_out).max(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from src.services.exotel.custom_sip_reach.jitter_buffer import LOST, JitterBuffer
+
+
+def _feed(jb: JitterBuffer, seqs, start_time: float = 0.0):
+    for i, seq in enumerate(seqs):
+        jb.push(seq, seq * 160, start_time + i * 0.02, f"p{seq}")
+
+
+def _drain(jb: JitterBuffer, n: int) -> list:
+    return [jb.pop() for _ in range(n)]
+
+
+class TestJitterBuffer(unittest.TestCase):
+    def test_primes_to_target_depth_before_playing(self):
+        jb = JitterBuffer(target_packets=3, max_packets=10)
+        _feed(jb, [1, 2])
+        self.assertIsNone(jb.pop())
+        _feed(jb, [3])
+        self.assertEqual(_drain(jb, 3), ["p1", "p2", "p3"])
+
+    def test_reorders_by_sequence_number(self):
+        jb = JitterBuffer(target_packets=3)
+        _feed(jb, [1, 3, 2, 4])
+        self.assertEqual(_drain(jb, 4), ["p1", "p2", "p3", "p4"])
+        self.assertEqual(jb.stats.reordered, 1)
+
+    def test_gap_is_reported_lost_and_late_packet_dropped(self):
+        jb = JitterBuffer(target_packets=2)
+        _feed(jb, [1, 3, 4])
+        self.assertEqual(_drain(jb, 2), ["p1", LOST])
+        _feed(jb, [2])  # its slot has already been concealed; depth goes to 3
+        self.assertEqual(_drain(jb, 3), [LOST, "p3", "p4"])  # one slot held to deepen
+        self.assertEqual((jb.stats.lost, jb.stats.late), (1, 1))
+
+    def test_late_packets_deepen_the_buffer_up_to_max(self):
+        jb = JitterBuffer(target_packets=2, max_packets=3)
+        _feed(jb, [10, 11])
+        _drain(jb, 2)
+        _feed(jb, [5, 6])
+        self.assertEqual(jb.stats.depth, 3)
+
+    def test_deepening_adds_latency_under_sustained_jitter(self):
+        # Every 5th packet arrives 60 ms late; the rest arrive on time.
+        jb = JitterBuffer(target_packets=2, max_packets=6)
+        arrivals: dict[int, list[int]] = {}
+        for seq in range(200):
+            arrivals.setdefault(seq + (3 if seq % 5 == 0 else 0), []).append(seq)
+
+        late_by_tick, latency = [], []
+        for tick in range(200):
+            for seq in arrivals.get(tick, []):
+                jb.push(seq, seq * 160, tick * 0.02, seq)
+            item = jb.pop()
+            if isinstance(item, int):
+                latency.append(tick - item)
+            late_by_tick.append(jb.stats.late)
+
+        self.assertLess(latency[0], 3)
+        self.assertGreaterEqual(latency[-1], 3)  # playout moved back past the delayed packets
+        self.assertEqual(late_by_tick[100], late_by_tick[-1])  # so nothing arrives late any more
+        self.assertLess(jb.stats.depth, 6)
+
+    def test_duplicates_are_dropped(self):
+        jb = JitterBuffer(target_packets=1)
+        _feed(jb, [1, 1])
+        self.assertEqual(_drain(jb, 2), ["p1", None])
+        self.assertEqual(jb.stats.duplicate, 1)
+
+    def test_sequence_wraparound(self):
+        jb = JitterBuffer(target_packets=3)
+        _feed(jb, [65534, 0, 65535, 1])
+        self.assertEqual(_drain(jb, 4), ["p65534", "p65535", "p0", "p1"])
+
+    def test_quiet_sender_reprimes_instead_of_counting_loss(self):
+        jb = JitterBuffer(target_packets=2)
+        _feed(jb, [1, 2])
+        self.assertEqual(_drain(jb, 5), ["p1", "p2", None, None, None])
+        _feed(jb, [50, 51], start_time=1.0)
+        self.assertEqual(_drain(jb, 2), ["p50", "p51"])
+        self.assertEqual(jb.stats.lost, 0)
+
+    def test_burst_past_max_depth_skips_ahead(self):
+        jb = JitterBuffer(target_packets=2, max_packets=4)
+        _feed(jb, [1, 2])
+        self.assertEqual(jb.pop(), "p1")
+        _feed(jb, [3, 4, 5, 6])
+        # Seq 6 is max_packets ahead of the next slot: keep only the newest `depth`
+        # packets; stale audio is not played late.
+        self.assertEqual(_drain(jb, 2), ["p5", "p6"])
+        self.assertEqual(jb.stats.overflow, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,7 +24,6 @@ class FakeCallRecord:
         self.answered_at = answered_at
         self.recording_path = None
         self.recording_egress_id = "EG_test_123"
-        self.transcripts = []
         self.started_at = datetime.now(timezone.utc) - timedelta(minutes=1)
         self.ended_at = None
         self.call_duration_minutes = None
@@ -47,7 +46,8 @@ class FakeCallRecord:
                 "sip_status_text": self.sip_status_text,
                 "answered_at": self.answered_at.isoformat() if self.answered_at else None,
                 "recording_path": self.recording_path,
-                "transcripts": self.transcripts,
+                "transcript_count": 0,
+                "transcript_last_at": None,
                 "started_at": self.started_at.isoformat(),
                 "ended_at": self.ended_at.isoformat() if self.ended_at else None,
                 "call_duration_minutes": self.call_duration_minutes,
@@ -76,7 +76,18 @@ class FakeActivityLog:
         return None
 
 
+async def _no_transcript(self, room_name):
+    return
+    yield
+
+
 class TestLiveKitLifecycle(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Transcript lines are read from call_transcripts; none of these tests care about them.
+        patcher = patch.object(LiveKitService, "iter_transcript", _no_transcript)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_calculate_billable_duration_minutes_rounds_up_connected_calls(self):
         self.assertEqual(calculate_billable_duration_minutes("completed", 0.30), 1)
         self.assertEqual(calculate_billable_duration_minutes("completed", 1.25), 2)
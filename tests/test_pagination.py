@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+
+from src.api.pagination import cursor_filter, encode_cursor, next_cursor, page_meta
+
+T = datetime(2026, 3, 1, 12, 0, 0, 123000, tzinfo=timezone.utc)
+
+
+class TestKeysetPagination(unittest.TestCase):
+    def test_cursor_round_trips_to_a_range_after_the_last_row(self):
+        oid = PydanticObjectId()
+        token = encode_cursor("started_at", True, T, oid)
+        self.assertEqual(
+            cursor_filter(token, "started_at", descending=True),
+            {"$or": [{"started_at": {"$lt": T}}, {"started_at": T, "_id": {"$lt": oid}}]},
+        )
+        asc = encode_cursor("started_at", False, T, oid)
+        self.assertEqual(cursor_filter(asc, "started_at", descending=False)["$or"][0], {"started_at": {"$gt": T}})
+
+    def test_cursor_is_bound_to_its_sort(self):
+        token = encode_cursor("started_at", True, T, PydanticObjectId())
+        for field, descending in (("started_at", False), ("timestamp", True)):
+            with self.assertRaises(HTTPException) as ctx:
+                cursor_filter(token, field, descending)
+            self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_garbage_cursor_is_a_400(self):
+        for token in ("not-a-cursor", "", encode_cursor("started_at", True, T, "x")):
+            with self.assertRaises(HTTPException):
+                cursor_filter(token, "started_at", True)
+
+    def test_next_cursor_only_when_the_page_is_full(self):
+        rows = [SimpleNamespace(id=PydanticObjectId(), started_at=T) for _ in range(3)]
+        self.assertIsNone(next_cursor(rows[:2], "started_at", True, limit=3))
+        token = next_cursor(rows, "started_at", True, limit=3)
+        self.assertIn(str(rows[-1].id), str(cursor_filter(token, "started_at", True)))
+
+    def test_page_meta_keeps_offset_fields_only_for_offset_requests(self):
+        rows = [SimpleNamespace(id=PydanticObjectId(), started_at=T)]
+        offset = page_meta(rows, 1, total=3, page=1, keyset_field="started_at", descending=True)
+        self.assertEqual((offset["total"], offset["total_pages"]), (3, 3))
+        self.assertIsNotNone(offset["next_cursor"])
+
+        keyset = page_meta(rows, 1, total=None, page=1, keyset_field="started_at", descending=True)
+        self.assertEqual(set(keyset), {"limit", "next_cursor"})
+        unsorted = page_meta(rows, 1, total=3, page=1, keyset_field=None, descending=True)
+        self.assertIsNone(unsorted["next_cursor"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 from src.api.routes.admin import admin_calls_by_phone_number
 from src.api.routes.analytics import get_calls_by_phone_number
+from src.services.analytics import analytics_cache
 
 
 class _FakeCursor:
@@ -16,6 +17,9 @@ class _FakeCursor:
 
 
 class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        analytics_cache.clear()
+
     async def test_analytics_groups_by_platform_bucket_and_keeps_avg(self):
         captured = {}
         start_date = datetime(2026, 3, 1, tzinfo=timezone.utc)
@@ -35,7 +39,7 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
                 ]
             )
 
-        with patch("src.api.routes.analytics.CallRecord.aggregate", side_effect=fake_aggregate):
+        with patch("src.api.routes.analytics.CallDailyRollup.aggregate", side_effect=fake_aggregate):
             response = await get_calls_by_phone_number(
                 start_date=start_date,
                 end_date=end_date,
@@ -45,12 +49,16 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(response.data["phone_numbers"][0]["phone_number"], "WEB_CALL")
         pipeline = captured["pipeline"]
-        self.assertEqual(pipeline[0]["$match"]["created_by_email"], "user@example.com")
+        # Whole days from the rollups, the open-ended last day live from call_records.
+        self.assertEqual(pipeline[0]["$match"]["user_email"], "user@example.com")
         self.assertEqual(pipeline[0]["$match"]["assistant_id"], "assistant-1")
-        self.assertEqual(pipeline[0]["$match"]["started_at"]["$gte"], start_date)
-        self.assertEqual(pipeline[0]["$match"]["started_at"]["$lte"], end_date)
+        self.assertEqual(pipeline[0]["$match"]["day"], {"$gte": start_date, "$lt": end_date})
+        live_match = pipeline[1]["$unionWith"]["pipeline"][0]["$match"]
+        self.assertEqual(live_match["created_by_email"], "user@example.com")
+        self.assertEqual(live_match["assistant_id"], "assistant-1")
+        self.assertIn({"started_at": {"$gte": end_date, "$lte": end_date}}, live_match["$or"])
         self.assertEqual(
-            pipeline[1]["$group"]["_id"],
+            pipeline[2]["$group"]["_id"],
             {
                 "$cond": [
                     {"$or": [{"$eq": ["$call_type", "web"]}, {"$eq": ["$call_service", "web"]}]},
@@ -59,8 +67,8 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
                 ]
             },
         )
-        self.assertEqual(pipeline[2], {"$sort": {"total_duration_minutes": -1}})
-        self.assertIn("avg_duration_minutes", pipeline[3]["$project"])
+        self.assertEqual(pipeline[3], {"$sort": {"total_duration_minutes": -1}})
+        self.assertIn("avg_duration_minutes", pipeline[4]["$project"])
 
     async def test_admin_groups_by_platform_bucket(self):
         captured = {}
@@ -80,7 +88,7 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
                 ]
             )
 
-        with patch("src.api.routes.admin.CallRecord.aggregate", side_effect=fake_aggregate):
+        with patch("src.api.routes.admin.CallDailyRollup.aggregate", side_effect=fake_aggregate):
             response = await admin_calls_by_phone_number(
                 start_date=start_date,
                 end_date=end_date,
@@ -90,11 +98,12 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(response.data["phone_numbers"][0]["phone_number"], "UNKNOWN_PLATFORM")
         pipeline = captured["pipeline"]
-        self.assertEqual(pipeline[0]["$match"]["created_by_email"], "alice@example.com")
-        self.assertEqual(pipeline[0]["$match"]["started_at"]["$gte"], start_date)
-        self.assertEqual(pipeline[0]["$match"]["started_at"]["$lte"], end_date)
+        self.assertEqual(pipeline[0]["$match"]["user_email"], "alice@example.com")
+        self.assertEqual(pipeline[0]["$match"]["day"], {"$gte": start_date, "$lt": end_date})
+        live_match = pipeline[1]["$unionWith"]["pipeline"][0]["$match"]
+        self.assertEqual(live_match["created_by_email"], "alice@example.com")
         self.assertEqual(
-            pipeline[1]["$group"]["_id"],
+            pipeline[2]["$group"]["_id"],
             {
                 "$cond": [
                     {"$or": [{"$eq": ["$call_type", "web"]}, {"$eq": ["$call_service", "web"]}]},
@@ -103,8 +112,8 @@ class TestPhoneNumberPlatformGrouping(unittest.IsolatedAsyncioTestCase):
                 ]
             },
         )
-        self.assertEqual(pipeline[2], {"$sort": {"total_duration_minutes": -1}})
-        self.assertNotIn("avg_duration_minutes", pipeline[3]["$project"])
+        self.assertEqual(pipeline[3], {"$sort": {"total_duration_minutes": -1}})
+        self.assertNotIn("avg_duration_minutes", pipeline[4]["$project"])
 
 
 if __name__ == "__main__":
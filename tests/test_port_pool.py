@@ -0,0 +1,123 @@
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.services.exotel.custom_sip_reach import port_pool
+from src.services.exotel.custom_sip_reach.port_pool import PortPool
+
+
+class _FakeClock(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        for name in ("monotonic", "time"):
+            patcher = patch.object(port_pool.time, name, side_effect=lambda: self.now)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _lock_dir(self) -> str:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        return tmp.name
+
+
+class TestPortPool(_FakeClock):
+    def test_lowest_free_port_first_and_rtcp_gap(self):
+        pool = PortPool(20000, 20010)
+        self.assertEqual([pool.acquire() for _ in range(3)], [20000, 20002, 20004])
+        pool.release(20002)
+        self.now += PortPool.COOLDOWN_SECONDS
+        self.assertEqual(pool.acquire(), 20002)
+
+    def test_released_port_cools_down_before_reuse(self):
+        pool = PortPool(20000, 20004)
+        a, b = pool.acquire(), pool.acquire()
+        pool.release(a)
+        self.now += 1
+        pool.release(b)
+        self.assertEqual(pool.stats(), {"free": 0, "cooling": 2, "in_use": 0, "other_process": 0})
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+        # a's cooldown ends first even though b is no lower — FIFO order, not port order.
+        self.now += PortPool.COOLDOWN_SECONDS - 1
+        self.assertEqual(pool.stats(), {"free": 1, "cooling": 1, "in_use": 0, "other_process": 0})
+        self.assertEqual(pool.acquire(), a)
+
+    def test_release_is_idempotent(self):
+        pool = PortPool(20000, 20004)
+        port = pool.acquire()
+        pool.release(port)
+        pool.release(port)
+        pool.release(30000)  # never handed out
+        self.now += PortPool.COOLDOWN_SECONDS
+        self.assertEqual(pool.stats(), {"free": 2, "cooling": 0, "in_use": 0, "other_process": 0})
+        self.assertEqual({pool.acquire(), pool.acquire()}, {20000, 20002})
+
+    def test_gauges_add_up_to_pool_size(self):
+        pool = PortPool(20000, 20200)
+        held = [pool.acquire() for _ in range(40)]
+        for port in held[:15]:
+            pool.release(port)
+        stats = pool.stats()
+        self.assertEqual(stats, {"free": 60, "cooling": 15, "in_use": 25, "other_process": 0})
+        self.assertEqual(sum(stats.values()), 100)
+
+
+@unittest.skipIf(port_pool.fcntl is None, "flock leases need fcntl")
+class TestSharedPortPool(_FakeClock):
+    """Two pools on one lease directory stand in for two processes: flock is held per
+    open file, so they exclude each other exactly as separate processes would."""
+
+    def _pools(self, start=20000, end=20006):
+        lock_dir = self._lock_dir()
+        return PortPool(start, end, lock_dir=lock_dir), PortPool(start, end, lock_dir=lock_dir)
+
+    def test_ports_are_exclusive_across_pools(self):
+        a, b = self._pools()
+        self.assertEqual(a.acquire(), 20000)
+        self.assertEqual(b.acquire(), 20002)
+        self.assertEqual(a.acquire(), 20004)
+        with self.assertRaises(RuntimeError):
+            b.acquire()
+        self.assertEqual(b.stats()["other_process"], 2)
+
+    def test_cooldown_is_honoured_across_pools(self):
+        a, b = self._pools()
+        a.release(a.acquire())
+        self.assertEqual(b.acquire(), 20002)  # 20000 is cooling in a's lease file
+
+        self.now += PortPool.COOLDOWN_SECONDS
+        self.assertEqual(b.acquire(), 20000)
+
+    def test_killed_holder_port_is_reclaimed(self):
+        lock_dir = self._lock_dir()
+        child = subprocess.Popen(
+            [sys.executable, "-c", (
+                "import sys, time\n"
+                "from src.services.exotel.custom_sip_reach.port_pool import PortPool\n"
+                f"print(PortPool(20000, 20002, lock_dir={lock_dir!r}).acquire(), flush=True)\n"
+                "time.sleep(60)\n"
+            )],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.addCleanup(child.wait)
+        self.addCleanup(child.kill)
+        self.assertEqual(child.stdout.readline().strip(), "20000")
+
+        pool = PortPool(20000, 20002, lock_dir=lock_dir)
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+        child.send_signal(signal.SIGKILL)
+        child.wait()
+        self.now += PortPool.COOLDOWN_SECONDS  # local recheck delay for a port seen held
+        self.assertEqual(pool.acquire(), 20000)
+
+
+if __name__ == "__main__":
+    unittest.main()
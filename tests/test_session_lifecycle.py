@@ -1,8 +1,8 @@
 import unittest
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
-from src.core.agents.session_lifecycle import CallReadinessGate, RecordingManager
+from src.core.agents.session_lifecycle import CallReadinessGate, RecordingManager, StartupTimer, TranscriptWriter
 
 
 class TestCallReadinessGate(unittest.IsolatedAsyncioTestCase):
@@ -75,5 +75,88 @@ class TestRecordingManager(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(ok)
 
 
+
+class TestTranscriptWriter(unittest.IsolatedAsyncioTestCase):
+    def _writer(self, **kwargs) -> tuple[TranscriptWriter, list[list[str]]]:
+        batches: list[list[str]] = []
+
+        async def write(entries):
+            batches.append([e["text"] for e in entries])
+
+        writer = TranscriptWriter(write, **kwargs)
+        writer.start()
+        return writer, batches
+
+    async def test_lines_within_delay_share_one_write(self):
+        writer, batches = self._writer(max_delay=0.05)
+        for text in ("a", "b", "c"):
+            writer.add("user", text, None)
+        await asyncio.sleep(0.15)
+        self.assertEqual(batches, [["a", "b", "c"]])
+        await writer.close(timeout=1.0)
+
+    async def test_full_batch_flushes_without_waiting_for_delay(self):
+        writer, batches = self._writer(max_batch=2, max_delay=10.0)
+        writer.add("user", "a", None)
+        writer.add("assistant", "b", None)
+        await asyncio.sleep(0.05)
+        self.assertEqual(batches, [["a", "b"]])
+        await writer.close(timeout=1.0)
+
+    async def test_close_flushes_pending_and_rejects_later_lines(self):
+        writer, batches = self._writer(max_delay=10.0)
+        writer.add("user", "last words", None)
+        await writer.close(timeout=1.0)
+        self.assertEqual(batches, [["last words"]])
+        self.assertFalse(writer.add("user", "too late", None))
+
+    async def test_lines_arriving_during_a_slow_write_go_in_the_next_batch(self):
+        batches: list[list[str]] = []
+        release = asyncio.Event()
+
+        async def write(entries):
+            batches.append([e["text"] for e in entries])
+            await release.wait()
+
+        writer = TranscriptWriter(write, max_delay=0.01)
+        writer.start()
+        writer.add("user", "a", None)
+        await asyncio.sleep(0.05)
+        writer.add("user", "b", None)
+        writer.add("user", "c", None)
+        release.set()
+        await writer.close(timeout=1.0)
+        self.assertEqual(batches, [["a"], ["b", "c"]])
+
+    async def test_buffer_bound_drops_and_failed_write_does_not_stop_writer(self):
+        write = AsyncMock(side_effect=[RuntimeError("mongo down"), None])
+        writer = TranscriptWriter(write, max_delay=0.01, max_pending=1)
+        writer.start()
+        self.assertTrue(writer.add("user", "a", None))
+        self.assertFalse(writer.add("user", "b", None))
+        await asyncio.sleep(0.05)
+        writer.add("user", "c", None)
+        await writer.close(timeout=1.0)
+        self.assertEqual(write.await_count, 2)
+        self.assertEqual(write.await_args.args[0][0]["text"], "c")
+
+
+
+class TestStartupTimer(unittest.TestCase):
+    def test_logs_first_marks_once(self):
+        clock = iter([10.0, 10.05, 10.2, 10.3, 10.9])
+        with patch("src.core.agents.session_lifecycle.time.perf_counter", lambda: next(clock)), patch(
+            "src.core.agents.session_lifecycle.logger"
+        ) as log:
+            timer = StartupTimer(prewarmed=True)
+            timer.mark("db")
+            timer.mark("assistant")
+            timer.mark("db")  # a milestone keeps its first time
+            timer.finish()
+            timer.finish()
+
+        log.info.assert_called_once_with("Job startup | prewarmed=True | db=50ms assistant=200ms first_audio=900ms")
+
+
 if __name__ == "__main__":
     unittest.main()
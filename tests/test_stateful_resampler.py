@@ -4,6 +4,9 @@ import scipy.signal as sig
 import audioop
 
 from src.services.exotel.custom_sip_reach.rtp_bridge import (
+    _RESAMPLE_FILTER,
+    _InboundDSP,
+    _OutboundDSP,
     _decode_rtp_payload,
     RTPMediaBridge,
 )
@@ -114,5 +117,55 @@ class TestStatefulResampler(unittest.TestCase):
         self.assertEqual(len(state_2[1]), 20)
 
 
+class TestPreallocatedDSP(unittest.TestCase):
+    """The per-bridge DSP objects must reproduce the reference (allocating) paths."""
+
+    def _speech(self, n, rate, dc=0.0):
+        rng = np.random.default_rng(0)
+        t = np.arange(n) / rate
+        x = 0.3 * np.sin(2 * np.pi * 440 * t) + 0.05 * rng.standard_normal(n) + dc
+        return (x.clip(-1, 1) * 32767).astype(np.int16).tobytes()
+
+    def test_inbound_matches_reference_within_one_lsb(self):
+        for pt, encode in ((PCMA_PAYLOAD_TYPE, audioop.lin2alaw), (PCMU_PAYLOAD_TYPE, audioop.lin2ulaw)):
+            payload = encode(self._speech(16000, 8000, dc=0.1), 2)
+            dsp, state = _InboundDSP(), (None, None)
+            for i in range(0, len(payload), 160):
+                ref, state = _decode_rtp_payload(payload[i:i + 160], pt, state)
+                got = dsp.process(payload[i:i + 160], pt)
+                diff = np.abs(
+                    np.frombuffer(ref, np.int16).astype(int) - np.frombuffer(got, np.int16)
+                )
+                self.assertLessEqual(diff.max(), 1, f"pt={pt} packet={i // 160}")
+
+    def test_inbound_odd_packet_size_keeps_state(self):
+        payload = audioop.lin2alaw(self._speech(800, 8000), 2)
+        dsp, state = _InboundDSP(), (None, None)
+        for chunk in (payload[:160], payload[160:400], payload[400:560]):
+            ref, state = _decode_rtp_payload(chunk, PCMA_PAYLOAD_TYPE, state)
+            got = dsp.process(chunk, PCMA_PAYLOAD_TYPE)
+            self.assertEqual(len(got), len(ref))
+            diff = np.abs(np.frombuffer(ref, np.int16).astype(int) - np.frombuffer(got, np.int16))
+            self.assertLessEqual(diff.max(), 1)
+
+    def test_inbound_ignores_non_g711(self):
+        self.assertEqual(_InboundDSP().process(b"\x00" * 4, 101), b"")
+
+    def test_outbound_matches_reference(self):
+        pcm48 = self._speech(4800, 48000)
+        dsp, history = _OutboundDSP(), np.zeros(120, dtype=np.float32)
+        for i in range(0, len(pcm48), 960):
+            frame = pcm48[i:i + 960]
+            x = np.tanh(np.frombuffer(frame, np.int16).astype(np.float32) / 32768.0 * 0.7)
+            full = np.concatenate([history, x])
+            history = full[-120:]
+            ref = (sig.resample_poly(full, 1, 6, window=_RESAMPLE_FILTER)[10:90] * 32767.0).astype(np.int16)
+            got = dsp.process(frame)
+            self.assertLessEqual(np.abs(ref.astype(int) - got).max(), 1)
+
+            self.assertEqual(_OutboundDSP.encode(got, PCMA_PAYLOAD_TYPE), audioop.lin2alaw(got.tobytes(), 2))
+            self.assertEqual(_OutboundDSP.encode(got, PCMU_PAYLOAD_TYPE), audioop.lin2ulaw(got.tobytes(), 2))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,11 +4,16 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest import mock
 
+import numpy as np
 from livekit.agents import stt as stt_pkg
 
+from src.core.agents.audio_denoise import SpeechGate
+from livekit import rtc
+
 from src.core.agents.stt.sarvam_parallel import (
     DRAIN_SILENCE_S,
     FinalCoalescer,
+    SilenceSuppressor,
     run_sarvam_parallel_stt,
 )
 
@@ -179,5 +184,87 @@ class TestSarvamDrain(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(stream.frames_at_end_input, stream.frames_needed)
 
 
+    async def test_shared_gate_feeds_the_stream_until_stop(self):
+        """With the session's gate passed in, the tap subscribes to it rather than opening
+        a second AudioStream, and lets go before the drain silence goes in."""
+        coalescer = FinalCoalescer(lambda text, ts: None, window=0.01)
+        stop = asyncio.Event()
+        stream = _FakeStream(frames_needed=1)
+        gate = SpeechGate()
+
+        with mock.patch(
+            "src.core.agents.stt.sarvam_parallel.sarvam_plugin.STT",
+            return_value=SimpleNamespace(stream=lambda: stream),
+        ):
+            task = asyncio.create_task(
+                run_sarvam_parallel_stt(
+                    room=_FakeRoom(),
+                    target_identity="caller",
+                    coalescer=coalescer,
+                    stop_event=stop,
+                    api_key="test",
+                    speech_gate=gate,
+                )
+            )
+            await asyncio.sleep(0)
+            gate._publish(np.zeros(320, dtype=np.int16), True)
+            self.assertEqual(stream.frames, 1)
+
+            stop.set()
+            await asyncio.wait_for(task, timeout=2.0)
+            drained = stream.frames
+            gate._publish(np.zeros(320, dtype=np.int16), True)
+
+        self.assertEqual(drained, 1 + int(DRAIN_SILENCE_S / 0.02))
+        self.assertEqual(stream.frames, drained, "no frame may follow the drain")
+
+
+def _frame() -> rtc.AudioFrame:
+    """50 ms at 16 kHz mono, as the gate hands it to subscribers."""
+    return rtc.AudioFrame(b"\x00" * 1600, sample_rate=16000, num_channels=1, samples_per_channel=800)
+
+
+class TestSilenceSuppressor(unittest.TestCase):
+    """The tap used to stream every gated frame to Sarvam. Held-back silence must not cost a
+    transcript: speech always goes, and Sarvam still gets enough silence to endpoint."""
+
+    def _feed(self, suppressor: SilenceSuppressor, pattern: list[bool]) -> list[list]:
+        return [suppressor.feed(_frame(), open_) for open_ in pattern]
+
+    def test_long_silence_sends_only_keepalives(self):
+        s = SilenceSuppressor(pre_roll=0.2, trailing=0.5, keepalive=1.0)
+        sent = self._feed(s, [False] * 200)  # 10 s of a listening caller
+
+        self.assertEqual(sum(len(out) for out in sent), 10)  # one per second
+        self.assertAlmostEqual(s.skipped_seconds, 10.0 - 10 * 0.05)
+        self.assertEqual(s.skipped_bytes, 190 * 1600)
+
+    def test_speech_goes_with_pre_roll_then_trailing_silence(self):
+        s = SilenceSuppressor(pre_roll=0.2, trailing=0.5, keepalive=1.0)
+        self._feed(s, [False] * 10)
+        onset = s.feed(_frame(), True)
+        after = self._feed(s, [False] * 15)
+
+        self.assertEqual(len(onset), 5)  # 4 held frames (200 ms) + the speech frame
+        self.assertEqual([len(out) for out in after], [1] * 10 + [0] * 5)
+
+    def test_pause_shorter_than_trailing_reaches_sarvam_unchanged(self):
+        s = SilenceSuppressor(pre_roll=0.2, trailing=0.5, keepalive=1.0)
+        pattern = [True] * 5 + [False] * 8 + [True] * 5
+
+        sent = self._feed(s, pattern)
+
+        self.assertTrue(all(len(out) == 1 for out in sent))
+        self.assertEqual(s.skipped_seconds, 0.0)
+
+    def test_sent_and_skipped_cover_every_frame(self):
+        s = SilenceSuppressor()
+        pattern = ([False] * 37 + [True] * 11) * 9
+        sent = sum(len(out) for out in self._feed(s, pattern))
+
+        self.assertAlmostEqual(sent * 0.05 + s.skipped_seconds, len(pattern) * 0.05)
+        self.assertEqual(sent * 1600 + s.skipped_bytes, len(pattern) * 1600)
+
+
 if __name__ == "__main__":
     unittest.main()